@@ -4,18 +4,28 @@ API 接口路由
 提供翻译、抓取、清理、调度器等 RESTful 接口
 """
 import asyncio
+import uuid
 
 from flask import Blueprint, request, jsonify
 
+from src.fetchers.pipeline import FetchPipeline
 from src.storage.database import db
-from src.storage.models import NewsArticle
+from src.storage.http_cache import http_cache
+from src.storage.seen_index import seen_index
 from src.translators import translator_manager
 from src.utils.logger import logger
 from src.utils.translation_helper import translate_article as _do_translate
-from src.utils import news_processor
+from src.utils.translation_jobs import is_translated, translation_workers
+from src.utils.story_clusterer import StoryClusterer
 
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
+# 跨源报道聚类（保留近期文章向量缓存）
+story_clusterer = StoryClusterer(db)
+
+# 抓取流水线（与定时任务共用同一套处理流程）
+fetch_pipeline = FetchPipeline(db, story_clusterer)
+
 
 # ==================== 翻译接口 ====================
 
@@ -28,7 +38,7 @@ def translate_article(article_id):
             return jsonify({'success': False, 'error': '新闻不存在'}), 404
 
         # 已有完整翻译则直接返回
-        if article.title_zh and article.title_en and article.content_zh and article.content_en:
+        if is_translated(article):
             return jsonify({
                 'success': True,
                 'title_zh': article.title_zh, 'title_en': article.title_en,
@@ -36,9 +46,22 @@ def translate_article(article_id):
                 'message': '已有翻译',
             })
 
+        # 通过翻译队列领取，避免与后台工作线程重复翻译同一篇
+        owner = f"api-{uuid.uuid4().hex[:8]}"
+        if not db.translation_queue.claim(article_id, owner):
+            return jsonify({'success': False, 'error': '该新闻正在后台翻译，请稍后刷新'}), 409
+
         logger.info(f"开始翻译新闻: {article.title[:50]}")
-        _do_translate(article, translator_manager)
-        db.save_article(article)
+        try:
+            _do_translate(article, translator_manager)
+            db.save_article(article)
+        except Exception as e:
+            db.translation_queue.retry(article_id, owner, str(e))
+            raise
+        if is_translated(article):
+            db.translation_queue.complete([article_id], owner)
+        else:
+            db.translation_queue.retry(article_id, owner, '翻译结果为空')
         logger.info(f"翻译完成: {article.title[:50]}")
 
         return jsonify({
@@ -62,34 +85,34 @@ def translate_current_page():
         if not article_ids:
             return jsonify({'success': False, 'error': '没有提供新闻 ID'})
 
-        translated_count = 0
+        pending = []
         skipped_count = 0
 
         for article_id in article_ids:
-            try:
-                article = db.get_article_by_id(article_id)
-                if not article:
-                    continue
-
-                if article.title_zh and article.title_en and article.content_zh and article.content_en:
-                    skipped_count += 1
-                    continue
-
-                _do_translate(article, translator_manager)
-                db.save_article(article)
-                translated_count += 1
-                logger.info(f"翻译完成: {article.title[:50]}")
-            except Exception as e:
-                logger.error(f"翻译新闻失败 {article_id}: {e}")
+            article = db.get_article_by_id(article_id)
+            if not article:
                 continue
+            if is_translated(article):
+                skipped_count += 1
+                continue
+            pending.append(article)
 
-        message = f'成功翻译 {translated_count} 条新闻'
+        if not pending:
+            return jsonify({
+                'success': True, 'job_id': None, 'translated': 0, 'skipped': skipped_count,
+                'total': len(article_ids), 'message': '当前页没有需要翻译的新闻',
+            })
+
+        # 加入翻译队列，立即返回任务 ID，前端轮询 /api/translate-jobs/<job_id>
+        job = translation_workers.submit(pending)
+        message = f'已开始翻译 {len(pending)} 条新闻'
         if skipped_count > 0:
             message += f'，跳过 {skipped_count} 条已翻译的新闻'
 
         return jsonify({
             'success': True,
-            'translated': translated_count,
+            'job_id': job.id,
+            'pending': len(pending),
             'skipped': skipped_count,
             'total': len(article_ids),
             'message': message,
@@ -99,6 +122,53 @@ def translate_current_page():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@api_bp.route('/translate-jobs/<job_id>')
+def translate_job_status(job_id):
+    """查询后台翻译任务进度"""
+    job = translation_workers.get(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': '任务不存在'}), 404
+    return jsonify({'success': True, 'job': job.to_dict()})
+
+
+# ==================== 搜索接口 ====================
+
+@api_bp.route('/search')
+def search():
+    """全文搜索新闻"""
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return jsonify({'success': False, 'error': '请输入搜索关键词'}), 400
+
+        limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+        offset = max(request.args.get('offset', 0, type=int), 0)
+        source = request.args.get('source', '')
+
+        results = db.search_articles(query, limit=limit, offset=offset, source=source)
+        return jsonify({
+            'success': True,
+            'query': query,
+            'count': len(results),
+            'results': [
+                {
+                    'id': r['article'].id,
+                    'title': r['article'].title,
+                    'title_zh': r['article'].title_zh,
+                    'source': r['article'].source,
+                    'url': r['article'].url,
+                    'published_at': r['article'].published_at.isoformat(),
+                    'snippet': r['snippet'],
+                    'score': r['score'],
+                }
+                for r in results
+            ],
+        })
+    except Exception as e:
+        logger.error(f"搜索失败: {e}", exc_info=True)
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 # ==================== 管理 API ====================
 
 @api_bp.route('/admin/fetch', methods=['POST'])
@@ -112,46 +182,23 @@ def admin_fetch():
             return jsonify({'success': False, 'error': '请选择新闻源'})
 
         from src.fetchers.registry import FETCHERS
-        total_articles = 0
-
+        fetchers = []
         for source in sources:
             if source not in FETCHERS:
                 continue
-
             try:
-                fetcher = FETCHERS[source]()
-                fetch_result = fetcher.fetch()
-
-                # 兼容协程返回
-                if asyncio.iscoroutine(fetch_result):
-                    articles = asyncio.run(fetch_result)
-                else:
-                    articles = fetch_result
-
-                # 使用 from_dict 统一转换
-                article_objects = []
-                for item in articles:
-                    if isinstance(item, NewsArticle):
-                        article_objects.append(item)
-                        continue
-
-                    article_dict = fetcher.normalize_article(item)
-                    if fetcher.validate_article(article_dict):
-                        article_objects.append(NewsArticle.from_dict(article_dict, fetcher))
-
-                # 处理新闻（清洗和相似度判断）
-                processed_articles = news_processor.process_articles(article_objects)
-                count = db.save_articles(processed_articles)
-                total_articles += count
-                logger.info(f"{source} 抓取完成: {count} 条")
+                fetchers.append(FETCHERS[source]())
             except Exception as e:
-                logger.error(f"{source} 抓取失败: {e}")
-                continue
+                logger.error(f"{source} 抓取器初始化失败: {e}")
+
+        # 各新闻源并发抓取，边抓取边分批入库
+        result = asyncio.run(fetch_pipeline.run(fetchers))
 
         return jsonify({
             'success': True,
-            'message': f'成功抓取 {total_articles} 条新闻',
-            'total': total_articles,
+            'message': f'成功抓取 {result.saved} 条新闻',
+            'total': result.saved,
+            'sources': [metrics.to_dict() for metrics in result.sources.values()],
         })
     except Exception as e:
         logger.error(f"抓取失败: {e}", exc_info=True)
@@ -169,21 +216,12 @@ def admin_translate_all():
         if not articles:
             return jsonify({'success': True, 'translated': 0, 'message': '没有需要翻译的新闻'})
 
-        translated_count = 0
-        for article in articles:
-            try:
-                _do_translate(article, translator_manager)
-                db.save_article(article)
-                translated_count += 1
-            except Exception as e:
-                logger.error(f"翻译新闻失败 {article.id}: {e}")
-                continue
-
+        job = translation_workers.submit(articles)
         return jsonify({
             'success': True,
-            'translated': translated_count,
+            'job_id': job.id,
             'total': len(articles),
-            'message': f'成功翻译 {translated_count}/{len(articles)} 条新闻',
+            'message': f'已开始翻译 {len(articles)} 条新闻',
         })
     except Exception as e:
         logger.error(f"批量翻译失败: {e}", exc_info=True)
@@ -195,6 +233,8 @@ def admin_clean():
     """清理新闻"""
     try:
         deleted = db.delete_all_articles()
+        http_cache.clear()
+        seen_index.clear()
         message = f'成功清理所有 {deleted} 条新闻'
         return jsonify({'success': True, 'deleted': deleted, 'message': message})
     except Exception as e:
@@ -248,3 +288,17 @@ def admin_stats():
     except Exception as e:
         logger.error(f"获取统计失败: {e}", exc_info=True)
         return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@api_bp.route('/admin/translators')
+def admin_translators():
+    """获取翻译器健康状态（按当前选择顺序排列）与翻译队列统计"""
+    try:
+        return jsonify({
+            'success': True,
+            'translators': translator_manager.health_snapshot(),
+            'queue': db.translation_queue.stats(),
+        })
+    except Exception as e:
+        logger.error(f"获取翻译器状态失败: {e}", exc_info=True)
+        return jsonify({'success': False, 'error': str(e)}), 500
@@ -5,42 +5,85 @@
 """
 from datetime import datetime
 
-from flask import Blueprint, render_template, request
+from flask import Blueprint, jsonify, render_template, request
 
-from src.storage.database import db
+from src.storage.database import LIST_COLUMNS, db
 from src.utils.logger import logger
+from src.utils.render_cache import render_cache
 
 frontend_bp = Blueprint('frontend', __name__)
 
-# 每页显示的新闻数量
+# 首页每个媒体展示的新闻数量（也是每次加载更多的数量）
+HOME_PER_SOURCE = 10
+
+# 首页只展示标题
+HOME_COLUMNS = ('title',)
+
+
 @frontend_bp.route('/')
 def index():
-    """首页 - 按媒体分类展示当天新闻"""
-    articles = db.get_articles()
-    logger.info(f"首页获取到 {len(articles)} 条新闻")
+    """首页 - 按媒体分类展示当天新闻（同一报道只展示一篇）"""
+    today_date = datetime.now().strftime('%Y-%m-%d')
+    # 数据未变化时直接返回缓存的页面，抓取写入后自动重新渲染
+    version = db.get_write_version()
+    return render_cache.get_or_build(('index', today_date), version, lambda: _render_index(today_date))
 
-    # 按媒体名称分组并排序
-    media_news = {}
-    for article in articles:
-        media_news.setdefault(article.source, []).append(article)
-    media_news = dict(sorted(media_news.items()))
 
+def _render_index(today_date: str) -> str:
+    """渲染首页（每个媒体只取前几条，其余通过加载更多获取）"""
+    media_news = db.get_top_articles_per_source(
+        HOME_PER_SOURCE, one_per_story=True, columns=HOME_COLUMNS,
+    )
     logger.info(f"媒体列表: {list(media_news.keys())}")
-    today_date = datetime.now().strftime('%Y-%m-%d')
 
     return render_template('index.html', media_news=media_news, today_date=today_date)
 
 
+@frontend_bp.route('/media/<path:source>/more')
+def media_more(source):
+    """首页加载某个媒体的更多新闻（返回 HTML 片段和下一页游标）"""
+    after = request.args.get('after', '')
+    start = max(request.args.get('start', 0, type=int), 0)
+    if after and db._decode_cursor(after) is None:
+        return jsonify({'success': False, 'error': '无效的分页游标'}), 400
+
+    def build():
+        articles, _, next_cursor = db.get_articles_page(
+            HOME_PER_SOURCE, after=after, source=source, one_per_story=True,
+            columns=HOME_COLUMNS,
+        )
+        return {
+            'html': render_template('_media_items.html', articles=articles, start=start),
+            'next_cursor': next_cursor,
+            'start': start + len(articles),
+        }
+
+    # 只缓存首页按钮发出的第一次加载更多，更深的分页参数由客户端任意构造，
+    # 缓存它们只会挤掉首页条目；没有文章的结果（如不存在的媒体）同样不缓存
+    if start > HOME_PER_SOURCE:
+        return jsonify(build())
+    key = ('media_more', source, after, start)
+    version = db.get_write_version()
+    data = render_cache.get(key, version)
+    if data is None:
+        data = build()
+        if data['start'] > start:
+            render_cache.set(key, version, data)
+    return jsonify(data)
+
+
 @frontend_bp.route('/list')
 def list_page():
-    """列表页 - 新闻列表"""
+    """列表页 - 新闻列表（游标分页，page 仅用于显示页码）"""
     page = request.args.get('page', 1, type=int)
+    after = request.args.get('after', '')
+    before = request.args.get('before', '')
     source = request.args.get('source', '')
     category = request.args.get('category', '')
     PER_PAGE = 50
-    articles = db.get_articles(
-        source=source, category=category,
-        limit=PER_PAGE, offset=(page - 1) * PER_PAGE,
+    articles, prev_cursor, next_cursor = db.get_articles_page(
+        PER_PAGE, after=after, before=before,
+        source=source, category=category, columns=LIST_COLUMNS,
     )
     total = db.count_articles(
         source=source, category=category,
@@ -53,6 +96,8 @@ def list_page():
         page=page,
         total_pages=total_pages,
         total=total,
+        prev_cursor=prev_cursor,
+        next_cursor=next_cursor,
         sources=db.get_all_sources(),
         categories=db.get_all_categories(),
         current_source=source,
@@ -7,6 +7,7 @@ from flask import Flask
 
 from routes import register_blueprints
 from src.utils.logger import logger
+from src.utils.translation_jobs import translation_workers
 
 
 def create_app() -> Flask:
@@ -25,4 +26,6 @@ if __name__ == '__main__':
     args = parser.parse_args()
 
     logger.info(f"启动新闻 Web 应用... 端口: {args.port}")
+    # 消费翻译队列（新入库的文章、网页提交的批量翻译）
+    translation_workers.start()
     app.run(host='0.0.0.0', port=args.port, debug=True)
@@ -14,6 +14,9 @@ from src.storage.models import NewsArticle
 from src.utils.logger import logger
 from skills.utils.skill_helpers import classify_news, generate_summary, format_analysis_result
 
+# 分类、摘要和输出用到的列
+ANALYSIS_COLUMNS = ('title', 'title_zh', 'url', 'content', 'content_zh')
+
 
 def analyze_news(category: Optional[str] = None) -> Dict[str, List[Dict]]:
     """
@@ -34,8 +37,8 @@ def analyze_news(category: Optional[str] = None) -> Dict[str, List[Dict]]:
         from skills.news_fetcher_skill import fetch_news
         fetch_news()
     
-    # 从数据库获取新闻
-    articles = db.get_articles()
+    # 从数据库获取新闻（同一报道只分析一篇，只读取分析用到的列）
+    articles = db.get_articles(one_per_story=True, columns=ANALYSIS_COLUMNS)
     logger.info(f"获取到 {len(articles)} 篇新闻进行分析")
     
     # 分类和分析
@@ -5,10 +5,12 @@
 用于抓取所有新闻源的新闻，支持命令行调用
 """
 import argparse
+import asyncio
 import json
 from datetime import datetime, timedelta
 from typing import List, Optional
 
+from src.fetchers.pipeline import FetchPipeline
 from src.fetchers.registry import FETCHERS
 from src.storage.database import db
 from src.storage.models import NewsArticle
@@ -17,16 +19,14 @@ from src.utils.logger import logger
 
 def fetch_news(sources: Optional[List[str]] = None) -> List[NewsArticle]:
     """
-    抓取新闻
+    抓取新闻（各新闻源并发抓取，经流式流水线边抓取边分批入库）
     
     Args:
         sources: 新闻源列表，None表示所有新闻源
     
     Returns:
-        新闻列表
+        入库的新闻列表
     """
-    articles = []
-    
     # 获取要使用的抓取器
     if sources:
         # 验证指定的新闻源是否存在
@@ -42,28 +42,17 @@ def fetch_news(sources: Optional[List[str]] = None) -> List[NewsArticle]:
     
     logger.info(f"开始抓取 {len(fetchers_to_use)} 个新闻源的新闻")
     
-    # 抓取每个新闻源的新闻
+    fetchers = []
     for source_name, fetcher_class in fetchers_to_use.items():
         try:
-            logger.info(f"开始抓取 {source_name} 的新闻")
-            fetcher = fetcher_class()
-            fetched_articles = fetcher.run()
-            
-            # 转换为 NewsArticle 对象
-            for article_data in fetched_articles:
-                article = NewsArticle.from_dict(article_data, fetcher)
-                articles.append(article)
-            
-            logger.info(f"成功抓取 {source_name} 的 {len(fetched_articles)} 篇新闻")
+            fetchers.append(fetcher_class())
         except Exception as e:
-            logger.error(f"抓取 {source_name} 的新闻失败: {e}")
-    
-    # 保存到数据库
-    if articles:
-        saved_count = db.save_articles(articles)
-        logger.info(f"成功保存 {saved_count}/{len(articles)} 篇新闻到数据库")
+            logger.error(f"初始化 {source_name} 抓取器失败: {e}")
+
+    result = asyncio.run(FetchPipeline(db).run(fetchers, collect=True))
+    logger.info(f"成功保存 {result.saved}/{result.valid} 篇新闻到数据库")
     
-    return articles
+    return result.articles
 
 
 def format_output(articles: List[NewsArticle], output_format: str) -> str:
@@ -5,18 +5,33 @@
 """
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, List, Optional
-import time
+from typing import Dict, List, Optional, Tuple
+import asyncio
 
 import feedparser
-import requests
+import httpx
+
+from src.fetchers.engine import engine_scope
+from src.fetchers.parse_pool import parse_feed, run_parse
+from src.storage.http_cache import body_hash, http_cache
+from src.storage.seen_index import seen_index
 from src.utils.config import get_settings
 from src.utils.helpers import generate_id, is_valid_url, model_to_dict
 from src.utils.logger import logger
 
 
+def _article_url(article) -> str:
+    """获取字典或 NewsArticle 条目的 URL"""
+    if isinstance(article, dict):
+        return article.get('url', '')
+    return getattr(article, 'url', '')
+
+
 class BaseFetcher(ABC):
     """新闻抓取器基类"""
+
+    # 是否只输出新条目；按排名设置优先级的热榜需要每次全量刷新，应设为 False
+    INCREMENTAL = True
     
     def __init__(self, source_name: str, base_url: str, default_delay: float = 2.0, language: str = 'zh'):
         """
@@ -25,7 +40,7 @@ class BaseFetcher(ABC):
         Args:
             source_name: 新闻源名称
             base_url: 基础 URL
-            default_delay: 默认请求延迟（秒）
+            default_delay: 同一主机的请求间隔（秒）
             language: 媒体语言，默认为中文('zh')
         """
         self.source_name = source_name
@@ -33,75 +48,151 @@ class BaseFetcher(ABC):
         self.default_delay = default_delay
         self.language = language
         self.settings = get_settings()
-        self.session = self._create_session()
-        
-    def _create_session(self) -> requests.Session:
-        """创建 HTTP 会话"""
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': self.settings.user_agent
-        })
-        
-        # 设置代理
-        if self.settings.http_proxy or self.settings.https_proxy:
-            session.proxies = {
-                'http': self.settings.http_proxy,
-                'https': self.settings.https_proxy
-            }
-        else:
-            # 显式设置为空字典，覆盖环境变量中的代理设置
-            session.proxies = {}
-        
-        return session
-    
-    def _make_request(self, url: str, method: str = 'GET', **kwargs) -> Optional[requests.Response]:
+        self.headers: Dict[str, str] = {'User-Agent': self.settings.user_agent}
+        self.cookies: Dict[str, str] = {}
+        self.http_cache = http_cache
+        self.seen_index = seen_index
+        # 本次抓取得到的校验信息: URL -> (ETag, Last-Modified, 响应体哈希)，入库成功后才写入缓存
+        self._pending_validators: Dict[str, Tuple[Optional[str], Optional[str], str]] = {}
+
+    def _build_headers(self, extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """合并默认请求头、Cookie 和单次请求头"""
+        headers = dict(self.headers)
+        if self.cookies:
+            headers['Cookie'] = '; '.join(f"{k}={v}" for k, v in self.cookies.items())
+        if extra:
+            headers.update(extra)
+        return headers
+
+    async def _send(self, url: str, method: str = 'GET', **kwargs) -> Optional[httpx.Response]:
         """
-        发起 HTTP 请求
-        
+        经由共享的异步抓取引擎发送请求
+
+        同一主机的请求间隔不少于 default_delay 秒，等待期间不阻塞其他主机的请求。
+
         Args:
             url: 请求 URL
             method: HTTP 方法
             **kwargs: 其他请求参数
-        
+
         Returns:
-            响应对象，失败则返回 None
+            响应对象（包括 304），失败则返回 None
         """
+        headers = self._build_headers(kwargs.pop('headers', None))
         try:
-            logger.debug(f"[{self.source_name}] 等待 {self.default_delay} 秒后请求: {url}")
-            time.sleep(self.default_delay)
-            
-            response = self.session.request(method, url, timeout=self.settings.request_timeout, **kwargs)
-            response.raise_for_status()
-            
+            async with engine_scope() as engine:
+                response = await engine.request(
+                    method, url, delay=self.default_delay, headers=headers, **kwargs
+                )
+
             logger.info(f"[{self.source_name}] 成功请求: {url}")
             return response
-            
-        except requests.RequestException as e:
+
+        except httpx.HTTPError as e:
             # 网络错误时记录详细日志
-            if isinstance(e, requests.exceptions.ConnectionError):
-                logger.warning(f"[{self.source_name}] 网络连接错误 ({url}): {e}")
-            elif isinstance(e, requests.exceptions.Timeout):
+            if isinstance(e, httpx.TimeoutException):
                 logger.warning(f"[{self.source_name}] 请求超时 ({url}): {e}")
+            elif isinstance(e, httpx.NetworkError):
+                logger.warning(f"[{self.source_name}] 网络连接错误 ({url}): {e}")
             else:
                 logger.error(f"[{self.source_name}] 请求失败 ({url}): {e}")
             return None
-    
-    def _parse_feed(self, feed_url: str):
+
+    async def _fetch_if_modified(self, url: str, **kwargs) -> Tuple[Optional[httpx.Response], bool]:
         """
-        解析 RSS 源，通过 session 获取内容
-        
+        发送条件请求（If-None-Match / If-Modified-Since）
+
+        服务端返回 304，或响应体哈希与上次相同，都视为内容未变化。新的校验信息先暂存，
+        由 commit_validators 在内容成功入库后写入缓存。
+
+        Args:
+            url: 请求 URL
+            **kwargs: 其他请求参数
+
+        Returns:
+            (响应对象, 是否未变化)；未变化或请求失败时响应对象为 None
+        """
+        headers = self.http_cache.conditional_headers(url)
+        headers.update(kwargs.pop('headers', None) or {})
+
+        response = await self._send(url, headers=headers, **kwargs)
+        if response is None:
+            return None, False
+
+        if response.status_code == 304:
+            logger.info(f"[{self.source_name}] 内容未变化，跳过: {url}")
+            return None, True
+
+        digest = body_hash(response.content)
+        if self.http_cache.is_unchanged(url, digest):
+            logger.info(f"[{self.source_name}] 内容未变化，跳过: {url}")
+            return None, True
+
+        self._pending_validators[url] = (
+            response.headers.get('ETag'), response.headers.get('Last-Modified'), digest
+        )
+        return response, False
+
+    def discard_validator(self, url: str) -> None:
+        """丢弃暂存的校验信息（响应解析失败时调用，下次抓取重新解析）"""
+        self._pending_validators.pop(url, None)
+
+    def commit_validators(self) -> None:
+        """本次抓取的内容已全部入库，写入暂存的校验信息（之后内容未变化的请求会被跳过）"""
+        validators, self._pending_validators = self._pending_validators, {}
+        for url, (etag, last_modified, digest) in validators.items():
+            self.http_cache.update(url, etag, last_modified, digest)
+
+    async def _make_request(
+        self, url: str, method: str = 'GET', conditional: bool = False, **kwargs
+    ) -> Optional[httpx.Response]:
+        """
+        发起 HTTP 请求
+
+        Args:
+            url: 请求 URL
+            method: HTTP 方法
+            conditional: 是否使用条件请求缓存，内容未变化时同样返回 None
+            **kwargs: 其他请求参数
+
+        Returns:
+            响应对象，失败则返回 None
+        """
+        if conditional:
+            response, _ = await self._fetch_if_modified(url, **kwargs)
+            return response
+        return await self._send(url, method, **kwargs)
+
+    async def _parse_feed(self, feed_url: str):
+        """
+        解析 RSS 源，通过抓取引擎发送条件请求获取内容，原始字节交给解析进程池解析
+
         Args:
             feed_url: RSS 源 URL
-        
+
         Returns:
-            feedparser 解析后的 feed 对象，网络错误时返回空对象
+            feedparser 解析后的 feed 对象；内容未变化时返回 not_modified 为 True 的空对象，
+            网络错误时返回 bozo 空对象
         """
-        # 通过 session 获取内容
-        response = self._make_request(feed_url)
+        response, not_modified = await self._fetch_if_modified(feed_url)
+        if not_modified:
+            feed = feedparser.FeedParserDict()
+            feed.bozo = False
+            feed.not_modified = True
+            feed.entries = []
+            return feed
+
         if response is not None:
             try:
-                return feedparser.parse(response.content)
+                feed = await run_parse(parse_feed, response.content)
+                if self.INCREMENTAL:
+                    feed.entries = [
+                        entry for entry in feed.entries
+                        if not self.seen_index.contains(self.source_name, entry.get('link', ''))
+                    ]
+                return feed
             except Exception as e:
+                self.discard_validator(feed_url)
                 logger.error(f"[{self.source_name}] 解析 RSS 源失败: {e}")
 
         feed = feedparser.FeedParserDict()
@@ -109,7 +200,51 @@ class BaseFetcher(ABC):
         feed.bozo_exception = Exception(f"无法请求 RSS 源: {feed_url}")
         feed.entries = []
         return feed
-    
+
+    async def _parse_feeds(self, feeds: Dict[str, str]) -> List[Dict]:
+        """
+        并发抓取并解析多个 RSS 源
+
+        各源的请求仍经由抓取引擎按主机限速，解析后的 feed 逐个交给 parse(feed, category)。
+
+        Args:
+            feeds: 分类到 RSS 源 URL 的映射
+
+        Returns:
+            所有分类的新闻列表（按 feeds 的顺序拼接）
+        """
+        async def fetch_category(category: str, feed_url: str) -> List[Dict]:
+            try:
+                logger.info(f"[{self.source_name}] 抓取 {category} 分类...")
+                feed = await self._parse_feed(feed_url)
+                if feed.get('not_modified'):
+                    return []
+
+                if feed.bozo:
+                    logger.warning(
+                        f"[{self.source_name}] RSS 解析警告 ({category}): {feed.bozo_exception}"
+                    )
+
+                articles = self.parse(feed, category)
+                logger.info(
+                    f"[{self.source_name}] {category} 分类获取到 {len(articles)} 篇新闻"
+                )
+                return articles
+
+            except Exception as e:
+                logger.error(
+                    f"[{self.source_name}] 抓取 {category} 分类时出错: {e}",
+                    exc_info=True
+                )
+                return []
+
+        async with engine_scope():
+            results = await asyncio.gather(
+                *(fetch_category(category, url) for category, url in feeds.items())
+            )
+
+        return [article for articles in results for article in articles]
+
     @abstractmethod
     async def fetch(self) -> List[Dict]:
         """
@@ -133,6 +268,47 @@ class BaseFetcher(ABC):
         """
         pass
     
+    def drop_seen(self, articles: List) -> List:
+        """
+        丢弃已入库过的条目
+
+        Args:
+            articles: 新闻列表（字典或 NewsArticle）
+
+        Returns:
+            未见过的新闻列表
+        """
+        if not self.INCREMENTAL:
+            return articles
+        return [
+            article for article in articles
+            if not self.seen_index.contains(self.source_name, _article_url(article))
+        ]
+
+    def mark_seen(self, articles: List) -> None:
+        """
+        将已入库的条目记入已见索引
+
+        Args:
+            articles: 新闻列表（字典或 NewsArticle）
+        """
+        if self.INCREMENTAL:
+            self.seen_index.mark(self.source_name, (_article_url(article) for article in articles))
+
+    async def fetch_new(self) -> List:
+        """
+        抓取新闻并丢弃已见条目
+
+        Returns:
+            新条目列表
+        """
+        self._pending_validators = {}
+        fetch_result = self.fetch()
+        # 兼容同步实现的 fetch
+        if asyncio.iscoroutine(fetch_result):
+            fetch_result = await fetch_result
+        return self.drop_seen(fetch_result or [])
+
     def normalize_article(self, article: Dict) -> Dict:
         """
         标准化新闻数据格式
@@ -189,41 +365,18 @@ class BaseFetcher(ABC):
     
     def run(self) -> List[Dict]:
         """
-        运行抓取器
-        
+        运行抓取器：经由抓取流水线抓取、处理并入库
+
         Returns:
-            标准化后的新闻列表
+            入库的新闻列表
         """
-        import asyncio
-        
+        from src.fetchers.pipeline import FetchPipeline
+
         logger.info(f"[{self.source_name}] 开始抓取新闻...")
-        
+
         try:
-            # 抓取原始数据
-            fetch_result = self.fetch()
-            
-            # 检查是否是协程对象
-            if asyncio.iscoroutine(fetch_result):
-                raw_articles = asyncio.run(fetch_result)
-            else:
-                raw_articles = fetch_result
-            
-            if not raw_articles:
-                logger.warning(f"[{self.source_name}] 未抓取到任何新闻")
-                return []
-            
-            # 标准化和验证
-            valid_articles = []
-            for article in raw_articles:
-                article = self.normalize_article(article)
-                if self.validate_article(article):
-                    valid_articles.append(article)
-            
-            logger.info(
-                f"[{self.source_name}] 成功抓取 {len(valid_articles)}/{len(raw_articles)} 篇新闻"
-            )
-            return valid_articles
-            
+            result = asyncio.run(FetchPipeline().run([self], collect=True))
+            return [model_to_dict(article) for article in result.articles]
         except Exception as e:
             logger.error(f"[{self.source_name}] 抓取过程出错: {e}", exc_info=True)
             return []
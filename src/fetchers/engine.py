@@ -0,0 +1,147 @@
+"""
+异步抓取引擎
+
+基于 httpx.AsyncClient 的共享抓取引擎：全局并发上限 + 按主机的礼貌延迟，
+不同主机之间互不阻塞，一次完整抓取的耗时接近最慢的新闻源而不是所有源之和。
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from src.utils.config import get_settings
+
+# 当前上下文中的抓取引擎，由 FetchEngine 的 async with 设置
+_current_engine: ContextVar[Optional["FetchEngine"]] = ContextVar(
+    'current_fetch_engine', default=None
+)
+
+
+class FetchEngine:
+    """异步抓取引擎"""
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        初始化抓取引擎
+
+        Args:
+            max_concurrency: 全局并发请求上限，默认读取配置 FETCH_MAX_CONCURRENCY
+            transport: 自定义 httpx 传输层（主要用于测试）
+        """
+        self.settings = get_settings()
+        self.max_concurrency = max_concurrency or self.settings.fetch_max_concurrency
+        self._transport = transport
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        # 每个主机下一次允许发起请求的时间（time.monotonic）
+        self._host_next_slot: Dict[str, float] = {}
+        self._client: Optional[httpx.AsyncClient] = None
+        self._token = None
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """创建 HTTP 客户端（只使用配置中的代理，忽略环境变量）"""
+        mounts: Dict[str, httpx.AsyncBaseTransport] = {}
+        if self._transport is None:
+            if self.settings.http_proxy:
+                mounts['http://'] = httpx.AsyncHTTPTransport(proxy=self.settings.http_proxy)
+            if self.settings.https_proxy:
+                mounts['https://'] = httpx.AsyncHTTPTransport(proxy=self.settings.https_proxy)
+
+        return httpx.AsyncClient(
+            timeout=self.settings.request_timeout,
+            follow_redirects=True,
+            trust_env=False,
+            limits=httpx.Limits(max_connections=self.max_concurrency),
+            transport=self._transport,
+            mounts=mounts or None,
+        )
+
+    async def __aenter__(self) -> "FetchEngine":
+        self._client = self._create_client()
+        self._token = _current_engine.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        _current_engine.reset(self._token)
+        self._token = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _wait_for_host(self, host: str, delay: float) -> None:
+        """
+        为主机预约请求时间片
+
+        同一主机的相邻请求间隔不少于 delay 秒；预约本身不等待，
+        因此等待中的请求不会占用并发名额，也不会阻塞其他主机。
+
+        Args:
+            host: 主机名
+            delay: 礼貌延迟（秒）
+        """
+        now = time.monotonic()
+        slot = max(now, self._host_next_slot.get(host, now))
+        self._host_next_slot[host] = slot + delay
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        delay: float = 0.0,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        发起 HTTP 请求
+
+        Args:
+            method: HTTP 方法
+            url: 请求 URL
+            delay: 同一主机的礼貌延迟（秒）
+            **kwargs: 其他 httpx 请求参数
+
+        Returns:
+            响应对象
+
+        Raises:
+            httpx.HTTPError: 网络错误或非 2xx 状态码（304 除外，供条件请求使用）
+        """
+        if self._client is None:
+            raise RuntimeError("FetchEngine 未启动，请在 async with 中使用")
+
+        await self._wait_for_host(urlparse(url).netloc, delay)
+        async with self._semaphore:
+            response = await self._client.request(method, url, **kwargs)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+
+def current_engine() -> Optional[FetchEngine]:
+    """获取当前上下文中的抓取引擎"""
+    return _current_engine.get()
+
+
+@asynccontextmanager
+async def engine_scope() -> AsyncIterator[FetchEngine]:
+    """
+    复用当前上下文中的抓取引擎，没有时临时创建一个
+
+    Yields:
+        抓取引擎
+    """
+    engine = current_engine()
+    if engine is not None:
+        yield engine
+        return
+
+    async with FetchEngine() as engine:
+        yield engine
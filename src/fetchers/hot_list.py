@@ -0,0 +1,93 @@
+"""
+热榜页面提取模块
+
+中文热榜抓取器（百度、微博等）共用的轻量提取工具，在解析进程中运行：
+- 页面内嵌的 JSON 数据直接用正则截取后 json.loads，不建文档树
+- 需要读 HTML 结构时用 lxml + XPath 一次定位目标节点，不建 BeautifulSoup 对象
+"""
+import json
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import lxml.html
+
+# 备用方案中排除的导航链接文字
+NAV_KEYWORDS = ('首页', '登录', '注册', '搜索', '更多', '关于', '联系我们')
+
+
+def parse_html(html: bytes, encoding: str = 'utf-8') -> lxml.html.HtmlElement:
+    """
+    解析 HTML 页面
+
+    Args:
+        html: 页面原始字节
+        encoding: 页面编码（lxml 在没有 meta 声明时会按 latin-1 解码，需要显式指定）
+
+    Returns:
+        文档根节点
+    """
+    return lxml.html.document_fromstring(html, parser=lxml.html.HTMLParser(encoding=encoding))
+
+
+def text_of(element) -> str:
+    """节点的全部文本（去掉首尾空白）"""
+    return ''.join(element.itertext()).strip()
+
+
+def extract_comment_json(html: bytes, container_id: str) -> Optional[Dict]:
+    """
+    截取容器内 HTML 注释中的 JSON 数据（如百度热搜 <div id="sanRoot"><!--s-data:{...}-->）
+
+    Args:
+        html: 页面原始字节
+        container_id: 容器元素的 id
+
+    Returns:
+        解析后的 JSON，找不到或无法解析时返回 None
+    """
+    pattern = rb'id="' + re.escape(container_id.encode()) + rb'"[^>]*>\s*<!--(.*?)-->'
+    match = re.search(pattern, html, re.S)
+    if not match:
+        return None
+    comment = match.group(1)
+    start, end = comment.find(b'{'), comment.rfind(b'}') + 1
+    if start == -1 or end == 0:
+        return None
+    try:
+        data = json.loads(comment[start:end])
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def filter_links(
+    root: lxml.html.HtmlElement,
+    limit: int = 100,
+    exclude: Iterable[str] = NAV_KEYWORDS,
+    href_filter: Optional[Callable[[str], bool]] = None,
+) -> List[Tuple[str, str]]:
+    """
+    备用方案：从页面链接中过滤出可能的热榜条目
+
+    Args:
+        root: 文档根节点
+        limit: 最多检查的链接数
+        exclude: 文字中含有这些关键词的链接视为导航链接
+        href_filter: 额外的链接过滤条件
+
+    Returns:
+        去重后的 (标题, 链接) 列表
+    """
+    exclude = tuple(exclude)
+    items, seen_titles = [], set()
+    for link in root.xpath('//a')[:limit]:
+        text = text_of(link)
+        href = link.get('href', '')
+        # 过滤条件：文本长度合理、不是导航链接、不是重复的标题
+        if (4 < len(text) < 60 and text not in seen_titles
+                and not any(keyword in text for keyword in exclude)
+                and not href.startswith('javascript:')
+                and (href_filter is None or href_filter(href))):
+            seen_titles.add(text)
+            items.append((text, href))
+    return items
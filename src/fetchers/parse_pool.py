@@ -0,0 +1,107 @@
+"""
+解析进程池模块
+
+抓取分为两个阶段：网络阶段在事件循环中收取响应的原始字节，解析阶段（feedparser、
+HTML 解析等纯 CPU 工作）交给进程池，多核并行，也不会占用事件循环所在线程的 GIL。
+
+在进程池中运行的解析函数必须是模块级函数，参数和返回值都要能 pickle
+（原始字节进，字典、列表出）。PARSE_WORKERS=0 时在当前线程内直接解析。
+"""
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+import feedparser
+from bs4 import BeautifulSoup
+
+from src.utils.config import get_settings
+from src.utils.logger import logger
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _worker_count() -> int:
+    """解析进程数"""
+    workers = get_settings().parse_workers
+    if workers is None:
+        workers = min(4, os.cpu_count() or 1)
+    return max(workers, 0)
+
+
+def get_parse_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    获取全局解析进程池（首次使用时创建）
+
+    Returns:
+        进程池，PARSE_WORKERS=0 时返回 None
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            workers = _worker_count()
+            if workers == 0:
+                return None
+            # Web 进程中有多个线程，fork 出的子进程可能继承被持有的锁，使用 forkserver / spawn
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            logger.info(f"解析进程池已启动: {workers} 个进程")
+        return _pool
+
+
+def shutdown_parse_pool() -> None:
+    """关闭解析进程池"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_parse(func: Callable[..., Any], *args) -> Any:
+    """
+    在解析进程池中执行解析函数
+
+    进程池不可用（PARSE_WORKERS=0 或子进程异常退出）时在当前线程内执行。
+
+    Args:
+        func: 模块级解析函数
+        *args: 参数（原始字节等可 pickle 的数据）
+
+    Returns:
+        解析结果
+    """
+    pool = get_parse_pool()
+    if pool is None:
+        return func(*args)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        logger.warning("解析进程池异常退出，重建进程池并在当前线程内解析")
+        shutdown_parse_pool()
+        return func(*args)
+
+
+def parse_feed(content: bytes) -> feedparser.FeedParserDict:
+    """
+    解析 RSS / Atom 源（在解析进程中运行）
+
+    Args:
+        content: 响应原始字节
+
+    Returns:
+        feedparser 解析结果：条目的摘要另外提取纯文本存入 summary_text，
+        解析异常替换为可 pickle 的 Exception
+    """
+    feed = feedparser.parse(content)
+    for entry in feed.entries:
+        if 'summary' in entry:
+            entry['summary_text'] = BeautifulSoup(entry.summary, 'html.parser').get_text().strip()
+    if feed.get('bozo_exception') is not None:
+        feed['bozo_exception'] = Exception(str(feed['bozo_exception']))
+    return feed
@@ -0,0 +1,405 @@
+"""
+流式抓取流水线
+
+抓取 → 标准化与校验 → 去重 → 分批入库。各新闻源并发抓取，条目逐条写入队列；
+标准化、去重是串联的异步生成器；入库阶段攒批后按新闻源清洗、合并相似新闻，
+丢弃与该源近期已入库新闻重复的条目，再归入跨源报道聚类，整批写入。定时任务、管理后台、命令行 Skill 和 BaseFetcher.run
+都经由这条流水线抓取，并按新闻源记录条目数与耗时。
+
+相邻阶段之间用有界队列连接：下游处理不过来时上游在 put 处等待（背压），
+内存中只保留队列容量以内的条目；第一批新闻在抓取开始后数秒内即可入库，
+不必等所有新闻源都抓完。
+"""
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple
+
+from src.fetchers.engine import engine_scope
+from src.storage.models import NewsArticle
+from src.utils.config import get_settings
+from src.utils.logger import logger
+from src.utils.news_processor import news_processor
+
+# 攒批的最长等待时间（秒），抓取较慢时不足一批也按时入库
+_FLUSH_INTERVAL = 1.0
+
+# 与已入库新闻去重时，每个新闻源参与比较的近期文章时间窗口（小时）与数量上限
+_RECENT_WINDOW_HOURS = 48
+_RECENT_LIMIT = 1000
+
+# 阶段结束标记
+_END = object()
+
+
+async def _feed(source: AsyncIterator, queue: asyncio.Queue) -> None:
+    """把上游阶段的输出写入有界队列（队列满时等待），结束时写入结束标记"""
+    try:
+        async for item in source:
+            await queue.put(item)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        await queue.put(_END)
+        raise
+    else:
+        await queue.put(_END)
+
+
+async def _drain(queue: asyncio.Queue) -> AsyncIterator:
+    """逐个读取队列中的条目，直到结束标记"""
+    while True:
+        item = await queue.get()
+        if item is _END:
+            return
+        yield item
+
+
+@dataclass
+class SourceMetrics:
+    """单个新闻源在一次运行中的统计"""
+
+    source: str
+    fetched: int = 0
+    valid: int = 0
+    # 同一次运行中 ID 重复、或与近期已入库新闻近似重复而丢弃的条目数
+    duplicates: int = 0
+    merged: int = 0
+    saved: int = 0
+    # 写入出错、没有入库的文章数
+    failed: int = 0
+    # 抓取耗时（网络请求 + 解析），入库耗时按文章数分摊本源所在批次的耗时
+    fetch_seconds: float = 0.0
+    save_seconds: float = 0.0
+    error: str = ''
+
+    def to_dict(self) -> Dict:
+        """转换为字典（用于接口输出）"""
+        return {
+            'source': self.source,
+            'fetched': self.fetched,
+            'valid': self.valid,
+            'duplicates': self.duplicates,
+            'merged': self.merged,
+            'saved': self.saved,
+            'failed': self.failed,
+            'fetch_seconds': round(self.fetch_seconds, 3),
+            'save_seconds': round(self.save_seconds, 3),
+            'error': self.error,
+        }
+
+
+@dataclass
+class PipelineResult:
+    """一次流水线运行的统计"""
+
+    fetched: int = 0
+    valid: int = 0
+    duplicates: int = 0
+    merged: int = 0
+    # 已入库（含内容没有变化的）文章数，以及其中实际写入（新增或有变化）的数量
+    saved: int = 0
+    changed: int = 0
+    failed: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+    # 从开始运行到第一批入库的时间（秒）
+    first_save_after: Optional[float] = None
+    sources: Dict[str, SourceMetrics] = field(default_factory=dict)
+    # collect=True 时保留入库的文章
+    articles: List[NewsArticle] = field(default_factory=list)
+    started_at: float = field(default_factory=time.monotonic)
+
+    def source(self, name: str) -> SourceMetrics:
+        """获取新闻源的统计，不存在时创建"""
+        metrics = self.sources.get(name)
+        if metrics is None:
+            metrics = self.sources[name] = SourceMetrics(name)
+        return metrics
+
+    def to_dict(self) -> Dict:
+        """转换为字典（用于接口输出）"""
+        return {
+            'fetched': self.fetched,
+            'valid': self.valid,
+            'duplicates': self.duplicates,
+            'merged': self.merged,
+            'saved': self.saved,
+            'changed': self.changed,
+            'failed': self.failed,
+            'batches': self.batches,
+            'elapsed': round(self.elapsed, 3),
+            'first_save_after': round(self.first_save_after, 3) if self.first_save_after is not None else None,
+            'sources': [metrics.to_dict() for metrics in self.sources.values()],
+        }
+
+
+class FetchPipeline:
+    """流式抓取流水线"""
+
+    def __init__(
+        self,
+        database=None,
+        clusterer=None,
+        processor=None,
+        batch_size: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        flush_interval: float = _FLUSH_INTERVAL,
+    ):
+        """
+        初始化流水线
+
+        Args:
+            database: 数据库实例，默认使用全局实例
+            clusterer: 跨源报道聚类器，默认基于 database 创建
+            processor: 新闻处理器（清洗、合并相似新闻），默认使用全局实例
+            batch_size: 每批入库的文章数，默认读取配置 FETCH_BATCH_SIZE
+            queue_size: 阶段之间的队列容量，默认读取配置 FETCH_QUEUE_SIZE
+            flush_interval: 攒批的最长等待时间（秒）
+        """
+        settings = get_settings()
+        self._database = database
+        self._clusterer = clusterer
+        self.processor = processor or news_processor
+        self.batch_size = batch_size or settings.fetch_batch_size
+        self.queue_size = queue_size or settings.fetch_queue_size
+        self.flush_interval = flush_interval
+
+    @property
+    def database(self):
+        """数据库实例（延迟导入，避免循环依赖）"""
+        if self._database is None:
+            from src.storage.database import db
+            self._database = db
+        return self._database
+
+    @property
+    def clusterer(self):
+        """跨源报道聚类器"""
+        if self._clusterer is None:
+            from src.utils.story_clusterer import StoryClusterer
+            self._clusterer = StoryClusterer(self.database)
+        return self._clusterer
+
+    async def run(self, fetchers: Sequence, collect: bool = False) -> PipelineResult:
+        """
+        运行流水线：并发抓取所有新闻源，边抓取边处理、入库
+
+        Args:
+            fetchers: 抓取器实例
+            collect: 是否在结果中保留入库的文章（命令行输出等需要）
+
+        Returns:
+            运行统计
+        """
+        result = PipelineResult()
+        # 各新闻源的近期已入库文章，每次运行每个新闻源只查询一次，并随本次入库的文章增加
+        recent: Dict[str, List] = {}
+        entries: asyncio.Queue = asyncio.Queue(self.queue_size)
+        articles: asyncio.Queue = asyncio.Queue(self.queue_size)
+
+        async with engine_scope():
+            processed = self._dedupe(self._normalize(_drain(entries), result), result)
+            tasks = [
+                asyncio.create_task(self._fetch(fetchers, entries, result)),
+                asyncio.create_task(_feed(processed, articles)),
+            ]
+            try:
+                async for batch in self._batches(articles):
+                    await self._save(batch, result, collect, recent)
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        # 抓取成功且条目全部入库的新闻源才写入 HTTP 校验信息，否则下次抓取会重新处理
+        for fetcher in fetchers:
+            metrics = result.source(fetcher.source_name)
+            if not metrics.error and not metrics.failed:
+                fetcher.commit_validators()
+
+        result.elapsed = time.monotonic() - result.started_at
+        for metrics in result.sources.values():
+            logger.info(
+                f"[{metrics.source}] 抓取 {metrics.fetched} 条，入库 {metrics.saved} 条，"
+                f"抓取耗时 {metrics.fetch_seconds:.2f}s，入库耗时 {metrics.save_seconds:.2f}s"
+            )
+        logger.info(
+            f"抓取流水线完成: 抓取 {result.fetched} 条，有效 {result.valid} 条，"
+            f"重复 {result.duplicates} 条，合并 {result.merged} 条，入库 {result.saved} 条"
+            f"（其中有写入 {result.changed} 条，{result.batches} 批），失败 {result.failed} 条，"
+            f"耗时 {result.elapsed:.2f}s"
+        )
+        return result
+
+    async def _fetch(self, fetchers: Sequence, queue: asyncio.Queue, result: PipelineResult) -> None:
+        """抓取阶段：各新闻源并发抓取，抓到的条目逐条写入队列（队列满时等待下游）"""
+        async def fetch_one(fetcher) -> None:
+            metrics = result.source(fetcher.source_name)
+            started = time.monotonic()
+            try:
+                # 只处理新条目，已入库过的在构造模型前就被丢弃
+                items = await fetcher.fetch_new()
+            except Exception as e:
+                metrics.error = str(e)
+                logger.error(f"[{fetcher.source_name}] 抓取失败: {e}", exc_info=True)
+                return
+            finally:
+                metrics.fetch_seconds = time.monotonic() - started
+
+            logger.info(f"[{fetcher.source_name}] 抓取了 {len(items)} 篇新闻")
+            for item in items:
+                result.fetched += 1
+                metrics.fetched += 1
+                await queue.put((fetcher, item))
+
+        await asyncio.gather(*(fetch_one(fetcher) for fetcher in fetchers))
+        await queue.put(_END)
+
+    async def _normalize(
+        self, entries: AsyncIterator, result: PipelineResult
+    ) -> AsyncIterator[Tuple[object, NewsArticle]]:
+        """标准化与校验阶段：统一转换为 NewsArticle，丢弃无效条目"""
+        async for fetcher, item in entries:
+            try:
+                article_dict = fetcher.normalize_article(item)
+                if not fetcher.validate_article(article_dict):
+                    continue
+                article = NewsArticle.from_dict(article_dict, fetcher)
+            except Exception as e:
+                logger.warning(f"[{fetcher.source_name}] 条目转换失败: {e}")
+                continue
+            result.valid += 1
+            result.source(fetcher.source_name).valid += 1
+            yield fetcher, article
+
+    async def _dedupe(
+        self, articles: AsyncIterator, result: PipelineResult
+    ) -> AsyncIterator[Tuple[object, NewsArticle]]:
+        """去重阶段：同一次运行中 ID 相同的文章（如同一条新闻出现在多个分类）只保留第一篇"""
+        seen = set()
+        async for fetcher, article in articles:
+            if article.id in seen:
+                result.duplicates += 1
+                result.source(fetcher.source_name).duplicates += 1
+                continue
+            seen.add(article.id)
+            yield fetcher, article
+
+    async def _batches(self, queue: asyncio.Queue) -> AsyncIterator[List[Tuple[object, NewsArticle]]]:
+        """攒批：满 batch_size 条或距本批第一条超过 flush_interval 秒即输出一批"""
+        loop = asyncio.get_running_loop()
+        batch: List[Tuple[object, NewsArticle]] = []
+        deadline = 0.0
+        while True:
+            timeout = max(deadline - loop.time(), 0) if batch else None
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                yield batch
+                batch = []
+                continue
+            if item is _END:
+                break
+            if not batch:
+                deadline = loop.time() + self.flush_interval
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def _save(
+        self,
+        batch: List[Tuple[object, NewsArticle]],
+        result: PipelineResult,
+        collect: bool,
+        recent: Dict[str, List],
+    ) -> None:
+        """入库阶段：按新闻源处理后整批写入（单个事务，在线程中执行，不阻塞上游阶段）"""
+        sources: Dict[int, Tuple[object, List[NewsArticle]]] = {}
+        for fetcher, article in batch:
+            sources.setdefault(id(fetcher), (fetcher, []))[1].append(article)
+
+        # 每次全量刷新的热榜，内容只是实时热度，变化时不作废已有译文
+        live = {
+            article.source
+            for fetcher, articles in sources.values() if not fetcher.INCREMENTAL
+            for article in articles
+        }
+        started = time.monotonic()
+        processed, stored, changed = await asyncio.to_thread(
+            self._save_batch, [articles for _, articles in sources.values()], recent, live
+        )
+        elapsed = time.monotonic() - started
+
+        result.batches += 1
+        result.changed += changed
+        if result.first_save_after is None:
+            result.first_save_after = time.monotonic() - result.started_at
+
+        total = sum(len(groups) for groups in processed) or 1
+        for (fetcher, originals), groups in zip(sources.values(), processed):
+            metrics = result.source(fetcher.source_name)
+            saved = [article for article, _ in groups if article.id in stored]
+            kept = {member.id for _, members in groups for member in members}
+            dropped = [article for article in originals if article.id not in kept]
+            metrics.duplicates += len(dropped)
+            metrics.merged += len(kept) - len(groups)
+            metrics.saved += len(saved)
+            metrics.failed += len(groups) - len(saved)
+            metrics.save_seconds += elapsed * len(groups) / total
+            result.duplicates += len(dropped)
+            result.merged += len(kept) - len(groups)
+            result.saved += len(saved)
+            result.failed += len(groups) - len(saved)
+            if collect:
+                result.articles.extend(saved)
+            # 只有确实入库的文章（连同合并进它的原始条目）以及与已入库新闻重复的条目
+            # 才记入已见索引，写入出错的条目下次抓取时重新处理
+            fetcher.mark_seen(dropped + [
+                member for article, members in groups if article.id in stored for member in members
+            ])
+
+    def _save_batch(
+        self, sources: List[List[NewsArticle]], recent: Dict[str, List], live: Set[str] = frozenset()
+    ) -> Tuple[List[List[Tuple[NewsArticle, List[NewsArticle]]]], Set[str], int]:
+        """
+        按新闻源清洗、合并相似新闻，归入跨源报道聚类后写入数据库
+
+        同一新闻源内的相似新闻才合并，与该源近期已入库新闻重复的条目被丢弃；
+        不同新闻源的相似报道由报道聚类关联，各自保留。
+
+        Args:
+            sources: 按新闻源分组的文章
+            recent: 各新闻源的近期已入库文章缓存，本批入库的文章会加入其中
+            live: 内容为实时热度的新闻源（见 Database.write_articles）
+
+        Returns:
+            (各新闻源的 (处理后的文章, 对应的原始文章) 列表, 已入库的文章 ID, 实际写入的数量)
+        """
+        processed = [
+            self.processor.process_groups(articles, self._recent_articles(articles, recent))
+            for articles in sources
+        ]
+        articles = [article for groups in processed for article, _ in groups]
+        self.clusterer.assign(articles)
+        stored, changed = self.database.write_articles(articles, live)
+        stored = set(stored)
+        # 同一次运行中后续批次也与本批入库的文章去重
+        for article in articles:
+            if article.id in stored:
+                recent.setdefault(article.source, []).append(article)
+        return processed, stored, changed
+
+    def _recent_articles(self, articles: List[NewsArticle], recent: Dict[str, List]) -> List:
+        """取得这些文章所属新闻源的近期已入库文章，未缓存的新闻源从数据库读取"""
+        since = datetime.now() - timedelta(hours=_RECENT_WINDOW_HOURS)
+        existing = []
+        for source in dict.fromkeys(article.source for article in articles):
+            if source not in recent:
+                recent[source] = self.database.get_recent_source_articles(source, since, _RECENT_LIMIT)
+            existing.extend(recent[source])
+        return existing
@@ -6,7 +6,6 @@
 from datetime import datetime
 from typing import List, Optional
 import feedparser
-from bs4 import BeautifulSoup
 
 from src.fetchers.base import BaseFetcher
 from src.storage.models import NewsArticle
@@ -25,7 +24,7 @@ class AFPFetcher(BaseFetcher):
         try:
             logger.info(f"开始抓取 {self.source_name}")
 
-            feed = self._parse_feed(self.rss_url)
+            feed = await self._parse_feed(self.rss_url)
             articles = []
 
             for entry in feed.entries:
@@ -52,8 +51,8 @@ class AFPFetcher(BaseFetcher):
 
         content = ''
         if hasattr(entry, 'summary'):
-            soup = BeautifulSoup(entry.summary, 'html.parser')
-            content = soup.get_text().strip()
+            # 纯文本摘要已在解析进程中提取（见 parse_pool.parse_feed）
+            content = entry.get('summary_text', '')
 
         published_at = self._parse_date(entry.get('published', ''))
 
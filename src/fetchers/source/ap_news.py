@@ -57,7 +57,7 @@ class APNewsFetcher(BaseFetcher):
             try:
                 logger.info(f"[{self.source_name}] 抓取 {category} 页面...")
 
-                response = self._make_request(url)
+                response = await self._make_request(url, conditional=True)
                 if not response:
                     continue
 
@@ -69,6 +69,7 @@ class APNewsFetcher(BaseFetcher):
                 )
 
             except Exception as e:
+                self.discard_validator(url)
                 logger.error(
                     f"[{self.source_name}] 抓取 {category} 页面时出错: {e}",
                     exc_info=True
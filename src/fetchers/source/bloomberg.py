@@ -40,8 +40,6 @@ class BloombergFetcher(BaseFetcher):
         Returns:
             新闻列表
         """
-        all_articles = []
-
         # 选择可用的 RSS 源
         feeds_to_use = {
             'markets': 'https://feeds.bloomberg.com/markets/news.rss',
@@ -49,45 +47,7 @@ class BloombergFetcher(BaseFetcher):
             'technology': 'https://www.bloomberg.com/feeds/technology-news.xml',
         }
 
-        for category, feed_url in feeds_to_use.items():
-            try:
-                logger.info(f"[{self.source_name}] 抓取 {category} 分类...")
-
-                # 使用 feedparser 解析 RSS
-                feed = self._parse_feed(feed_url)
-
-                if feed.bozo:
-                    # 检查是否是网络错误
-                    error_message = str(feed.bozo_exception)
-                    if "Connection refused" in error_message or "urlopen error" in error_message or "网络连接错误" in error_message:
-                        logger.warning(
-                            f"[{self.source_name}] 网络错误 ({category}): {feed.bozo_exception}"
-                        )
-                        # 网络错误时直接跳过
-                        continue
-                    else:
-                        logger.warning(
-                            f"[{self.source_name}] RSS 解析警告 ({category}): {feed.bozo_exception}"
-                        )
-                        # 如果是解析错误，尝试其他源而不是跳过整个分类
-                        if len(feed.entries) == 0:
-                            logger.warning(
-                                f"[{self.source_name}] {category} 分类没有获取到任何文章")
-                            continue
-
-                articles = self.parse(feed, category)
-                all_articles.extend(articles)
-
-                logger.info(
-                    f"[{self.source_name}] {category} 分类获取到 {len(articles)} 篇新闻"
-                )
-
-            except Exception as e:
-                logger.error(
-                    f"[{self.source_name}] 抓取 {category} 分类时出错: {e}",
-                    exc_info=True
-                )
-        return all_articles
+        return await self._parse_feeds(feeds_to_use)
 
     def parse(self, feed, category: str) -> List[Dict]:
         """
@@ -12,6 +12,9 @@ from src.utils.logger import logger
 class DouyinFetcher(BaseFetcher):
     """抖音热榜抓取器 (官方接口)"""
 
+    # 优先级按实时排名设置，每次都需要全量刷新
+    INCREMENTAL = False
+
     def __init__(self):
         super().__init__('抖音热榜', 'https://www.douyin.com', 2.0, 'zh')
         # 官方 Web 接口
@@ -34,7 +37,7 @@ class DouyinFetcher(BaseFetcher):
                 'Accept': 'application/json, text/plain, */*'
             }
 
-            response = self._make_request(
+            response = await self._make_request(
                 self.api_url, params=params, headers=headers)
             if not response or response.status_code != 200:
                 logger.error(
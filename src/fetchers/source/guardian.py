@@ -30,27 +30,7 @@ class GuardianFetcher(BaseFetcher):
 
     async def fetch(self) -> List[Dict]:
         """抓取卫报新闻"""
-        all_articles = []
-
-        for category, feed_url in self.RSS_FEEDS.items():
-            try:
-                logger.info(f"[{self.source_name}] 抓取 {category} 分类...")
-                feed = self._parse_feed(feed_url)
-                if feed.bozo:
-                    logger.warning(
-                        f"[{self.source_name}] RSS 解析警告 ({category}): {feed.bozo_exception}")
-
-                articles = self.parse(feed, category)
-                all_articles.extend(articles)
-
-                logger.info(
-                    f"[{self.source_name}] {category} 分类获取到 {len(articles)} 篇新闻")
-
-            except Exception as e:
-                logger.error(
-                    f"[{self.source_name}] 抓取 {category} 分类时出错: {e}", exc_info=True)
-
-        return all_articles
+        return await self._parse_feeds(self.RSS_FEEDS)
 
     def parse(self, feed, category: str) -> List[Dict]:
         """解析 RSS"""
@@ -25,7 +25,7 @@ class LinuxDoFetcher(BaseFetcher):
         """抓取新闻"""
         try:
             # 使用 feedparser 解析 RSS 源
-            feed = self._parse_feed(self.rss_url)
+            feed = await self._parse_feed(self.rss_url)
             articles = []
 
             for entry in feed.entries:
@@ -22,7 +22,7 @@ class MITTechReviewFetcher(BaseFetcher):
     async def fetch(self) -> List[NewsArticle]:
         """抓取科技文章"""
         try:
-            feed = self._parse_feed(self.rss_url)
+            feed = await self._parse_feed(self.rss_url)
             articles = []
 
             for entry in feed.entries[:15]:
@@ -20,7 +20,7 @@ class RuanyifengFetcher(BaseFetcher):
     async def fetch(self) -> List[Dict]:
         """抓取博客文章"""
         try:
-            feed = self._parse_feed(self.rss_url)
+            feed = await self._parse_feed(self.rss_url)
             articles = []
 
             for entry in feed.entries[:10]:
@@ -29,21 +29,7 @@ class TechCrunchFetcher(BaseFetcher):
         )
 
     async def fetch(self) -> List[Dict]:
-        all_articles = []
-        for category, feed_url in self.RSS_FEEDS.items():
-            try:
-                logger.info(f"[{self.source_name}] 抓取 {category} 分类...")
-                feed = self._parse_feed(feed_url)
-                if feed.bozo:
-                    logger.warning(
-                        f"[{self.source_name}] RSS 解析警告: {feed.bozo_exception}")
-
-                articles = self.parse(feed, category)
-                all_articles.extend(articles)
-            except Exception as e:
-                logger.error(f"[{self.source_name}] 抓取失败: {e}", exc_info=True)
-
-        return all_articles
+        return await self._parse_feeds(self.RSS_FEEDS)
 
     def parse(self, feed, category: str) -> List[Dict]:
         articles = []
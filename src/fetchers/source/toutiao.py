@@ -15,6 +15,9 @@ from src.utils.logger import logger
 class ToutiaoFetcher(BaseFetcher):
     """今日头条热搜抓取器"""
 
+    # 优先级按实时排名设置，每次都需要全量刷新
+    INCREMENTAL = False
+
     def __init__(self):
         super().__init__('今日头条', 'https://www.toutiao.com', 2.0, 'zh')
         # 今日头条热搜 API
@@ -31,7 +34,7 @@ class ToutiaoFetcher(BaseFetcher):
                 'Referer': 'https://www.toutiao.com/'
             }
 
-            response = self._make_request(self.hotsearch_api, headers=headers)
+            response = await self._make_request(self.hotsearch_api, headers=headers)
             if not response:
                 logger.error("今日头条热搜 API 请求失败")
                 return []
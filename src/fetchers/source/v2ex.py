@@ -21,7 +21,7 @@ class V2EXFetcher(BaseFetcher):
     async def fetch(self) -> List[NewsArticle]:
         """抓取 V2EX 热点"""
         try:
-            response = self._make_request(self.hot_url)
+            response = await self._make_request(self.hot_url, conditional=True)
             if not response:
                 return []
             
@@ -30,6 +30,7 @@ class V2EXFetcher(BaseFetcher):
             return articles
             
         except Exception as e:
+            self.discard_validator(self.hot_url)
             logger.error(f"V2EX 抓取失败: {e}")
             return []
     
@@ -9,6 +9,7 @@ from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from src.scheduler.jobs import NewsJobs
 from src.utils.logger import logger
+from src.utils.translation_jobs import translation_workers
 
 
 class NewsScheduler:
@@ -32,13 +33,13 @@ class NewsScheduler:
             replace_existing=True
         )
         
-        # 翻译任务：每30分钟运行一次
+        # 翻译补漏：每30分钟把缺少翻译的新闻补入翻译队列（由翻译工作线程处理）
         self.scheduler.add_job(
             self._run_async_job,
             args=[self.jobs.translate_pending_news],
             trigger=IntervalTrigger(minutes=30),
             id='translate_news',
-            name='翻译新闻',
+            name='补充翻译队列',
             replace_existing=True
         )
         
@@ -74,6 +75,7 @@ class NewsScheduler:
         self.print_jobs()
         
         self.scheduler.start()
+        translation_workers.start()
         logger.info("调度器已启动")
     
     def stop(self):
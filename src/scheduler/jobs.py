@@ -4,11 +4,14 @@
 定义所有定时任务
 """
 from datetime import datetime
+from src.fetchers.pipeline import FetchPipeline
 from src.fetchers.registry import FETCHERS
 
-from src.translators import translator_manager
 from src.storage.database import Database
+from src.storage.http_cache import http_cache
+from src.storage.seen_index import seen_index
 from src.utils.logger import logger
+from src.utils.story_clusterer import StoryClusterer
 
 
 class NewsJobs:
@@ -16,7 +19,8 @@ class NewsJobs:
     
     def __init__(self):
         self.db = Database()
-        self.translator = translator_manager.get_translator()
+        self.story_clusterer = StoryClusterer(self.db)
+        self.pipeline = FetchPipeline(self.db, self.story_clusterer)
         
         # 动态获取所有抓取器并按中文优先排序
         self.all_fetchers = self._get_all_fetchers_sorted()
@@ -24,64 +28,19 @@ class NewsJobs:
 
     
     async def _fetch_from_sources(self, fetchers):
-        """从指定新闻源抓取"""
-        total = 0
+        """从指定新闻源并发抓取，经流式流水线边抓取边入库"""
+        result = await self.pipeline.run(fetchers)
+        logger.info(f"本次共抓取 {result.saved} 篇新闻，耗时 {result.elapsed:.1f}s")
+    
+    async def translate_pending_news(self, limit: int = 200):
+        """把缺少翻译的新闻补入翻译队列（新文章保存时已入队，这里兜底历史数据）"""
+        logger.info("开始检查待翻译的新闻")
 
-        for fetcher in fetchers:
-            try:
-                articles = await fetcher.fetch()
+        # 队列中已完成但译文仍不完整的（如正文翻译失败）重新入队
+        untranslated = self.db.get_untranslated_articles(limit=limit)
+        queued = self.db.translation_queue.enqueue((article.id for article in untranslated), reopen=True)
 
-                from src.storage.models import NewsArticle
-                for article_dict in articles:
-                    article_dict = fetcher.normalize_article(article_dict)
-                    if not fetcher.validate_article(article_dict):
-                        continue
-                    # 使用 from_dict 统一转换，消除重复逻辑
-                    article_obj = NewsArticle.from_dict(article_dict, fetcher)
-                    if self.db.save_article(article_obj):
-                        total += 1
-                    
-                logger.info(f"[{fetcher.source_name}] 抓取了 {len(articles)} 篇新闻")
-                
-            except Exception as e:
-                logger.error(f"[{fetcher.source_name}] 抓取失败: {e}", exc_info=True)
-        
-        logger.info(f"本次共抓取 {total} 篇新闻")
-    
-    async def translate_pending_news(self):
-        """翻译待翻译的新闻"""
-        logger.info("开始翻译待翻译的新闻")
-        
-        # 获取未翻译的新闻
-        articles = self.db.get_articles(limit=50)
-        untranslated = [a for a in articles if not a.title_zh]
-        
-        if not untranslated:
-            logger.info("没有待翻译的新闻")
-            return
-        
-        translated_count = 0
-        
-        for article in untranslated[:20]:  # 每次最多翻译20篇
-            try:
-                # 翻译标题
-                title_zh = await self.translator.translate(article.title)
-                
-                # 翻译内容（如果有）
-                content_zh = ""
-                if article.content:
-                    content_zh = await self.translator.translate(article.content[:1000])
-                
-                # 更新数据库
-                self.db.update_translation(article.id, title_zh, content_zh)
-                translated_count += 1
-                
-                logger.debug(f"翻译完成: {article.title[:30]}...")
-                
-            except Exception as e:
-                logger.error(f"翻译失败 [{article.id}]: {e}")
-        
-        logger.info(f"翻译完成，共 {translated_count} 篇")
+        logger.info(f"补充入队 {queued} 篇待翻译新闻，队列状态: {self.db.translation_queue.stats()}")
     
     def _get_all_fetchers_sorted(self):
         """动态获取所有抓取器并按中文优先排序"""
@@ -116,5 +75,8 @@ class NewsJobs:
         logger.info("开始清理旧新闻")
         
         deleted = self.db.delete_all_articles()
+        # 新闻已清空，条件请求的校验信息也要重置，否则未变化的源不会重新入库
+        http_cache.clear()
+        seen_index.clear()
         
         logger.info(f"清理完成，删除了 {deleted} 篇旧新闻")
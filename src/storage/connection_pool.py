@@ -0,0 +1,144 @@
+"""
+SQLite 连接池模块
+
+同一数据库文件的所有存储类共享一个连接池：连接复用（语句缓存随连接保留，
+相同 SQL 不再重复编译），并统一开启 WAL 日志模式，读请求不会被后台写入阻塞。
+"""
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from src.utils.config import get_settings
+from src.utils.logger import logger
+
+# 每个新连接执行的 PRAGMA（journal_mode 写入数据库文件，其余为连接级设置）
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    # WAL 模式下 NORMAL 只在检查点时同步，掉电最多丢失最近的事务，不会损坏数据库
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    # 负数表示以 KiB 为单位，即 16MB 页缓存
+    "PRAGMA cache_size=-16000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",
+)
+
+# 每个连接缓存的预编译语句数量
+_CACHED_STATEMENTS = 256
+
+
+class ConnectionPool:
+    """SQLite 连接池（线程安全）"""
+
+    def __init__(self, db_path: Path, size: Optional[int] = None, timeout: float = 30.0):
+        """
+        初始化连接池
+
+        Args:
+            db_path: 数据库文件路径
+            size: 最大连接数，默认读取配置 DATABASE_POOL_SIZE
+            timeout: 等待空闲连接的超时时间（秒）
+        """
+        self.db_path = Path(db_path)
+        self.size = size or get_settings().database_pool_size
+        self.timeout = timeout
+        self._idle: List[sqlite3.Connection] = []
+        self._created = 0
+        self._cond = threading.Condition()
+        # 当前线程已借出的连接，嵌套调用时复用，避免同一线程占用多个连接
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        """创建新连接并设置 PRAGMA"""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _acquire(self) -> sqlite3.Connection:
+        """借出连接，连接数达到上限时等待归还"""
+        with self._cond:
+            while not self._idle and self._created >= self.size:
+                if not self._cond.wait(self.timeout):
+                    raise TimeoutError(f"等待数据库连接超时: {self.db_path}")
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+
+        try:
+            return self._connect()
+        except Exception:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        """归还连接"""
+        with self._cond:
+            self._idle.append(conn)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        借用连接，退出时提交事务（异常时回滚）并归还连接，
+        与 sqlite3.Connection 自身的上下文管理语义一致
+
+        Yields:
+            数据库连接
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            yield conn
+            return
+
+        conn = self._acquire()
+        self._local.conn = conn
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            self._release(conn)
+
+    def close_all(self) -> None:
+        """关闭所有空闲连接"""
+        with self._cond:
+            for conn in self._idle:
+                conn.close()
+            self._created -= len(self._idle)
+            self._idle.clear()
+
+
+_pools: Dict[Path, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: Path) -> ConnectionPool:
+    """
+    获取数据库文件对应的共享连接池
+
+    Args:
+        db_path: 数据库文件路径
+
+    Returns:
+        连接池
+    """
+    key = Path(db_path).resolve()
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(key)
+            logger.debug(f"创建数据库连接池: {key} (上限 {pool.size})")
+        return pool
@@ -3,17 +3,85 @@
 
 使用 SQLite 进行数据存储
 """
+import base64
 import json
 import sqlite3
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional, Dict, Tuple
+from typing import Collection, ContextManager, List, Optional, Dict, Sequence, Tuple, Union
 
-from src.storage.models import NewsArticle
+from src.storage.models import ArticleView, NewsArticle
+from src.storage.search_index import search_index
+from src.storage.translation_queue import TranslationQueue
+from src.storage.connection_pool import get_pool
 from src.utils.config import get_settings
 from src.utils.logger import logger
 
 
+# 列表排序（与分页复合索引一致，id 保证顺序唯一）
+_LIST_ORDER = "priority DESC, published_at DESC, id DESC"
+
+# 列投影时总会读取的列（排序、分页游标和分组需要）
+_KEY_COLUMNS = ('id', 'source', 'priority', 'published_at')
+
+# 列表页、首页展示所需的列
+LIST_COLUMNS = ('title', 'title_zh', 'category', 'needs_translation')
+
+# 文章总数缓存有效期（秒），期间本进程内的写入会立即使缓存失效
+_COUNT_CACHE_TTL = 60
+
+# 文章表写入列（顺序与 Database._article_params 一致）
+_ARTICLE_COLUMNS = (
+    'id', 'title', 'title_zh', 'title_en', 'content', 'content_zh', 'content_en',
+    'source', 'url', 'published_at', 'fetched_at', 'category', 'priority', 'tags',
+    'translated', 'story_id',
+)
+
+# 原文标题、内容发生变化（新内容为空时保留原内容，不算变化）。
+# 写入参数在文章列之后多一个标志（编号参数）：热榜等新闻源的内容只是实时热度，
+# 每次抓取都会变化，此时只按标题判断译文是否作废
+_TITLE_CHANGED = "excluded.title IS NOT title"
+_CONTENT_CHANGED = (
+    f"(?{len(_ARTICLE_COLUMNS) + 1} AND excluded.content != '' AND excluded.content IS NOT content)"
+)
+
+# 冲突时各列的更新表达式（未列出的 id、fetched_at 保持首次入库时的值）：
+# 翻译、内容等新值为空时保留原值，翻译状态只升不降，报道聚类保持不变；
+# 原文变化时旧译文随之作废，改用新值（通常为空，重新进入翻译队列）
+_UPSERT_UPDATES = {
+    'title': "excluded.title",
+    'title_zh': f"CASE WHEN {_TITLE_CHANGED} THEN excluded.title_zh "
+                f"ELSE COALESCE(NULLIF(excluded.title_zh, ''), title_zh) END",
+    'title_en': f"CASE WHEN {_TITLE_CHANGED} THEN excluded.title_en "
+                f"ELSE COALESCE(NULLIF(excluded.title_en, ''), title_en) END",
+    'content': "COALESCE(NULLIF(excluded.content, ''), content)",
+    'content_zh': f"CASE WHEN {_CONTENT_CHANGED} THEN excluded.content_zh "
+                  f"ELSE COALESCE(NULLIF(excluded.content_zh, ''), content_zh) END",
+    'content_en': f"CASE WHEN {_CONTENT_CHANGED} THEN excluded.content_en "
+                  f"ELSE COALESCE(NULLIF(excluded.content_en, ''), content_en) END",
+    'source': "excluded.source",
+    'url': "excluded.url",
+    'published_at': "excluded.published_at",
+    'category': "COALESCE(NULLIF(excluded.category, ''), category)",
+    'priority': "excluded.priority",
+    'tags': "CASE WHEN excluded.tags = '[]' THEN tags ELSE excluded.tags END",
+    'translated': f"CASE WHEN {_TITLE_CHANGED} OR {_CONTENT_CHANGED} THEN excluded.translated "
+                  f"ELSE MAX(translated, excluded.translated) END",
+    'story_id': "COALESCE(story_id, excluded.story_id)",
+}
+
+# 内容没有变化的行跳过更新，避免无谓地重写数据页和索引
+_UPSERT_SQL = f"""
+    INSERT INTO articles ({', '.join(_ARTICLE_COLUMNS)})
+    VALUES ({', '.join('?' for _ in _ARTICLE_COLUMNS)})
+    ON CONFLICT(id) DO UPDATE SET
+        {', '.join(f'{col} = {expr}' for col, expr in _UPSERT_UPDATES.items())}
+    WHERE {' OR '.join(f'({expr}) IS NOT {col}' for col, expr in _UPSERT_UPDATES.items())}
+"""
+
+
 class Database:
     """数据库管理类"""
     
@@ -27,13 +95,17 @@ class Database:
         self.settings = get_settings()
         self.db_path = db_path or self.settings.database_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = get_pool(self.db_path)
+        # 文章数量缓存: 过滤条件 -> (过期时间, 数量)
+        self._count_cache: Dict[tuple, Tuple[float, int]] = {}
+        self._count_lock = threading.Lock()
         self._init_database()
+        # 文章翻译队列（同一数据库文件）
+        self.translation_queue = TranslationQueue(self.db_path)
     
-    def _get_connection(self) -> sqlite3.Connection:
-        """获取数据库连接"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def _get_connection(self) -> ContextManager[sqlite3.Connection]:
+        """从共享连接池借用数据库连接（退出 with 时提交并归还）"""
+        return self._pool.connection()
     
     def _init_database(self):
         """初始化数据库表"""
@@ -57,7 +129,8 @@ class Database:
                     category TEXT,
                     priority INTEGER,
                     tags TEXT,
-                    translated BOOLEAN DEFAULT 0
+                    translated BOOLEAN DEFAULT 0,
+                    story_id TEXT
                 )
             """)
             
@@ -76,13 +149,66 @@ class Database:
                 CREATE INDEX IF NOT EXISTS idx_category 
                 ON articles(category)
             """)
+
+            # 旧库补充报道聚类列
+            self._ensure_column(cursor, 'articles', 'story_id', 'TEXT')
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_story_id
+                ON articles(story_id)
+            """)
+
+            # 列表分页复合索引（排序列 + id），按新闻源、分类筛选时各有一个前缀索引
+            cursor.execute("UPDATE articles SET priority = 5 WHERE priority IS NULL")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_list_order
+                ON articles(priority DESC, published_at DESC, id DESC)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_source_list_order
+                ON articles(source, priority DESC, published_at DESC, id DESC)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_category_list_order
+                ON articles(category, priority DESC, published_at DESC, id DESC)
+            """)
+
+            # 全文搜索索引（首次创建时为已有文章建立索引）
+            search_index.init(conn)
+
+            # 元数据表：写入版本号等
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS db_meta (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                )
+            """)
+            cursor.execute("INSERT OR IGNORE INTO db_meta (key, value) VALUES ('write_version', 0)")
             
-            conn.commit()
             logger.info(f"数据库初始化完成: {self.db_path}")
     
+    @staticmethod
+    def _ensure_column(cursor: sqlite3.Cursor, table: str, column: str, column_type: str):
+        """表中缺少指定列时补充该列"""
+        columns = {row[1] for row in cursor.execute(f"PRAGMA table_info({table})")}
+        if column not in columns:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+            logger.info(f"数据库表 {table} 新增列: {column}")
+
+    @staticmethod
+    def _article_params(article: NewsArticle, content_keyed: bool = True) -> tuple:
+        """文章对象转换为写入参数（顺序与 _ARTICLE_COLUMNS 一致，末尾为内容变化是否作废译文）"""
+        return (
+            article.id, article.title, article.title_zh, article.title_en,
+            article.content, article.content_zh, article.content_en,
+            article.source, article.url,
+            article.published_at, article.fetched_at, article.category,
+            article.priority, json.dumps(article.tags, ensure_ascii=False),
+            article.translated, article.story_id or None, content_keyed,
+        )
+
     def save_article(self, article: NewsArticle) -> bool:
         """
-        保存新闻文章
+        保存新闻文章（与 save_articles 相同的 UPSERT 语义）
         
         Args:
             article: 新闻文章对象
@@ -90,79 +216,104 @@ class Database:
         Returns:
             是否保存成功
         """
-        try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-
-                tags_json = json.dumps(article.tags, ensure_ascii=False)
-
-                cursor.execute("""
-                    INSERT OR REPLACE INTO articles (
-                        id, title, title_zh, title_en, content, content_zh, content_en, source, url,
-                        published_at, fetched_at, category, priority, tags,
-                        translated
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    article.id, article.title, article.title_zh, article.title_en,
-                    article.content, article.content_zh, article.content_en, article.source, article.url,
-                    article.published_at, article.fetched_at, article.category,
-                    article.priority, tags_json,
-                    article.translated
-                ))
-                
-                conn.commit()
-                logger.debug(f"保存新闻: {article.title[:50]}")
-                return True
-                
-        except Exception as e:
-            logger.error(f"保存新闻失败: {e}", exc_info=True)
-            return False
+        stored, _ = self.write_articles([article])
+        return article.id in stored
     
     def save_articles(self, articles: List[NewsArticle]) -> int:
         """
-        批量保存新闻（单次连接 + 事务批量插入，减少数据库 open/close 开销）
+        批量保存新闻（语义见 write_articles）
+
+        Args:
+            articles: 新闻列表
+
+        Returns:
+            实际写入（新增或有变化）的数量，内容没有变化的文章不计入
+        """
+        return self.write_articles(articles)[1]
+
+    def write_articles(
+        self, articles: List[NewsArticle], live_sources: Collection[str] = ()
+    ) -> Tuple[List[str], int]:
+        """
+        批量保存新闻（executemany + UPSERT，单个事务）
+
+        已存在的文章只更新有变化的列，新值为空的翻译、内容等不会覆盖已有数据，
+        原文标题或内容变化时清空对应的旧译文；整批写入失败时逐条重试，跳过出错的文章。
+        写入后仍未翻译的文章在同一事务内加入翻译队列（译文被清空的文章重新入队）。
 
         Args:
             articles: 新闻列表
+            live_sources: 内容为实时热度等状态信息的新闻源（每次全量刷新的热榜），
+                其内容变化只更新原文，不作废已有译文
 
         Returns:
-            成功保存的数量
+            (已入库的文章 ID, 实际写入的数量)：已入库包括内容没有变化而跳过更新的文章，
+            不包括写入出错的文章；实际写入只计新增或有变化的文章
         """
         if not articles:
-            return 0
+            return [], 0
 
+        rows = [self._article_params(article, article.source not in live_sources) for article in articles]
+        stored: List[str] = []
         count = 0
         try:
             with self._get_connection() as conn:
-                cursor = conn.cursor()
-                for article in articles:
+                # 用保存点界定本次写入，嵌套在调用方的事务中时不会提交或回滚外层事务
+                conn.execute("SAVEPOINT save_articles")
+                try:
+                    # 写入前的索引列，只为标题、内容、标签有变化的文章重建全文索引
+                    article_ids = [row[0] for row in rows]
+                    indexed = search_index.snapshot(conn, article_ids)
+                    # 内容没有变化的行被 UPSERT 的 WHERE 跳过，不计入 total_changes
+                    before = conn.total_changes
                     try:
-                        tags_json = json.dumps(article.tags, ensure_ascii=False)
-
-                        cursor.execute("""
-                            INSERT OR REPLACE INTO articles (
-                                id, title, title_zh, title_en, content, content_zh, content_en,
-                                source, url, published_at, fetched_at, category, priority, tags,
-                                translated
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            article.id, article.title, article.title_zh, article.title_en,
-                            article.content, article.content_zh, article.content_en,
-                            article.source, article.url,
-                            article.published_at, article.fetched_at, article.category,
-                            article.priority, tags_json,
-                            article.translated
-                        ))
-                        count += 1
-                    except Exception as e:
-                        logger.error(f"批量保存中单条失败: {e}")
-                conn.commit()
+                        conn.executemany(_UPSERT_SQL, rows)
+                        stored = [row[0] for row in rows]
+                    except sqlite3.Error as e:
+                        logger.warning(f"批量保存失败，改为逐条保存: {e}")
+                        conn.execute("ROLLBACK TO save_articles")
+                        before = conn.total_changes
+                        for row in rows:
+                            try:
+                                conn.execute(_UPSERT_SQL, row)
+                                stored.append(row[0])
+                            except sqlite3.Error as e:
+                                logger.error(f"批量保存中单条失败 [{row[0]}]: {e}")
+                    count = conn.total_changes - before
+                    # 同一事务内同步全文索引、翻译队列和写入版本号
+                    if count:
+                        search_index.index_articles(conn, article_ids, indexed)
+                    self.translation_queue.enqueue(self._untranslated_ids(conn, article_ids), reopen=True)
+                    if count:
+                        self._bump_write_version(conn)
+                except Exception:
+                    conn.execute("ROLLBACK TO save_articles")
+                    raise
+                finally:
+                    conn.execute("RELEASE save_articles")
         except Exception as e:
             logger.error(f"批量保存新闻失败: {e}", exc_info=True)
+            return [], 0
 
-        logger.info(f"批量保存新闻: {count}/{len(articles)} 成功")
-        return count
+        if count:
+            self._invalidate_counts()
+        logger.info(f"批量保存新闻: {len(stored)}/{len(articles)} 成功，其中 {count} 篇有写入")
+        return stored, count
     
+    @staticmethod
+    def _untranslated_ids(conn: sqlite3.Connection, article_ids: List[str]) -> List[str]:
+        """已入库文章中尚未翻译的文章 ID"""
+        untranslated = []
+        # 分段查询，避免超出 SQLite 参数数量上限
+        for start in range(0, len(article_ids), 500):
+            chunk = article_ids[start:start + 500]
+            rows = conn.execute(
+                f"SELECT id FROM articles WHERE translated = 0 AND id IN ({', '.join('?' for _ in chunk)})",
+                chunk
+            ).fetchall()
+            untranslated.extend(row[0] for row in rows)
+        return untranslated
+
     def get_article(self, article_id: str) -> Optional[NewsArticle]:
         """
         根据 ID 获取新闻
@@ -191,10 +342,16 @@ class Database:
         self,
         source: Optional[str],
         category: Optional[str],
+        one_per_story: bool = False,
     ) -> Tuple[str, list]:
         """
         构建公共过滤条件，供 get_articles 和 count_articles 共用。
 
+        Args:
+            source: 筛选新闻源
+            category: 筛选分类
+            one_per_story: 同一报道聚类只保留排序最靠前的一篇（跨新闻源全局判断）
+
         Returns:
             (where_clause, params) — where_clause 以 'WHERE 1=1' 开头
         """
@@ -207,16 +364,58 @@ class Database:
         if category and category != '':
             clause += " AND category = ?"
             params.append(category)
+        if one_per_story:
+            # 聚类中不存在排序更靠前的文章，即为代表文章（经 story_id 索引逐行判断，
+            # 可以与分页索引扫描配合，不需要对全表做窗口计算）
+            clause += """
+                AND NOT EXISTS (
+                    SELECT 1 FROM articles AS other
+                    WHERE other.story_id = articles.story_id
+                      AND (other.priority, other.published_at, other.id)
+                          > (articles.priority, articles.published_at, articles.id)
+                )"""
 
         return clause, params
 
+    @staticmethod
+    def _select_list(columns: Optional[Sequence[str]], table: str = '') -> str:
+        """
+        构建 SELECT 列表
+
+        Args:
+            columns: 需要的列（可包含 ArticleView.COMPUTED 中的派生列），None 表示全部列
+            table: 表别名，多表查询时用于限定列名
+
+        Returns:
+            SELECT 列表
+        """
+        prefix = f"{table}." if table else ''
+        if columns is None:
+            return f"{prefix}*"
+
+        selected = []
+        for column in dict.fromkeys((*_KEY_COLUMNS, *columns)):
+            if column in ArticleView.COMPUTED:
+                selected.append(f"{ArticleView.COMPUTED[column]} AS {column}")
+            elif column in ArticleView.__slots__:
+                selected.append(f"{prefix}{column}")
+            else:
+                raise ValueError(f"未知的列: {column}")
+        return ', '.join(selected)
+
+    def _to_item(self, row: sqlite3.Row, columns: Optional[Sequence[str]]) -> Union[NewsArticle, ArticleView]:
+        """未指定列时转换为 NewsArticle，否则转换为只读视图"""
+        return self._row_to_article(row) if columns is None else ArticleView(row)
+
     def get_articles(
         self,
         limit: Optional[int] = None,
         offset: int = 0,
         source: Optional[str] = None,
         category: Optional[str] = None,
-    ) -> List[NewsArticle]:
+        one_per_story: bool = False,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[Union[NewsArticle, ArticleView]]:
         """
         获取新闻列表
 
@@ -225,6 +424,8 @@ class Database:
             offset: 偏移量
             source: 筛选新闻源
             category: 筛选分类
+            one_per_story: 同一报道聚类只返回一篇
+            columns: 只读取这些列并返回 ArticleView（跳过模型校验），None 返回完整的 NewsArticle
 
         Returns:
             新闻列表
@@ -232,8 +433,8 @@ class Database:
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                where, params = self._build_filter_clause(source, category)
-                query = f"SELECT * FROM articles {where} ORDER BY priority DESC, published_at DESC"
+                where, params = self._build_filter_clause(source, category, one_per_story)
+                query = f"SELECT {self._select_list(columns)} FROM articles {where} ORDER BY {_LIST_ORDER}"
 
                 # 仅在指定 limit 时添加分页子句
                 if limit is not None:
@@ -242,16 +443,185 @@ class Database:
 
                 logger.info(f"执行查询: {query} 参数: {params}")
                 cursor.execute(query, params)
-                result = [self._row_to_article(row) for row in cursor.fetchall()]
+                result = [self._to_item(row, columns) for row in cursor.fetchall()]
                 logger.info(f"查询结果数量: {len(result)}")
                 return result
         except Exception as e:
             logger.error(f"获取新闻列表失败: {e}", exc_info=True)
             return []
     
+    @staticmethod
+    def _encode_cursor(row: sqlite3.Row) -> str:
+        """将行的排序键编码为分页游标"""
+        key = json.dumps([row['priority'], row['published_at'], row['id']], ensure_ascii=False)
+        return base64.urlsafe_b64encode(key.encode('utf-8')).decode('ascii')
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Optional[list]:
+        """解析分页游标，无效时返回 None"""
+        try:
+            key = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        except (ValueError, TypeError):
+            return None
+        return key if isinstance(key, list) and len(key) == 3 else None
+
+    def get_articles_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        source: Optional[str] = None,
+        category: Optional[str] = None,
+        one_per_story: bool = False,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Tuple[List[Union[NewsArticle, ArticleView]], Optional[str], Optional[str]]:
+        """
+        游标分页获取新闻列表
+
+        按 (priority, published_at, id) 定位，沿复合索引直接扫描到目标位置，
+        翻页耗时与页码无关。
+
+        Args:
+            limit: 每页数量
+            after: 下一页游标（取该位置之后的数据）
+            before: 上一页游标（取该位置之前的数据）
+            source: 筛选新闻源
+            category: 筛选分类
+            one_per_story: 同一报道聚类只返回一篇
+            columns: 只读取这些列并返回 ArticleView，None 返回完整的 NewsArticle
+
+        Returns:
+            (新闻列表, 上一页游标, 下一页游标)，没有上一页/下一页时对应游标为 None
+        """
+        where, params = self._build_filter_clause(source, category, one_per_story)
+        key = self._decode_cursor(before or after or '')
+        backward = bool(before) and key is not None
+        if key is not None:
+            where += " AND (priority, published_at, id) > (?, ?, ?)" if backward \
+                else " AND (priority, published_at, id) < (?, ?, ?)"
+            params.extend(key)
+
+        # 向上翻页时反向扫描索引，取到后再恢复正常顺序
+        order = "priority ASC, published_at ASC, id ASC" if backward else _LIST_ORDER
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    f"SELECT {self._select_list(columns)} FROM articles {where} ORDER BY {order} LIMIT ?",
+                    params + [limit + 1]
+                ).fetchall()
+        except Exception as e:
+            logger.error(f"分页获取新闻列表失败: {e}", exc_info=True)
+            return [], None, None
+
+        # 多取一条用于判断该方向上是否还有数据
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if backward:
+            rows.reverse()
+        if not rows:
+            return [], None, None
+
+        has_prev = has_more if backward else key is not None
+        has_next = key is not None if backward else has_more
+        return (
+            [self._to_item(row, columns) for row in rows],
+            self._encode_cursor(rows[0]) if has_prev else None,
+            self._encode_cursor(rows[-1]) if has_next else None,
+        )
+
+    def get_top_articles_per_source(
+        self,
+        limit_per_source: int,
+        one_per_story: bool = False,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Tuple[List[Union[NewsArticle, ArticleView]], Optional[str]]]:
+        """
+        获取每个新闻源排序最靠前的 N 篇新闻
+
+        每个新闻源沿 (source, priority, published_at, id) 索引只读取 N+1 行（窗口函数只用于编号），
+        开销取决于新闻源数量 × N，与历史数据量无关。
+
+        Args:
+            limit_per_source: 每个新闻源的数量
+            one_per_story: 同一报道聚类只返回一篇
+            columns: 只读取这些列并返回 ArticleView，None 返回完整的 NewsArticle
+
+        Returns:
+            按新闻源名称排序的字典：新闻源 -> (新闻列表, 加载更多的游标)，没有更多时游标为 None
+        """
+        where, params = self._build_filter_clause(None, None, one_per_story)
+        try:
+            with self._get_connection() as conn:
+                rows = conn.execute(f"""
+                    WITH RECURSIVE sources(source) AS (
+                        -- 沿 source 索引逐个跳到下一个新闻源，不扫描全表
+                        SELECT MIN(source) FROM articles
+                        UNION ALL
+                        SELECT (SELECT MIN(source) FROM articles WHERE source > sources.source)
+                        FROM sources WHERE sources.source IS NOT NULL
+                    )
+                    SELECT * FROM (
+                        SELECT {self._select_list(columns, 'picked')}, ROW_NUMBER() OVER (
+                            PARTITION BY picked.source ORDER BY {_LIST_ORDER}
+                        ) AS source_rank
+                        FROM sources
+                        JOIN articles AS picked ON picked.rowid IN (
+                            SELECT rowid FROM articles {where} AND source = sources.source
+                            ORDER BY {_LIST_ORDER} LIMIT ?
+                        )
+                    )
+                    ORDER BY source, source_rank
+                """, params + [limit_per_source + 1]).fetchall()
+        except Exception as e:
+            logger.error(f"获取各新闻源最新新闻失败: {e}", exc_info=True)
+            return {}
+
+        result: Dict[str, Tuple[List[Union[NewsArticle, ArticleView]], Optional[str]]] = {}
+        last_cursor = None
+        for row in rows:
+            articles, _ = result.setdefault(row['source'], ([], None))
+            if row['source_rank'] <= limit_per_source:
+                articles.append(self._to_item(row, columns))
+            else:
+                # 多取的一行说明还有更多，游标指向本页最后一篇
+                result[row['source']] = (articles, last_cursor)
+            last_cursor = self._encode_cursor(row)
+        return result
+
+    def search_articles(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        source: Optional[str] = None,
+    ) -> List[Dict]:
+        """
+        全文搜索新闻（标题、内容及其中英文翻译、标签）
+
+        Args:
+            query: 搜索词，多个词以空格分隔，需全部命中
+            limit: 返回数量
+            offset: 偏移量
+            source: 筛选新闻源
+
+        Returns:
+            按相关度排序的结果列表，每项包含 article、snippet（HTML 摘要）和 score
+        """
+        try:
+            with self._get_connection() as conn:
+                results = search_index.search(conn, query, limit, offset, source or '')
+        except Exception as e:
+            logger.error(f"搜索新闻失败: {e}", exc_info=True)
+            return []
+
+        return [
+            {'article': self._row_to_article(r['row']), 'snippet': r['snippet'], 'score': r['score']}
+            for r in results
+        ]
+
     def get_untranslated_articles(self, limit: int = 10) -> List[NewsArticle]:
         """
-        获取未翻译的新闻
+        获取未翻译的新闻（与 is_translated 一致：缺标题译文，或有正文但缺正文译文）
         
         Args:
             limit: 数量限制
@@ -264,7 +634,9 @@ class Database:
                 cursor = conn.cursor()
                 cursor.execute("""
                     SELECT * FROM articles 
-                    WHERE (title_zh = '' OR title_en = '' OR content_zh = '' OR content_en = '')
+                    WHERE COALESCE(title_zh, '') = '' OR COALESCE(title_en, '') = ''
+                       OR (COALESCE(content, '') != ''
+                           AND (COALESCE(content_zh, '') = '' OR COALESCE(content_en, '') = ''))
                     ORDER BY priority DESC, published_at DESC 
                     LIMIT ?
                 """, (limit,))
@@ -279,6 +651,62 @@ class Database:
 
     
 
+    def get_story_candidates(self, since: datetime, limit: int = 5000) -> List[Dict]:
+        """
+        获取近期文章的聚类信息，供报道聚类增量比较
+
+        Args:
+            since: 抓取时间下限
+            limit: 数量限制
+
+        Returns:
+            包含 id、story_id、title、content（前 300 字）的字典列表
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT id, COALESCE(story_id, id) AS story_id, title,
+                           substr(COALESCE(content, ''), 1, 300) AS content
+                    FROM articles
+                    WHERE fetched_at >= ?
+                    ORDER BY fetched_at DESC
+                    LIMIT ?
+                """, (since, limit))
+                return [dict(row) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"获取聚类候选文章失败: {e}", exc_info=True)
+            return []
+
+    def get_recent_source_articles(
+        self, source: str, since: datetime, limit: int = 1000
+    ) -> List[ArticleView]:
+        """
+        获取某新闻源的近期文章，供入库前与已入库新闻去重
+
+        Args:
+            source: 新闻源
+            since: 抓取时间下限
+            limit: 数量限制
+
+        Returns:
+            只含 ID、标题与内容各语言列的文章视图列表（按抓取时间倒序）
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT id, title, title_zh, title_en, content, content_zh, content_en
+                    FROM articles
+                    WHERE source = ? AND fetched_at >= ?
+                    ORDER BY fetched_at DESC
+                    LIMIT ?
+                """, (source, since, limit))
+                return [ArticleView(row) for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"获取近期文章失败: {e}", exc_info=True)
+            return []
+
     def delete_all_articles(self) -> int:
         """
         删除所有新闻
@@ -291,7 +719,10 @@ class Database:
                 cursor = conn.cursor()
                 cursor.execute("DELETE FROM articles")
                 deleted = cursor.rowcount
-                conn.commit()
+                search_index.clear(conn)
+                self.translation_queue.clear()
+                self._bump_write_version(conn)
+                self._invalidate_counts()
                 
                 logger.info(f"删除所有新闻: {deleted} 条")
                 return deleted
@@ -364,6 +795,7 @@ class Database:
         self,
         source: Optional[str] = None,
         category: Optional[str] = None,
+        one_per_story: bool = False,
     ) -> int:
         """
         统计符合条件的新闻数量
@@ -371,19 +803,57 @@ class Database:
         Args:
             source: 筛选新闻源
             category: 筛选分类
+            one_per_story: 同一报道聚类只计一篇
 
         Returns:
-            新闻数量
+            新闻数量（带短期缓存，其他进程的写入最多延迟 _COUNT_CACHE_TTL 秒反映）
         """
+        cache_key = (source or '', category or '', one_per_story)
+        with self._count_lock:
+            cached = self._count_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                where, params = self._build_filter_clause(source, category)
+                where, params = self._build_filter_clause(source, category, one_per_story)
                 cursor.execute(f"SELECT COUNT(*) FROM articles {where}", params)
-                return cursor.fetchone()[0]
+                count = cursor.fetchone()[0]
         except Exception as e:
             logger.error(f"统计新闻数量失败: {e}", exc_info=True)
             return 0
+
+        with self._count_lock:
+            self._count_cache[cache_key] = (time.monotonic() + _COUNT_CACHE_TTL, count)
+        return count
+
+    @staticmethod
+    def _bump_write_version(conn: sqlite3.Connection):
+        """递增写入版本号（在写入事务内调用）"""
+        conn.execute("UPDATE db_meta SET value = value + 1 WHERE key = 'write_version'")
+
+    def get_write_version(self) -> int:
+        """
+        获取写入版本号
+
+        每次文章写入或删除都会递增（跨进程可见），页面缓存据此判断是否失效。
+
+        Returns:
+            版本号，读取失败时返回 -1（调用方应视为缓存失效）
+        """
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute("SELECT value FROM db_meta WHERE key = 'write_version'").fetchone()
+                return row[0] if row else -1
+        except Exception as e:
+            logger.error(f"获取写入版本号失败: {e}")
+            return -1
+
+    def _invalidate_counts(self):
+        """写入后清空文章数量缓存"""
+        with self._count_lock:
+            self._count_cache.clear()
     
     def get_all_sources(self) -> List[str]:
         """
@@ -454,7 +924,8 @@ class Database:
             category=row['category'] or '综合',
             priority=row['priority'] or 5,
             tags=json.loads(row['tags']) if row['tags'] else [],
-            translated=bool(row['translated'])
+            translated=bool(row['translated']),
+            story_id=row['story_id'] or ''
         )
 
 
@@ -0,0 +1,151 @@
+"""
+HTTP 条件请求缓存模块
+
+按 URL 持久化 ETag、Last-Modified 和响应体哈希，用于发送条件请求，
+内容未变化时抓取器可以跳过解析和后续入库流程。
+
+校验信息必须在内容成功入库后才写入：否则解析或入库失败时，下次抓取会被当作
+“未变化”跳过，这批条目在源站更新之前再也不会入库。
+"""
+import hashlib
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import ContextManager, Dict, Optional
+
+from src.storage.connection_pool import get_pool
+from src.utils.config import get_settings
+from src.utils.logger import logger
+
+
+def body_hash(body: bytes) -> str:
+    """计算响应体哈希"""
+    return hashlib.sha1(body).hexdigest()
+
+
+class HttpCacheStore:
+    """HTTP 校验信息存储"""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        初始化校验信息存储
+
+        Args:
+            db_path: 数据库文件路径，默认与新闻数据库相同
+        """
+        self.settings = get_settings()
+        self.db_path = db_path or self.settings.database_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = get_pool(self.db_path)
+        self._init_table()
+
+    def _get_connection(self) -> ContextManager[sqlite3.Connection]:
+        """从共享连接池借用数据库连接（退出 with 时提交并归还）"""
+        return self._pool.connection()
+
+    def _init_table(self):
+        """初始化校验信息表"""
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS http_validators (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    body_hash TEXT,
+                    updated_at TIMESTAMP NOT NULL
+                )
+            """)
+
+    def get(self, url: str) -> Optional[Dict[str, str]]:
+        """
+        获取 URL 的校验信息
+
+        Args:
+            url: 请求 URL
+
+        Returns:
+            包含 etag、last_modified、body_hash 的字典，不存在则返回 None
+        """
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    "SELECT etag, last_modified, body_hash FROM http_validators WHERE url = ?",
+                    (url,)
+                ).fetchone()
+                return dict(row) if row else None
+        except Exception as e:
+            logger.error(f"读取 HTTP 校验信息失败: {e}")
+            return None
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        生成条件请求头
+
+        Args:
+            url: 请求 URL
+
+        Returns:
+            If-None-Match / If-Modified-Since 请求头，没有校验信息时为空字典
+        """
+        validator = self.get(url)
+        if not validator:
+            return {}
+
+        headers = {}
+        if validator['etag']:
+            headers['If-None-Match'] = validator['etag']
+        if validator['last_modified']:
+            headers['If-Modified-Since'] = validator['last_modified']
+        return headers
+
+    def is_unchanged(self, url: str, digest: str) -> bool:
+        """
+        响应体是否与上次入库时相同
+
+        Args:
+            url: 请求 URL
+            digest: 响应体哈希（body_hash）
+
+        Returns:
+            是否未变化
+        """
+        previous = self.get(url)
+        return previous is not None and previous['body_hash'] == digest
+
+    def update(self, url: str, etag: Optional[str], last_modified: Optional[str], digest: str) -> None:
+        """
+        记录一次完整响应的校验信息（内容成功入库后调用）
+
+        Args:
+            url: 请求 URL
+            etag: 响应头 ETag
+            last_modified: 响应头 Last-Modified
+            digest: 响应体哈希（body_hash）
+        """
+        try:
+            with self._get_connection() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO http_validators (url, etag, last_modified, body_hash, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (url, etag, last_modified, digest, datetime.now()))
+        except Exception as e:
+            logger.error(f"保存 HTTP 校验信息失败: {e}")
+
+    def clear(self) -> int:
+        """
+        清空所有校验信息（清理新闻后需要调用，否则未变化的源不会重新入库）
+
+        Returns:
+            删除的数量
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.execute("DELETE FROM http_validators")
+                return cursor.rowcount
+        except Exception as e:
+            logger.error(f"清空 HTTP 校验信息失败: {e}")
+            return 0
+
+
+# 全局校验信息存储实例
+http_cache = HttpCacheStore()
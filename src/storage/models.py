@@ -3,6 +3,7 @@
 
 定义新闻数据的结构
 """
+import json
 from datetime import datetime
 from typing import List
 
@@ -34,6 +35,9 @@ class NewsArticle(BaseModel):
     # 翻译状态
     translated: bool = Field(default=False, description="是否已翻译")
 
+    # 报道聚类（跨新闻源的同一事件共享同一 ID）
+    story_id: str = Field(default="", description="报道聚类 ID")
+
     @classmethod
     def from_dict(cls, data: dict, fetcher=None) -> "NewsArticle":
         """
@@ -61,6 +65,7 @@ class NewsArticle(BaseModel):
             priority=data.get('priority', 5),
             tags=data.get('tags', []),
             translated=data.get('translated', False),
+            story_id=data.get('story_id', ''),
         )
 
     class Config:
@@ -80,3 +85,58 @@ class NewsArticle(BaseModel):
                 "tags": ["breaking", "politics"]
             }
         }
+
+
+class ArticleView:
+    """
+    只读文章视图
+
+    列表类查询只读取需要的列，直接由数据库行构造，不做 pydantic 校验；
+    未查询的列不会被设置，访问时抛出 AttributeError。
+    """
+
+    __slots__ = (
+        'id', 'title', 'title_zh', 'title_en', 'content', 'content_zh', 'content_en',
+        'source', 'url', 'published_at', 'fetched_at', 'category', 'priority', 'tags',
+        'translated', 'story_id', 'needs_translation',
+    )
+
+    # 可由数据库计算的派生列
+    COMPUTED = {
+        'needs_translation': "(COALESCE(title_zh, '') = '' OR COALESCE(content_zh, '') = '')",
+    }
+
+    def __init__(self, row):
+        """
+        由数据库行构造视图
+
+        Args:
+            row: sqlite3.Row，不在 __slots__ 中的列会被忽略
+        """
+        for key in row.keys():
+            if key in _VIEW_FIELDS:
+                value = row[key]
+                convert = _VIEW_CONVERTERS.get(key)
+                object.__setattr__(
+                    self, key, convert(value) if convert else (value if value is not None else '')
+                )
+
+    def __setattr__(self, key, value):
+        raise AttributeError("ArticleView 为只读对象")
+
+    def __repr__(self) -> str:
+        return f"ArticleView(id={getattr(self, 'id', None)!r}, title={getattr(self, 'title', None)!r})"
+
+
+_VIEW_FIELDS = frozenset(ArticleView.__slots__)
+
+# 与 Database._row_to_article 一致的取值转换，未列出的列 None 转为空字符串
+_VIEW_CONVERTERS = {
+    'published_at': datetime.fromisoformat,
+    'fetched_at': datetime.fromisoformat,
+    'tags': lambda value: json.loads(value) if value else [],
+    'translated': bool,
+    'needs_translation': bool,
+    'category': lambda value: value or '综合',
+    'priority': lambda value: value or 5,
+}
@@ -0,0 +1,230 @@
+"""
+全文搜索索引模块
+
+基于 SQLite FTS5 的中英文全文索引，与 articles 表共用 rowid。
+unicode61 分词器不会切分连续的中文，因此写入前在中日韩文字之间插入空格（逐字成词），
+查询时同样切分并按短语匹配，相当于中文的连续子串搜索；英文按单词匹配。
+索引由 Database 在写入文章的同一事务中同步更新；articles 表的 rowid 不是显式主键，
+VACUUM 后可能变化，需要调用 rebuild 重建。
+"""
+import html
+import re
+import sqlite3
+from typing import Dict, Iterable, List, Optional
+
+# 中日韩文字（与近似重复检测的切分范围一致）
+_CJK = '\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af'
+_CJK_CHAR = re.compile(f'([{_CJK}])')
+
+# 摘要高亮标记（私有区字符，不会出现在正文中，转义 HTML 后再替换为标签）
+_MARK_START, _MARK_END = '\ue000', '\ue001'
+_SEGMENT_SPACE = re.compile(f'(?<=[{_CJK}{_MARK_START}{_MARK_END}]) +(?=[{_CJK}{_MARK_START}{_MARK_END}])')
+_EXTRA_SPACE = re.compile(r' {2,}')
+
+# 各列权重：标题 > 标签 > 内容
+_BM25_WEIGHTS = (10.0, 1.0, 5.0)
+
+
+def segment(text: str) -> str:
+    """
+    切分文本供 FTS5 索引（中日韩文字逐字加空格）
+
+    Args:
+        text: 原文
+
+    Returns:
+        切分后的文本
+    """
+    return _CJK_CHAR.sub(r' \1 ', text) if text else ''
+
+
+def build_match_query(query: str) -> str:
+    """
+    将用户输入转换为 FTS5 MATCH 表达式
+
+    每个空白分隔的词作为一个短语，所有短语都需命中；
+    双引号被转义，用户输入不会被解析为 FTS5 语法。
+
+    Args:
+        query: 用户输入
+
+    Returns:
+        MATCH 表达式，没有有效词时返回空字符串
+    """
+    phrases = []
+    for term in query.split():
+        term = ' '.join(segment(term).split())
+        if term:
+            phrases.append('"' + term.replace('"', '""') + '"')
+    return ' '.join(phrases)
+
+
+def _render_snippet(snippet: str) -> str:
+    """去掉切分时插入的空格，转义 HTML 并把高亮标记换成 <mark> 标签"""
+    text = html.escape(_EXTRA_SPACE.sub(' ', _SEGMENT_SPACE.sub('', snippet or '')))
+    return text.replace(_MARK_START, '<mark>').replace(_MARK_END, '</mark>')
+
+
+# 参与索引的文章列
+_SOURCE_COLUMNS = "rowid, title, title_zh, title_en, content, content_zh, content_en, tags"
+
+
+def _document(row: sqlite3.Row) -> tuple:
+    """文章行转换为索引文档（标题、内容、标签三列）"""
+    titles = ' '.join(filter(None, (row['title'], row['title_zh'], row['title_en'])))
+    contents = ' '.join(filter(None, (row['content'], row['content_zh'], row['content_en'])))
+    return row['rowid'], segment(titles), segment(contents), segment(row['tags'] or '')
+
+
+class SearchIndex:
+    """全文搜索索引（所有方法使用调用方传入的连接，参与调用方的事务）"""
+
+    TABLE = 'articles_fts'
+
+    def init(self, conn: sqlite3.Connection) -> None:
+        """
+        创建索引表，首次创建时为已有文章建立索引
+
+        Args:
+            conn: 数据库连接
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (self.TABLE,)
+        ).fetchone()
+        conn.execute(f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {self.TABLE} USING fts5(
+                title, content, tags,
+                tokenize = 'unicode61 remove_diacritics 2'
+            )
+        """)
+        if not exists:
+            self.rebuild(conn)
+
+    def rebuild(self, conn: sqlite3.Connection) -> int:
+        """
+        重建全部索引
+
+        Args:
+            conn: 数据库连接
+
+        Returns:
+            建立索引的文章数量
+        """
+        conn.execute(f"DELETE FROM {self.TABLE}")
+        rows = conn.execute(f"SELECT {_SOURCE_COLUMNS} FROM articles")
+        cursor = conn.executemany(
+            f"INSERT INTO {self.TABLE} (rowid, title, content, tags) VALUES (?, ?, ?, ?)",
+            (_document(row) for row in rows)
+        )
+        return cursor.rowcount
+
+    @staticmethod
+    def _source_rows(conn: sqlite3.Connection, article_ids: Iterable[str]) -> Dict[str, sqlite3.Row]:
+        """读取文章参与索引的列（文章 ID -> 行）"""
+        ids = list(article_ids)
+        rows: Dict[str, sqlite3.Row] = {}
+        # 分批查询，避免超出 SQLite 参数数量上限
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            cursor = conn.execute(f"""
+                SELECT id, {_SOURCE_COLUMNS}
+                FROM articles WHERE id IN ({','.join('?' * len(chunk))})
+            """, chunk)
+            rows.update((row['id'], row) for row in cursor)
+        return rows
+
+    def snapshot(self, conn: sqlite3.Connection, article_ids: Iterable[str]) -> Dict[str, tuple]:
+        """
+        记录文章写入前参与索引的列，供 index_articles 跳过没有变化的文章
+
+        Args:
+            conn: 数据库连接
+            article_ids: 文章 ID 列表
+
+        Returns:
+            文章 ID -> 列值（不存在的文章不包含）
+        """
+        return {article_id: tuple(row) for article_id, row in self._source_rows(conn, article_ids).items()}
+
+    def index_articles(
+        self,
+        conn: sqlite3.Connection,
+        article_ids: Iterable[str],
+        previous: Optional[Dict[str, tuple]] = None,
+    ) -> int:
+        """
+        同步指定文章的索引（新增或更新后调用）
+
+        Args:
+            conn: 数据库连接
+            article_ids: 文章 ID 列表
+            previous: 写入前的 snapshot，提供时只重建标题、内容、标签有变化的文章
+
+        Returns:
+            重建索引的文章数量
+        """
+        rows = [
+            row for article_id, row in self._source_rows(conn, article_ids).items()
+            if previous is None or previous.get(article_id) != tuple(row)
+        ]
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {self.TABLE} (rowid, title, content, tags) VALUES (?, ?, ?, ?)",
+            [_document(row) for row in rows]
+        )
+        return len(rows)
+
+    def clear(self, conn: sqlite3.Connection) -> None:
+        """
+        清空索引
+
+        Args:
+            conn: 数据库连接
+        """
+        conn.execute(f"DELETE FROM {self.TABLE}")
+
+    def search(
+        self,
+        conn: sqlite3.Connection,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        source: str = '',
+    ) -> List[Dict]:
+        """
+        搜索文章，按 bm25 相关度排序
+
+        Args:
+            conn: 数据库连接
+            query: 用户输入的查询
+            limit: 返回数量
+            offset: 偏移量
+            source: 筛选新闻源
+
+        Returns:
+            结果列表，每项包含 row（文章行）、snippet（HTML 摘要）和 score（越小越相关）
+        """
+        match = build_match_query(query)
+        if not match:
+            return []
+
+        source_clause = "AND a.source = ?" if source else ""
+        params = [_MARK_START, _MARK_END, match] + ([source] if source else []) + [limit, offset]
+        rows = conn.execute(f"""
+            SELECT a.*,
+                   snippet({self.TABLE}, -1, ?, ?, '…', 24) AS search_snippet,
+                   bm25({self.TABLE}, {', '.join(map(str, _BM25_WEIGHTS))}) AS search_score
+            FROM {self.TABLE}
+            JOIN articles a ON a.rowid = {self.TABLE}.rowid
+            WHERE {self.TABLE} MATCH ? {source_clause}
+            ORDER BY search_score
+            LIMIT ? OFFSET ?
+        """, params).fetchall()
+
+        return [
+            {'row': row, 'snippet': _render_snippet(row['search_snippet']), 'score': row['search_score']}
+            for row in rows
+        ]
+
+
+# 全局搜索索引实例
+search_index = SearchIndex()
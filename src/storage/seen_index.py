@@ -0,0 +1,186 @@
+"""
+已见条目索引模块
+
+按新闻源记录近期已入库文章的 URL 哈希（内存字典 + SQLite 持久化），
+抓取器据此在构造模型和写库之前丢弃已知条目，稳态下只处理新文章。
+
+每个哈希记录最近一次见到的时间：仍在源中出现的条目会刷新时间，不会过期；
+超过保留天数没再出现的条目在访问时从内存和数据库中清除，长时间运行的进程内存不会无限增长。
+"""
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, Iterable, Optional
+
+from src.storage.connection_pool import get_pool
+from src.utils.config import get_settings
+from src.utils.helpers import generate_id
+from src.utils.logger import logger
+
+# 同一新闻源清除过期条目的最短间隔
+_PRUNE_INTERVAL = timedelta(hours=1)
+
+# 已见条目再次出现时，距上次记录超过该时间才写回数据库（避免每次抓取都逐条写库）
+_REFRESH_AFTER = timedelta(days=1)
+
+
+class SeenIndex:
+    """已见条目索引"""
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        retention_days: Optional[int] = None,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        """
+        初始化已见条目索引
+
+        Args:
+            db_path: 数据库文件路径，默认与新闻数据库相同
+            retention_days: 条目保留天数（自最近一次见到起），默认读取配置 SEEN_INDEX_RETENTION_DAYS
+            clock: 时钟函数（测试时可替换）
+        """
+        self.settings = get_settings()
+        self.db_path = db_path or self.settings.database_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = get_pool(self.db_path)
+        self.retention_days = retention_days or self.settings.seen_index_retention_days
+        self.clock = clock
+        # 按新闻源懒加载的 URL 哈希 -> 最近一次见到的时间
+        self._cache: Dict[str, Dict[str, datetime]] = {}
+        # 各新闻源上次清除过期条目的时间
+        self._pruned_at: Dict[str, datetime] = {}
+        self._lock = threading.Lock()
+        self._init_table()
+
+    def _get_connection(self) -> ContextManager[sqlite3.Connection]:
+        """从共享连接池借用数据库连接（退出 with 时提交并归还）"""
+        return self._pool.connection()
+
+    def _init_table(self):
+        """初始化索引表"""
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS seen_entries (
+                    source TEXT NOT NULL,
+                    url_hash TEXT NOT NULL,
+                    seen_at TIMESTAMP NOT NULL,
+                    PRIMARY KEY (source, url_hash)
+                ) WITHOUT ROWID
+            """)
+
+    def _cutoff(self, now: datetime) -> datetime:
+        """过期时间点：此前最后见到的条目视为过期"""
+        return now - timedelta(days=self.retention_days)
+
+    def _load(self, source: str, now: datetime) -> Dict[str, datetime]:
+        """加载新闻源的索引，并按间隔清除过期条目（调用方需持有锁）"""
+        hashes = self._cache.get(source)
+        pruned_at = self._pruned_at.get(source)
+        if hashes is not None and pruned_at is not None and now - pruned_at < _PRUNE_INTERVAL:
+            return hashes
+
+        cutoff = self._cutoff(now)
+        try:
+            with self._get_connection() as conn:
+                conn.execute(
+                    "DELETE FROM seen_entries WHERE source = ? AND seen_at < ?", (source, cutoff)
+                )
+                if hashes is None:
+                    rows = conn.execute(
+                        "SELECT url_hash, seen_at FROM seen_entries WHERE source = ?", (source,)
+                    ).fetchall()
+                    hashes = {row[0]: datetime.fromisoformat(row[1]) for row in rows}
+        except Exception as e:
+            logger.error(f"加载已见条目索引失败 ({source}): {e}")
+
+        if hashes is None:
+            hashes = {}
+        else:
+            for url_hash in [key for key, seen_at in hashes.items() if seen_at < cutoff]:
+                del hashes[url_hash]
+        self._cache[source] = hashes
+        self._pruned_at[source] = now
+        return hashes
+
+    def _save(self, source: str, hashes: Iterable[str], now: datetime) -> bool:
+        """写入（或刷新）条目最近一次见到的时间"""
+        try:
+            with self._get_connection() as conn:
+                conn.executemany("""
+                    INSERT INTO seen_entries (source, url_hash, seen_at) VALUES (?, ?, ?)
+                    ON CONFLICT(source, url_hash) DO UPDATE SET seen_at = excluded.seen_at
+                """, [(source, url_hash, now) for url_hash in hashes])
+            return True
+        except Exception as e:
+            logger.error(f"保存已见条目索引失败 ({source}): {e}")
+            return False
+
+    def contains(self, source: str, url: str) -> bool:
+        """
+        判断 URL 是否已见（已见时记为再次见到，刷新其过期时间）
+
+        Args:
+            source: 新闻源名称
+            url: 文章 URL
+
+        Returns:
+            是否已见
+        """
+        if not url:
+            return False
+        now = self.clock()
+        url_hash = generate_id(url)
+        with self._lock:
+            hashes = self._load(source, now)
+            seen_at = hashes.get(url_hash)
+            if seen_at is None or seen_at < self._cutoff(now):
+                return False
+            if now - seen_at >= _REFRESH_AFTER and self._save(source, [url_hash], now):
+                hashes[url_hash] = now
+            return True
+
+    def mark(self, source: str, urls: Iterable[str]) -> int:
+        """
+        将 URL 标记为已见（应在成功入库后调用），已有的条目刷新见到时间
+
+        Args:
+            source: 新闻源名称
+            urls: 文章 URL 列表
+
+        Returns:
+            新增的数量
+        """
+        now = self.clock()
+        with self._lock:
+            hashes = self._load(source, now)
+            marked = {generate_id(url) for url in urls if url}
+            if not marked or not self._save(source, marked, now):
+                return 0
+            new_count = len(marked - hashes.keys())
+            hashes.update(dict.fromkeys(marked, now))
+            return new_count
+
+    def clear(self) -> int:
+        """
+        清空索引（清理新闻后需要调用，否则旧条目不会重新入库）
+
+        Returns:
+            删除的数量
+        """
+        with self._lock:
+            self._cache.clear()
+            self._pruned_at.clear()
+            try:
+                with self._get_connection() as conn:
+                    cursor = conn.execute("DELETE FROM seen_entries")
+                    return cursor.rowcount
+            except Exception as e:
+                logger.error(f"清空已见条目索引失败: {e}")
+                return 0
+
+
+# 全局已见条目索引实例
+seen_index = SeenIndex()
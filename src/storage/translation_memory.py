@@ -0,0 +1,204 @@
+"""
+翻译记忆模块
+
+按“规范化文本哈希 + 语言对”持久化翻译结果（SQLite），前面加一层进程内 LRU。
+热搜标题、通讯社稿件的转载等重复文本只需翻译一次。
+"""
+import hashlib
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import ContextManager, Iterable, Optional, Tuple
+
+from src.storage.connection_pool import get_pool
+from src.utils.config import get_settings
+from src.utils.logger import logger
+
+
+def normalize_text(text: str) -> str:
+    """
+    规范化文本（NFKC + 合并空白），空白或全半角差异不影响命中
+
+    Args:
+        text: 原文
+
+    Returns:
+        规范化后的文本
+    """
+    return ' '.join(unicodedata.normalize('NFKC', text).split())
+
+
+def memory_key(text: str, source_lang: str, target_lang: str) -> str:
+    """
+    生成翻译记忆键
+
+    Args:
+        text: 原文
+        source_lang: 源语言
+        target_lang: 目标语言
+
+    Returns:
+        键（语言对 + 规范化文本的 SHA-1）
+    """
+    digest = hashlib.sha1(normalize_text(text).encode('utf-8')).hexdigest()
+    return f"{source_lang}:{target_lang}:{digest}"
+
+
+class TranslationMemory:
+    """翻译记忆（线程安全）"""
+
+    def __init__(self, db_path: Optional[Path] = None, cache_size: Optional[int] = None):
+        """
+        初始化翻译记忆
+
+        Args:
+            db_path: 数据库文件路径，默认与新闻数据库相同
+            cache_size: 内存 LRU 条目数，默认读取配置 TRANSLATION_CACHE_SIZE
+        """
+        self.settings = get_settings()
+        self.db_path = db_path or self.settings.database_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = get_pool(self.db_path)
+        self.cache_size = cache_size or self.settings.translation_cache_size
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._init_table()
+
+    def _get_connection(self) -> ContextManager[sqlite3.Connection]:
+        """从共享连接池借用数据库连接（退出 with 时提交并归还）"""
+        return self._pool.connection()
+
+    def _init_table(self):
+        """初始化翻译记忆表"""
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS translation_memory (
+                    key TEXT PRIMARY KEY,
+                    translation TEXT NOT NULL,
+                    translator TEXT,
+                    created_at TIMESTAMP NOT NULL
+                ) WITHOUT ROWID
+            """)
+
+    def _remember(self, key: str, translation: str) -> None:
+        """写入内存 LRU（调用方需持有锁）"""
+        self._cache[key] = translation
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def get(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """
+        查询翻译记忆
+
+        Args:
+            text: 原文
+            source_lang: 源语言
+            target_lang: 目标语言
+
+        Returns:
+            已有的译文，没有则返回 None
+        """
+        key = memory_key(text, source_lang, target_lang)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        try:
+            with self._get_connection() as conn:
+                row = conn.execute(
+                    "SELECT translation FROM translation_memory WHERE key = ?", (key,)
+                ).fetchone()
+        except Exception as e:
+            logger.error(f"查询翻译记忆失败: {e}")
+            return None
+
+        if row is None:
+            return None
+        with self._lock:
+            self._remember(key, row[0])
+        return row[0]
+
+    def put(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        translation: str,
+        translator: str = '',
+    ) -> None:
+        """
+        保存译文（空译文不保存）
+
+        Args:
+            text: 原文
+            source_lang: 源语言
+            target_lang: 目标语言
+            translation: 译文
+            translator: 翻译器名称
+        """
+        if not translation:
+            return
+        key = memory_key(text, source_lang, target_lang)
+        with self._lock:
+            self._remember(key, translation)
+        try:
+            with self._get_connection() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO translation_memory (key, translation, translator, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, translation, translator, datetime.now())
+                )
+        except Exception as e:
+            logger.error(f"保存翻译记忆失败: {e}")
+
+    def put_many(self, entries: Iterable[Tuple[str, str, str, str, str]]) -> None:
+        """
+        批量保存译文（同一事务写入，空译文不保存）
+
+        Args:
+            entries: (原文, 源语言, 目标语言, 译文, 翻译器名称) 列表
+        """
+        rows = []
+        now = datetime.now()
+        with self._lock:
+            for text, source_lang, target_lang, translation, translator in entries:
+                if translation:
+                    key = memory_key(text, source_lang, target_lang)
+                    self._remember(key, translation)
+                    rows.append((key, translation, translator, now))
+        if not rows:
+            return
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO translation_memory (key, translation, translator, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows
+                )
+        except Exception as e:
+            logger.error(f"保存翻译记忆失败: {e}")
+
+    def clear(self) -> int:
+        """
+        清空翻译记忆
+
+        Returns:
+            删除的数量
+        """
+        with self._lock:
+            self._cache.clear()
+        try:
+            with self._get_connection() as conn:
+                return conn.execute("DELETE FROM translation_memory").rowcount
+        except Exception as e:
+            logger.error(f"清空翻译记忆失败: {e}")
+            return 0
+
+
+# 全局翻译记忆实例
+translation_memory = TranslationMemory()
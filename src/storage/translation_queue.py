@@ -0,0 +1,288 @@
+"""
+翻译队列模块
+
+持久化的文章翻译工作队列（SQLite），所有翻译入口共用：
+- 新文章保存时入队，网页批量翻译、定时补漏也只是入队
+- 工作线程以租约方式领取：领取后状态为 leased，租约到期未完成（进程崩溃等）会被重新领取；
+  完成、重试只对仍由自己持有租约的文章生效，租约已被他人接手的文章交给新的领取者处理
+- 失败按指数退避重试，超过最大尝试次数后标记为 failed
+
+状态流转：pending -> leased -> done / pending（退避重试）/ failed
+"""
+import sqlite3
+import time
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, Iterable, List, Optional
+
+from src.storage.connection_pool import get_pool
+from src.utils.config import get_settings
+from src.utils.logger import logger
+
+PENDING = 'pending'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+
+# 退避重试的最长间隔（秒）
+_MAX_RETRY_DELAY = 3600
+
+
+class TranslationQueue:
+    """文章翻译队列（多线程、多进程共享同一数据库文件）"""
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        lease_seconds: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+        retry_delay: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        初始化翻译队列
+
+        Args:
+            db_path: 数据库文件路径，默认与新闻数据库相同
+            lease_seconds: 租约时长（秒），默认读取配置 TRANSLATION_LEASE_SECONDS
+            max_attempts: 最大尝试次数，默认读取配置 TRANSLATION_MAX_ATTEMPTS
+            retry_delay: 首次重试间隔（秒），之后每次翻倍，默认读取配置 TRANSLATION_RETRY_DELAY
+            clock: 时钟函数（测试时可替换）
+        """
+        settings = get_settings()
+        self.db_path = db_path or settings.database_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = get_pool(self.db_path)
+        self.lease_seconds = lease_seconds or settings.translation_lease_seconds
+        self.max_attempts = max_attempts or settings.translation_max_attempts
+        self.retry_delay = settings.translation_retry_delay if retry_delay is None else retry_delay
+        self.clock = clock
+        self._init_table()
+
+    def _get_connection(self) -> ContextManager[sqlite3.Connection]:
+        """从共享连接池借用数据库连接（退出 with 时提交并归还）"""
+        return self._pool.connection()
+
+    def _init_table(self):
+        """初始化队列表"""
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS translation_queue (
+                    article_id TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    available_at REAL NOT NULL,
+                    lease_owner TEXT,
+                    lease_until REAL,
+                    job_id TEXT,
+                    last_error TEXT,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_translation_queue_state
+                ON translation_queue(state, available_at)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_translation_queue_job
+                ON translation_queue(job_id)
+            """)
+
+    def enqueue(self, article_ids: Iterable[str], job_id: str = '', reopen: bool = False) -> int:
+        """
+        文章入队
+
+        已在队列中的文章不会重复入队；指定任务 ID（用户主动发起的翻译）时，
+        已完成或已放弃的文章重新入队，等待退避重试的文章立即可领取。
+
+        Args:
+            article_ids: 文章 ID
+            job_id: 任务 ID，用于查询一批文章的进度
+            reopen: 已完成的文章重新入队（调用方确认文章仍未翻译时使用，如原文更新后译文被清空）
+
+        Returns:
+            新入队或重新入队的数量
+        """
+        ids = list(dict.fromkeys(article_ids))
+        if not ids:
+            return 0
+
+        now = self.clock()
+        with self._get_connection() as conn:
+            before = conn.total_changes
+            if job_id:
+                conn.executemany("""
+                    INSERT INTO translation_queue (article_id, state, available_at, job_id, updated_at)
+                    VALUES (?, 'pending', ?, ?, ?)
+                    ON CONFLICT(article_id) DO UPDATE SET
+                        job_id = excluded.job_id,
+                        state = CASE WHEN state = 'leased' THEN state ELSE 'pending' END,
+                        attempts = CASE WHEN state = 'leased' THEN attempts ELSE 0 END,
+                        available_at = excluded.available_at,
+                        updated_at = excluded.updated_at
+                """, [(article_id, now, job_id, now) for article_id in ids])
+            elif reopen:
+                conn.executemany("""
+                    INSERT INTO translation_queue (article_id, state, available_at, updated_at)
+                    VALUES (?, 'pending', ?, ?)
+                    ON CONFLICT(article_id) DO UPDATE SET
+                        state = 'pending', attempts = 0,
+                        available_at = excluded.available_at, updated_at = excluded.updated_at
+                    WHERE state = 'done'
+                """, [(article_id, now, now) for article_id in ids])
+            else:
+                conn.executemany("""
+                    INSERT OR IGNORE INTO translation_queue (article_id, state, available_at, updated_at)
+                    VALUES (?, 'pending', ?, ?)
+                """, [(article_id, now, now) for article_id in ids])
+            return conn.total_changes - before
+
+    def lease(self, owner: str, limit: int = 10) -> List[str]:
+        """
+        领取一批可处理的文章（单条 UPDATE 语句完成，多个工作者不会领到同一篇）
+
+        可领取：到了重试时间的 pending，以及租约已过期的 leased。领取即计一次尝试。
+
+        Args:
+            owner: 领取者标识
+            limit: 最多领取数量
+
+        Returns:
+            领到的文章 ID
+        """
+        now = self.clock()
+        with self._get_connection() as conn:
+            rows = conn.execute("""
+                UPDATE translation_queue
+                SET state = 'leased', lease_owner = ?, lease_until = ?,
+                    attempts = attempts + 1, updated_at = ?
+                WHERE article_id IN (
+                    SELECT article_id FROM translation_queue
+                    WHERE (state = 'pending' AND available_at <= ?)
+                       OR (state = 'leased' AND lease_until < ?)
+                    ORDER BY available_at
+                    LIMIT ?
+                )
+                RETURNING article_id
+            """, (owner, now + self.lease_seconds, now, now, now, limit)).fetchall()
+        return [row[0] for row in rows]
+
+    def claim(self, article_id: str, owner: str) -> bool:
+        """
+        领取指定文章（单篇即时翻译时使用），其他工作者持有有效租约时失败
+
+        Args:
+            article_id: 文章 ID
+            owner: 领取者标识
+
+        Returns:
+            是否领取成功
+        """
+        now = self.clock()
+        with self._get_connection() as conn:
+            cursor = conn.execute("""
+                INSERT INTO translation_queue
+                    (article_id, state, attempts, available_at, lease_owner, lease_until, updated_at)
+                VALUES (?, 'leased', 1, ?, ?, ?, ?)
+                ON CONFLICT(article_id) DO UPDATE SET
+                    state = 'leased', attempts = attempts + 1,
+                    lease_owner = excluded.lease_owner, lease_until = excluded.lease_until,
+                    updated_at = excluded.updated_at
+                WHERE NOT (state = 'leased' AND lease_until >= excluded.available_at)
+            """, (article_id, now, owner, now + self.lease_seconds, now))
+            return cursor.rowcount == 1
+
+    def complete(self, article_ids: Iterable[str], owner: str) -> int:
+        """
+        标记文章翻译完成（跳过租约已不属于 owner 的文章）
+
+        Args:
+            article_ids: 文章 ID
+            owner: 领取者标识
+
+        Returns:
+            标记完成的数量
+        """
+        now = self.clock()
+        with self._get_connection() as conn:
+            before = conn.total_changes
+            conn.executemany("""
+                UPDATE translation_queue
+                SET state = 'done', lease_owner = NULL, lease_until = NULL, last_error = NULL, updated_at = ?
+                WHERE article_id = ? AND lease_owner = ?
+            """, [(now, article_id, owner) for article_id in article_ids])
+            return conn.total_changes - before
+
+    def retry(self, article_id: str, owner: str, error: str = '') -> Optional[str]:
+        """
+        翻译失败：按指数退避重新排队，尝试次数用尽时标记为 failed
+
+        Args:
+            article_id: 文章 ID
+            owner: 领取者标识
+            error: 错误信息
+
+        Returns:
+            更新后的状态；租约已不属于 owner 时不做修改，返回 None
+        """
+        now = self.clock()
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT attempts FROM translation_queue WHERE article_id = ? AND lease_owner = ?",
+                (article_id, owner),
+            ).fetchone()
+            if row is None:
+                logger.debug(f"租约已不属于 {owner}，跳过重试 [{article_id}]")
+                return None
+            attempts = row[0]
+            if attempts >= self.max_attempts:
+                state, available_at = FAILED, now
+                logger.warning(f"文章翻译失败 {attempts} 次，放弃 [{article_id}]: {error}")
+            else:
+                delay = min(self.retry_delay * 2 ** max(attempts - 1, 0), _MAX_RETRY_DELAY)
+                state, available_at = PENDING, now + delay
+            conn.execute("""
+                UPDATE translation_queue
+                SET state = ?, available_at = ?, lease_owner = NULL, lease_until = NULL,
+                    last_error = ?, updated_at = ?
+                WHERE article_id = ? AND lease_owner = ?
+            """, (state, available_at, error, now, article_id, owner))
+        return state
+
+    def job_counts(self, job_id: str) -> Dict[str, int]:
+        """
+        统计任务中各状态的文章数
+
+        Args:
+            job_id: 任务 ID
+
+        Returns:
+            状态 -> 数量，任务不存在时为空字典
+        """
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                "SELECT state, COUNT(*) FROM translation_queue WHERE job_id = ? GROUP BY state", (job_id,)
+            ).fetchall()
+        return {state: count for state, count in rows}
+
+    def stats(self) -> Dict[str, int]:
+        """
+        统计队列中各状态的文章数
+
+        Returns:
+            状态 -> 数量
+        """
+        with self._get_connection() as conn:
+            rows = conn.execute("SELECT state, COUNT(*) FROM translation_queue GROUP BY state").fetchall()
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        counts.update({state: count for state, count in rows})
+        return counts
+
+    def clear(self) -> int:
+        """
+        清空队列（清理新闻时使用）
+
+        Returns:
+            删除的条目数
+        """
+        with self._get_connection() as conn:
+            return conn.execute("DELETE FROM translation_queue").rowcount
@@ -3,10 +3,18 @@
 
 管理和选择可用的翻译器
 """
-from typing import Optional
+import functools
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
+from src.storage.translation_memory import TranslationMemory, translation_memory
 from src.translators.base import BaseTranslator
 from src.translators.google import GoogleTranslator
+from src.translators.health import HealthTracker, language_pair
+from src.translators.segmenter import join_translations, split_text, strip_segment
+from src.utils.config import get_settings
 from src.utils.logger import logger
 
 # 暂时禁用 FreeTranslator 以避免依赖冲突
@@ -16,10 +24,40 @@ FREE_TRANSLATOR_AVAILABLE = False
 class TranslatorManager:
     """翻译器管理器"""
     
-    def __init__(self):
-        """初始化翻译器管理器"""
+    def __init__(
+        self,
+        memory: Optional[TranslationMemory] = None,
+        health: Optional[HealthTracker] = None,
+        translators: Optional[Sequence[BaseTranslator]] = None,
+        hedge: Optional[bool] = None,
+    ):
+        """
+        初始化翻译器管理器
+
+        Args:
+            memory: 翻译记忆，默认使用全局实例
+            health: 健康跟踪，默认新建
+            translators: 使用的翻译器，默认按配置加载所有可用的翻译器
+            hedge: 是否启用对冲请求，默认读取配置 TRANSLATOR_HEDGE_ENABLED
+        """
+        self.memory = memory or translation_memory
+        self.health = health or HealthTracker()
         self.translators = []
-        self._init_translators()
+        if translators is None:
+            self._init_translators()
+        else:
+            self.translators = list(translators)
+        settings = get_settings()
+        self.hedge = settings.translator_hedge_enabled if hedge is None else hedge
+        # 每个翻译器同时进行的请求数上限（调度器、网页请求和后台翻译任务共享）
+        self._slots = {
+            translator.name: threading.BoundedSemaphore(settings.translator_max_concurrency)
+            for translator in self.translators
+        }
+        # 对冲请求与长文本分段并行翻译使用的线程池（实际并发受上面的名额限制）
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(4, 2 * len(self.translators)), thread_name_prefix='translator'
+        )
     
     def _init_translators(self):
         """初始化所有可用的翻译器"""
@@ -117,23 +155,249 @@ class TranslatorManager:
         if not self.translators:
             logger.error("没有可用的翻译器！请检查 API 配置")
     
-    def get_translator(self) -> Optional[BaseTranslator]:
+    def _ranked_translators(self, pair: str = '') -> List[BaseTranslator]:
+        """按观测到的健康状况与耗时排序的翻译器列表（不发起网络请求）"""
+        by_name = {translator.name: translator for translator in self.translators}
+        return [by_name[name] for name in self.health.rank(list(by_name), pair)]
+
+    def _candidates(self, pair: str) -> Iterator[BaseTranslator]:
+        """依次产出可调用的翻译器（跳过熔断中的，取出时才占用半开探测名额）"""
+        for translator in self._ranked_translators(pair):
+            if self.health.allow(translator.name):
+                yield translator
+            else:
+                logger.debug(f"翻译器 {translator.name} 熔断中，跳过")
+
+    def _timed(self, translator: BaseTranslator, method: Callable, *args) -> Tuple[object, float, str]:
+        """
+        在翻译器的并发名额内调用其方法
+
+        Returns:
+            (返回值, 耗时, 错误信息)，异常时返回值为 None；耗时不含排队等待
         """
-        获取第一个可用的翻译器
+        with self._slots[translator.name]:
+            started = time.monotonic()
+            try:
+                return method(*args), time.monotonic() - started, ''
+            except Exception as e:
+                return None, time.monotonic() - started, str(e)
+
+    def _call(self, translator: BaseTranslator, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """调用单个翻译器并记录耗时与结果（异常和空结果都视为失败，返回 None）"""
+        pair = language_pair(source_lang, target_lang)
+        logger.info(f"尝试使用翻译器: {translator.name}")
+        result, latency, error = self._timed(translator, translator.translate, text, source_lang, target_lang)
+        if result:
+            self.health.record_success(translator.name, latency, pair)
+            return result
+        self.health.record_failure(translator.name, latency, error or "空结果", pair)
+        if error:
+            logger.warning(f"翻译器 {translator.name} 失败: {error}，正在尝试下一个翻译器...")
+        else:
+            logger.warning(f"翻译器 {translator.name} 返回空结果，正在尝试下一个翻译器...")
+        return None
+
+    def _route(self, text: str, source_lang: str, target_lang: str) -> Optional[Tuple[BaseTranslator, str]]:
+        """按预期耗时依次尝试翻译器，直到成功"""
+        for translator in self._candidates(language_pair(source_lang, target_lang)):
+            result = self._call(translator, text, source_lang, target_lang)
+            if result:
+                return translator, result
+        return None
+
+    def _route_hedged(self, text: str, source_lang: str, target_lang: str) -> Optional[Tuple[BaseTranslator, str]]:
+        """
+        对冲路由：请求最快的翻译器，超过其 p95 耗时仍未返回时同时请求下一个，
+        采用最先成功的结果；失败时立即换下一个。未被采用的请求在后台完成，结果仍计入统计。
+        """
+        pair = language_pair(source_lang, target_lang)
+        candidates = self._candidates(pair)
+        running = {}
+        exhausted = False
+
+        def launch() -> None:
+            nonlocal exhausted
+            translator = next(candidates, None)
+            if translator is None:
+                exhausted = True
+                return
+            running[self._executor.submit(self._call, translator, text, source_lang, target_lang)] = translator
+
+        launch()
+        while running:
+            timeout = None
+            if len(running) == 1 and not exhausted:
+                (current,) = running.values()
+                timeout = self.health.hedge_delay(current.name, pair)
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                logger.info(f"翻译器 {current.name} 超过 {timeout:.2f} 秒未返回，同时请求下一个翻译器")
+                launch()
+                continue
+            for future in done:
+                translator = running.pop(future)
+                result = future.result()
+                if result:
+                    return translator, result
+            if not running:
+                launch()
+        return None
+
+    def get_translator(self, source_lang: str = "en", target_lang: str = "zh") -> Optional[BaseTranslator]:
+        """
+        获取当前最健康的翻译器（根据历史调用统计选择，不发起网络请求）
+
+        Args:
+            source_lang: 源语言
+            target_lang: 目标语言
         
         Returns:
-            翻译器实例，如果没有可用的返回 None
+            翻译器实例，如果全部处于熔断中返回 None
         """
-        for translator in self.translators:
-            if translator.is_available():
+        for translator in self._ranked_translators(language_pair(source_lang, target_lang)):
+            if self.health.available(translator.name):
                 return translator
         
         logger.error("没有可用的翻译器")
         return None
+
+    def health_snapshot(self) -> List[Dict]:
+        """
+        获取各翻译器的健康状态（按英译中的当前选择顺序排列）
+
+        Returns:
+            健康状态列表
+        """
+        return self.health.snapshot(
+            [translator.name for translator in self._ranked_translators(language_pair("en", "zh"))]
+        )
+
+    @staticmethod
+    def _batches(texts: Sequence[str], translator: BaseTranslator) -> Iterator[List[str]]:
+        """按翻译器的批量上限（条数与字符数）分组，超长的单条文本独立成组"""
+        batch, size = [], 0
+        for text in texts:
+            if batch and (len(batch) >= translator.max_batch_items or size + len(text) > translator.max_batch_chars):
+                yield batch
+                batch, size = [], 0
+            batch.append(text)
+            size += len(text)
+        if batch:
+            yield batch
+
+    def _translate_batch(
+        self, translator: BaseTranslator, batch: List[str], source_lang: str, target_lang: str
+    ) -> Dict[str, str]:
+        """调用一次翻译器的批量接口并记录结果，返回成功的原文到译文映射"""
+        pair = language_pair(source_lang, target_lang)
+        # 并行的其他批次已触发熔断时不再请求
+        if self.health.is_open(translator.name):
+            return {}
+        translations, elapsed, error = self._timed(
+            translator, translator.translate_batch, batch, source_lang, target_lang
+        )
+        # 结果数量与原文不一致时无法确定对应关系，整批按失败处理
+        if translations is not None and len(translations) != len(batch):
+            error = error or f"结果数量不一致（{len(translations)}/{len(batch)}）"
+            translations = None
+        # 耗时按条均摊，与单条翻译的统计可比
+        latency = elapsed / len(batch)
+        succeeded = {text: result for text, result in zip(batch, translations or []) if result}
+        if succeeded:
+            self.health.record_success(translator.name, latency, pair)
+        else:
+            self.health.record_failure(translator.name, latency, error or "空结果", pair)
+            logger.warning(f"翻译器 {translator.name} 批量翻译失败: {error or '空结果'}")
+        return succeeded
+
+    def _translate_group(self, texts: List[str], source_lang: str, target_lang: str) -> Dict[str, str]:
+        """
+        批量翻译同一语言对的文本：按预期耗时依次使用翻译器，超出翻译器长度上限的正文
+        按句子分段，所有段落按批量上限分组后并行请求，再按原顺序拼回；
+        有段落失败的文本交给下一个翻译器
+
+        Returns:
+            原文到译文的映射（失败的不包含）
+        """
+        pair = language_pair(source_lang, target_lang)
+        done: Dict[str, str] = {}
+        remaining = texts
+        for translator in self._candidates(pair):
+            segments = {text: split_text(text, translator.max_text_chars) for text in remaining}
+            pieces = list(dict.fromkeys(
+                core for parts in segments.values() for _, core, _ in map(strip_segment, parts) if core
+            ))
+            logger.info(
+                f"批量翻译 {len(remaining)} 条（{len(pieces)} 段，{pair}），使用翻译器: {translator.name}"
+            )
+
+            batches = list(self._batches(pieces, translator))
+            translated: Dict[str, str] = {}
+            if len(batches) == 1:
+                translated.update(self._translate_batch(translator, batches[0], source_lang, target_lang))
+            else:
+                translate_batch = functools.partial(
+                    self._translate_batch, translator, source_lang=source_lang, target_lang=target_lang
+                )
+                for succeeded in self._executor.map(translate_batch, batches):
+                    translated.update(succeeded)
+
+            finished = {}
+            for text, parts in segments.items():
+                cores = [strip_segment(part)[1] for part in parts]
+                if all(not core or core in translated for core in cores):
+                    finished[text] = join_translations(parts, [translated.get(core, '') for core in cores])
+            if finished:
+                done.update(finished)
+                self.memory.put_many(
+                    (text, source_lang, target_lang, result, translator.name) for text, result in finished.items()
+                )
+
+            remaining = [text for text in remaining if text not in done]
+            if not remaining:
+                break
+        return done
+
+    def translate_many(self, items: Sequence[Tuple[str, str, str]]) -> List[Optional[str]]:
+        """
+        批量翻译：先查翻译记忆，未命中的去重后按语言对分组，
+        通过翻译器的批量接口打包请求（一页文章只需少量请求）
+
+        Args:
+            items: (文本, 源语言, 目标语言) 列表
+
+        Returns:
+            与 items 一一对应的翻译结果，空文本为空字符串，失败为 None
+        """
+        results: List[Optional[str]] = [None] * len(items)
+        # (源语言, 目标语言) -> 原文 -> 在 items 中的位置
+        pending: Dict[Tuple[str, str], Dict[str, List[int]]] = {}
+        for index, (text, source_lang, target_lang) in enumerate(items):
+            if not text or not text.strip():
+                results[index] = ""
+                continue
+            cached = self.memory.get(text, source_lang, target_lang)
+            if cached is not None:
+                results[index] = cached
+                continue
+            pending.setdefault((source_lang, target_lang), {}).setdefault(text, []).append(index)
+
+        for (source_lang, target_lang), positions in pending.items():
+            translated = self._translate_group(list(positions), source_lang, target_lang)
+            for text, indexes in positions.items():
+                for index in indexes:
+                    results[index] = translated.get(text)
+            if len(translated) < len(positions):
+                logger.error(f"批量翻译有 {len(positions) - len(translated)} 条失败 ({source_lang}-{target_lang})")
+        return results
+
+    def close(self) -> None:
+        """关闭线程池"""
+        self._executor.shutdown(wait=False)
     
     def translate(self, text: str, source_lang: str = "en", target_lang: str = "zh") -> Optional[str]:
         """
-        翻译文本（自动选择可用的翻译器）
+        翻译文本（优先查询翻译记忆，未命中时自动选择可用的翻译器）
         
         Args:
             text: 要翻译的文本
@@ -145,20 +409,25 @@ class TranslatorManager:
         """
         if not text or not text.strip():
             return ""
+
+        # 先查翻译记忆，命中则不调用任何翻译服务
+        cached = self.memory.get(text, source_lang, target_lang)
+        if cached is not None:
+            logger.debug(f"翻译记忆命中: {text[:50]}")
+            return cached
+
+        # 超出任一翻译器长度上限的正文走分段批量翻译
+        if len(text) > min((translator.max_text_chars for translator in self.translators), default=len(text)):
+            return self.translate_many([(text, source_lang, target_lang)])[0]
         
-        # 尝试使用每个翻译器
-        for translator in self.translators:
-            try:
-                logger.info(f"尝试使用翻译器: {translator.name}")
-                result = translator.translate(text, source_lang, target_lang)
-                if result:
-                    logger.info(f"翻译完成: {text[:50]}")
-                    return result
-                else:
-                    logger.warning(f"翻译器 {translator.name} 返回空结果，正在尝试下一个翻译器...")
-            except Exception as e:
-                logger.warning(f"翻译器 {translator.name} 失败: {e}，正在尝试下一个翻译器...")
-                continue
+        # 按各翻译器在该语言对上的预期耗时选择，跳过熔断中的翻译器
+        route = self._route_hedged if self.hedge else self._route
+        routed = route(text, source_lang, target_lang)
+        if routed:
+            translator, result = routed
+            logger.info(f"翻译完成: {text[:50]}")
+            self.memory.put(text, source_lang, target_lang, result, translator.name)
+            return result
         
         logger.error(f"所有翻译器都失败了: {text[:50]}")
         return None
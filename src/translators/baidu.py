@@ -7,7 +7,6 @@ from typing import Optional
 import hashlib
 import requests
 import random
-import time
 
 from src.translators.base import BaseTranslator
 from src.utils.config import get_settings
@@ -18,6 +17,12 @@ class BaiduTranslator(BaseTranslator):
     """百度翻译器"""
     
     API_URL = "https://fanyi-api.baidu.com/api/trans/vip/translate"
+
+    # 标准版 QPS 上限为 10
+    rate_limit = 10.0
+
+    # 单次请求不超过 6000 字节
+    max_text_chars = 2000
     
     def __init__(self):
         super().__init__("百度翻译")
@@ -159,13 +164,5 @@ class BaiduTranslator(BaseTranslator):
         if not self.translator:
             return [None] * len(texts)
         
-        results = []
-        for i, text in enumerate(texts):
-            result = self.translate(text, source_lang, target_lang)
-            results.append(result)
-            
-            # 百度翻译 API QPS 限制为 10 次/秒
-            if i < len(texts) - 1:
-                time.sleep(0.2)
-        
-        return results
+        # 逐条请求的速率由 rate_limit 控制
+        return [self.translate(text, source_lang, target_lang) for text in texts]
@@ -3,14 +3,42 @@
 
 所有翻译服务的基类
 """
+import functools
+import time
 from abc import ABC, abstractmethod
 from typing import Optional
 
+from src.translators.rate_limit import TokenBucket, rate_limiters
 from src.utils.logger import logger
 
 
 class BaseTranslator(ABC):
     """翻译器基类"""
+
+    # 单次批量请求的最大条数与总字符数（支持批量接口的翻译器覆盖，默认逐条翻译）
+    max_batch_items: int = 1
+    max_batch_chars: int = 5000
+
+    # 单条文本的最大字符数，更长的正文由 TranslatorManager 按句子分段后翻译
+    max_text_chars: int = 5000
+
+    # 默认限速（次/秒），None 表示不限速；可用配置 TRANSLATOR_RATE_LIMITS 按名称覆盖
+    rate_limit: Optional[float] = None
+
+    def __init_subclass__(cls, **kwargs):
+        """子类的 translate 自动经过限速（空文本不发请求，不消耗令牌）"""
+        super().__init_subclass__(**kwargs)
+        translate = cls.__dict__.get('translate')
+        if translate is None or getattr(translate, '__wrapped__', None):
+            return
+
+        @functools.wraps(translate)
+        def limited(self, text, *args, **kwargs):
+            if text and text.strip():
+                self.throttle()
+            return translate(self, text, *args, **kwargs)
+
+        cls.translate = limited
     
     def __init__(self, name: str):
         """
@@ -20,6 +48,24 @@ class BaseTranslator(ABC):
             name: 翻译器名称
         """
         self.name = name
+
+    @property
+    def limiter(self) -> Optional[TokenBucket]:
+        """该翻译服务的令牌桶（同名翻译器共享），不限速时为 None"""
+        return rate_limiters.get(self.name, self.rate_limit)
+
+    def throttle(self, requests: int = 1) -> None:
+        """
+        按服务允许的速率等待（直接发请求的批量接口应在请求前调用）
+
+        Args:
+            requests: 即将发出的请求数
+        """
+        limiter = self.limiter
+        if limiter is not None:
+            waited = limiter.acquire(requests)
+            if waited > 0:
+                logger.debug(f"[{self.name}] 限速等待 {waited:.2f} 秒")
     
     @abstractmethod
     def translate(self, text: str, source_lang: str = "en", target_lang: str = "zh") -> Optional[str]:
@@ -43,7 +89,10 @@ class BaseTranslator(ABC):
         target_lang: str = "zh"
     ) -> list[Optional[str]]:
         """
-        批量翻译文本
+        批量翻译文本（默认逐条调用 translate，有批量接口的翻译器应覆盖）
+
+        TranslatorManager.translate_many 会按 max_batch_items / max_batch_chars 分组后调用，
+        返回结果与输入一一对应，失败的条目为 None
         
         Args:
             texts: 文本列表
@@ -59,9 +108,23 @@ class BaseTranslator(ABC):
             results.append(result)
         return results
     
+    def backoff(self, seconds: float) -> None:
+        """
+        服务端返回限流响应时退避：暂停该服务的令牌桶，所有调用方一起等待（不限速时直接等待）
+
+        Args:
+            seconds: 退避秒数
+        """
+        limiter = self.limiter
+        if limiter is None:
+            time.sleep(seconds)
+        else:
+            limiter.pause(seconds)
+    
     def is_available(self) -> bool:
         """
-        检查翻译服务是否可用
+        主动检查翻译服务是否可用（会发起一次真实的翻译请求，
+        日常选择翻译器请使用 TranslatorManager 的被动健康统计）
         
         Returns:
             是否可用
@@ -13,6 +13,12 @@ from src.utils.proxy import get_proxies
 
 class BingTranslator(BaseTranslator):
     """Bing 翻译器"""
+
+    # 免费接口，控制请求频率避免被封
+    rate_limit = 2.0
+
+    # 单次请求的文本长度上限
+    max_text_chars = 3000
     
     def __init__(self):
         super().__init__("Bing")
@@ -14,6 +14,16 @@ from src.utils.logger import logger
 
 class DeepLTranslator(BaseTranslator):
     """DeepL 翻译器"""
+
+    # 免费 API 频率过高会返回 429
+    rate_limit = 5.0
+
+    # 单次请求的文本长度上限
+    max_text_chars = 30000
+
+    # 批量接口单次请求的条数上限（请求体上限 128 KiB）
+    max_batch_items = 50
+    max_batch_chars = 30000
     
     def __init__(self):
         super().__init__("DeepL")
@@ -115,6 +125,7 @@ class DeepLTranslator(BaseTranslator):
             source = lang_map.get(source_lang, source_lang.upper())
             target = lang_map.get(target_lang, target_lang.upper())
             
+            self.throttle()
             results = self.translator.translate_text(
                 texts,
                 source_lang=source,
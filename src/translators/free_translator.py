@@ -4,7 +4,6 @@
 使用开源翻译库，如 googletrans (Google Translate 免费接口)
 """
 from typing import Optional
-import time
 
 try:
     from googletrans import Translator
@@ -19,6 +18,12 @@ from src.utils.logger import logger
 
 class FreeTranslator(BaseTranslator):
     """免费翻译器（使用 googletrans 库）"""
+
+    # 非官方接口，控制请求频率避免被封
+    rate_limit = 1.0
+
+    # 单次请求的文本长度上限
+    max_text_chars = 4500
     
     def __init__(self):
         super().__init__("Free Translator")
@@ -101,13 +106,5 @@ class FreeTranslator(BaseTranslator):
             logger.error(f"[{self.name}] 翻译器不可用：缺少 googletrans 库")
             return [None] * len(texts)
         
-        results = []
-        for i, text in enumerate(texts):
-            result = self.translate(text, source_lang, target_lang)
-            results.append(result)
-            
-            # 避免请求过于频繁
-            if i < len(texts) - 1:
-                time.sleep(1)
-        
-        return results
\ No newline at end of file
+        # 逐条请求的速率由 rate_limit 控制
+        return [self.translate(text, source_lang, target_lang) for text in texts]
\ No newline at end of file
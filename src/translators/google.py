@@ -6,14 +6,26 @@ Google 翻译器
 from typing import Optional
 import requests
 import json
-import time
+import re
 
 from src.translators.base import BaseTranslator
 from src.utils.logger import logger
 
+# 批量翻译时各段之间的分隔行（独立成行的符号翻译后会原样保留）
+_BATCH_SEPARATOR = "\n§§§\n"
+_BATCH_SPLIT = re.compile(r'\s*§\s*§\s*§\s*')
+
 
 class GoogleTranslator(BaseTranslator):
     """Google 翻译器（使用免费 API）"""
+
+    # 免费接口使用 GET 请求，限制总字符数避免 URL 过长（中文 URL 编码后约 9 字节/字）
+    max_batch_items = 50
+    max_batch_chars = 1500
+    max_text_chars = 1500
+
+    # 免费接口频率过高会返回 429
+    rate_limit = 1.0
     
     def __init__(self):
         super().__init__("Google Translate")
@@ -62,6 +74,9 @@ class GoogleTranslator(BaseTranslator):
         retry_delay = 2
         
         for attempt in range(max_retries):
+            if attempt:
+                # 重试同样经过限速（退避期间令牌桶已暂停）
+                self.throttle()
             try:
                 # Google Translate 参数
                 params = {
@@ -83,7 +98,8 @@ class GoogleTranslator(BaseTranslator):
                 # 检查是否是 429 错误
                 if response.status_code == 429:
                     logger.warning(f"[{self.name}] 请求过于频繁，正在重试 ({attempt+1}/{max_retries})...")
-                    time.sleep(retry_delay * (2 ** attempt))  # 指数退避
+                    retry_after = response.headers.get('Retry-After', '')
+                    self.backoff(float(retry_after) if retry_after.isdigit() else retry_delay * (2 ** attempt))
                     continue
                 
                 response.raise_for_status()
@@ -107,7 +123,7 @@ class GoogleTranslator(BaseTranslator):
             except requests.RequestException as e:
                 if "429" in str(e):
                     logger.warning(f"[{self.name}] 请求过于频繁，正在重试 ({attempt+1}/{max_retries})...")
-                    time.sleep(retry_delay * (2 ** attempt))  # 指数退避
+                    self.backoff(retry_delay * (2 ** attempt))  # 指数退避
                     continue
                 logger.error(f"[{self.name}] 网络请求失败: {e}")
                 return None
@@ -128,7 +144,7 @@ class GoogleTranslator(BaseTranslator):
         target_lang: str = "zh"
     ) -> list[Optional[str]]:
         """
-        批量翻译
+        批量翻译（多段文本用分隔行拼成一次请求，再按分隔行拆回）
         
         Args:
             texts: 文本列表
@@ -138,13 +154,17 @@ class GoogleTranslator(BaseTranslator):
         Returns:
             翻译结果列表
         """
-        results = []
-        for i, text in enumerate(texts):
-            result = self.translate(text, source_lang, target_lang)
-            results.append(result)
-            
-            # 避免请求过快
-            if i < len(texts) - 1:
-                time.sleep(5)  # 增加延迟时间，避免429错误
-        
-        return results
+        if len(texts) <= 1:
+            return [self.translate(text, source_lang, target_lang) for text in texts]
+
+        packed = self.translate(_BATCH_SEPARATOR.join(texts), source_lang, target_lang)
+        if not packed:
+            return [None] * len(texts)
+
+        parts = [part.strip() for part in _BATCH_SPLIT.split(packed)]
+        if len(parts) == len(texts):
+            return parts
+
+        # 分隔行被改写时无法对齐结果，退回逐条翻译
+        logger.warning(f"[{self.name}] 批量结果无法按分隔行拆分 ({len(parts)}/{len(texts)})，改为逐条翻译")
+        return [self.translate(text, source_lang, target_lang) for text in texts]
@@ -0,0 +1,305 @@
+"""
+翻译服务健康跟踪模块
+
+被动记录每个翻译器真实调用的成功、失败和耗时，不发起任何探测请求。
+
+路由统计按“翻译器 + 语言对”分别维护耗时与错误率的指数加权移动平均（EWMA），
+按预期耗时（平均耗时 + 错误率 × 失败代价）选择最快的翻译器；
+耗时偏差的 EWMA 用于估算 p95 耗时，作为对冲请求的等待时间。
+
+每个翻译器另有一个熔断器：
+- closed：正常使用，连续失败达到阈值后熔断（open）
+- open：冷却期内跳过该翻译器
+- half_open：冷却期结束后放行一次真实调用作为探测，成功恢复 closed，失败重新 open
+"""
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+from src.utils.config import get_settings
+from src.utils.logger import logger
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# EWMA 平滑系数（越大越看重最近的调用）
+_ALPHA = 0.2
+
+# 一次失败的额外代价（秒），约等于等待超时再换下一个翻译器的时间
+_FAILURE_PENALTY = 5.0
+
+# 估算 p95 时使用的偏差倍数（平均绝对偏差约为 0.8 倍标准差，2 倍约合 1.6σ）
+_P95_DEVIATIONS = 2.0
+
+# 样本不足时的对冲等待时间（秒）
+_DEFAULT_HEDGE_DELAY = 2.0
+_MIN_HEDGE_SAMPLES = 5
+
+
+@dataclass
+class RouteStats:
+    """翻译器在某个语言对上的耗时与错误率统计"""
+
+    samples: int = 0
+    latency: float = 0.0
+    deviation: float = 0.0
+    error_rate: float = 0.0
+
+    def record(self, latency: float, ok: bool) -> None:
+        """记录一次调用（失败的调用只更新错误率，超时等耗时不代表正常响应速度）"""
+        self.error_rate += _ALPHA * ((0.0 if ok else 1.0) - self.error_rate)
+        if not ok:
+            return
+        if self.samples == 0:
+            self.latency, self.deviation = latency, latency / 2
+        else:
+            self.deviation += _ALPHA * (abs(latency - self.latency) - self.deviation)
+            self.latency += _ALPHA * (latency - self.latency)
+        self.samples += 1
+
+    @property
+    def cost(self) -> float:
+        """预期耗时（秒）"""
+        return self.latency + self.error_rate * _FAILURE_PENALTY
+
+    @property
+    def p95(self) -> Optional[float]:
+        """估算的 p95 耗时，样本不足时返回 None"""
+        if self.samples < _MIN_HEDGE_SAMPLES:
+            return None
+        return self.latency + _P95_DEVIATIONS * self.deviation
+
+    def to_dict(self) -> Dict:
+        """转换为字典（用于接口输出）"""
+        return {
+            'samples': self.samples,
+            'latency': round(self.latency, 3),
+            'p95': round(self.p95, 3) if self.p95 is not None else None,
+            'error_rate': round(self.error_rate, 3),
+        }
+
+
+@dataclass
+class ProviderHealth:
+    """单个翻译器的熔断状态与调用计数"""
+
+    name: str
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    last_latency: Optional[float] = None
+    state: str = CLOSED
+    opened_at: float = 0.0
+    probing: bool = False
+    last_error: str = ''
+    routes: Dict[str, RouteStats] = field(default_factory=dict)
+
+    def route(self, pair: str) -> RouteStats:
+        """获取语言对的统计，不存在时创建"""
+        stats = self.routes.get(pair)
+        if stats is None:
+            stats = self.routes[pair] = RouteStats()
+        return stats
+
+    def to_dict(self) -> Dict:
+        """转换为字典（用于接口输出）"""
+        return {
+            'name': self.name,
+            'state': self.state,
+            'successes': self.successes,
+            'failures': self.failures,
+            'consecutive_failures': self.consecutive_failures,
+            'last_latency': round(self.last_latency, 3) if self.last_latency is not None else None,
+            'last_error': self.last_error,
+            'routes': {pair: stats.to_dict() for pair, stats in self.routes.items()},
+        }
+
+
+def language_pair(source_lang: str, target_lang: str) -> str:
+    """语言对键"""
+    return f"{source_lang}-{target_lang}"
+
+
+class HealthTracker:
+    """翻译器健康跟踪、路由与熔断（线程安全）"""
+
+    def __init__(
+        self,
+        failure_threshold: Optional[int] = None,
+        cooldown: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        初始化健康跟踪
+
+        Args:
+            failure_threshold: 连续失败多少次后熔断，默认读取配置 TRANSLATOR_FAILURE_THRESHOLD
+            cooldown: 熔断冷却时间（秒），默认读取配置 TRANSLATOR_COOLDOWN_SECONDS
+            clock: 时钟函数（测试时可替换）
+        """
+        settings = get_settings()
+        self.failure_threshold = failure_threshold or settings.translator_failure_threshold
+        self.cooldown = settings.translator_cooldown_seconds if cooldown is None else cooldown
+        self.clock = clock
+        self._health: Dict[str, ProviderHealth] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, name: str) -> ProviderHealth:
+        """获取健康状态，不存在时创建（调用方需持有锁）"""
+        health = self._health.get(name)
+        if health is None:
+            health = self._health[name] = ProviderHealth(name)
+        return health
+
+    def allow(self, name: str) -> bool:
+        """
+        判断是否允许调用翻译器（冷却结束时放行一次探测调用）
+
+        Args:
+            name: 翻译器名称
+
+        Returns:
+            是否允许
+        """
+        with self._lock:
+            health = self._get(name)
+            if health.state == CLOSED:
+                return True
+            if health.state == OPEN and self.clock() - health.opened_at >= self.cooldown:
+                health.state = HALF_OPEN
+                health.probing = False
+            if health.state == HALF_OPEN and not health.probing:
+                health.probing = True
+                logger.info(f"[{name}] 熔断冷却结束，放行一次探测调用")
+                return True
+            return False
+
+    def available(self, name: str) -> bool:
+        """
+        判断翻译器当前是否可选（只读，不占用探测名额）
+
+        Args:
+            name: 翻译器名称
+
+        Returns:
+            未熔断或冷却已结束时返回 True
+        """
+        with self._lock:
+            health = self._get(name)
+            if health.state == OPEN:
+                return self.clock() - health.opened_at >= self.cooldown
+            return not (health.state == HALF_OPEN and health.probing)
+
+    def is_open(self, name: str) -> bool:
+        """
+        判断翻译器是否处于熔断中（冷却未结束）
+
+        Args:
+            name: 翻译器名称
+
+        Returns:
+            是否熔断
+        """
+        with self._lock:
+            health = self._get(name)
+            return health.state == OPEN and self.clock() - health.opened_at < self.cooldown
+
+    def record_success(self, name: str, latency: float, pair: str = '') -> None:
+        """
+        记录一次成功调用
+
+        Args:
+            name: 翻译器名称
+            latency: 耗时（秒）
+            pair: 语言对（见 language_pair）
+        """
+        with self._lock:
+            health = self._get(name)
+            health.successes += 1
+            health.consecutive_failures = 0
+            health.last_latency = latency
+            health.route(pair).record(latency, ok=True)
+            if health.state != CLOSED:
+                logger.info(f"[{name}] 探测成功，恢复使用")
+            health.state = CLOSED
+            health.probing = False
+
+    def record_failure(self, name: str, latency: float, error: str = '', pair: str = '') -> None:
+        """
+        记录一次失败调用（异常或空结果）
+
+        Args:
+            name: 翻译器名称
+            latency: 耗时（秒）
+            error: 错误信息
+            pair: 语言对（见 language_pair）
+        """
+        with self._lock:
+            health = self._get(name)
+            health.failures += 1
+            health.consecutive_failures += 1
+            health.last_latency = latency
+            health.last_error = error
+            health.route(pair).record(latency, ok=False)
+            if health.state == HALF_OPEN or health.consecutive_failures >= self.failure_threshold:
+                if health.state != OPEN:
+                    logger.warning(
+                        f"[{name}] 连续失败 {health.consecutive_failures} 次，熔断 {self.cooldown:.0f} 秒"
+                    )
+                health.state = OPEN
+                health.opened_at = self.clock()
+                health.probing = False
+
+    def rank(self, names: Sequence[str], pair: str = '') -> List[str]:
+        """
+        按观测到的健康状况排序：熔断中的排在最后，其余按该语言对的预期耗时从低到高；
+        没有调用记录的翻译器预期耗时为 0（优先尝试一次以获得数据），相同时保持原有顺序
+
+        Args:
+            names: 翻译器名称（按配置优先级排列）
+            pair: 语言对
+
+        Returns:
+            排序后的名称列表
+        """
+        state_order = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+        with self._lock:
+            keys = {}
+            for index, name in enumerate(names):
+                health = self._get(name)
+                stats = health.routes.get(pair)
+                keys[name] = (state_order[health.state], stats.cost if stats else 0.0, index)
+        return sorted(names, key=keys.__getitem__)
+
+    def hedge_delay(self, name: str, pair: str = '') -> float:
+        """
+        对冲等待时间：超过该翻译器在此语言对上的 p95 耗时仍未返回时，同时请求下一个翻译器
+
+        Args:
+            name: 翻译器名称
+            pair: 语言对
+
+        Returns:
+            等待时间（秒），样本不足时使用默认值
+        """
+        with self._lock:
+            stats = self._get(name).routes.get(pair)
+            p95 = stats.p95 if stats else None
+        return _DEFAULT_HEDGE_DELAY if p95 is None else p95
+
+    def snapshot(self, names: Optional[Sequence[str]] = None) -> List[Dict]:
+        """
+        获取翻译器的健康状态
+
+        Args:
+            names: 翻译器名称，默认为所有记录过的翻译器
+
+        Returns:
+            健康状态列表
+        """
+        with self._lock:
+            if names is None:
+                names = list(self._health)
+            return [self._get(name).to_dict() for name in names]
@@ -14,6 +14,12 @@ from src.utils.proxy import get_proxies
 
 class LibreTranslator(BaseTranslator):
     """LibreTranslate 翻译器"""
+
+    # 公共实例有频率限制
+    rate_limit = 1.0
+
+    # 单次请求的文本长度上限
+    max_text_chars = 2000
     
     def __init__(self):
         super().__init__("LibreTranslate")
@@ -18,6 +18,16 @@ class MicrosoftTranslator(BaseTranslator):
     
     API_URL = "https://api.cognitive.microsofttranslator.com/translate"
     API_VERSION = "3.0"
+
+    # 免费层按字符计费，同时限制请求频率
+    rate_limit = 10.0
+
+    # 单次请求的文本长度上限
+    max_text_chars = 10000
+
+    # 批量接口单次请求的条数与字符数上限
+    max_batch_items = 100
+    max_batch_chars = 10000
     
     def __init__(self):
         super().__init__("微软翻译")
@@ -164,8 +174,9 @@ class MicrosoftTranslator(BaseTranslator):
                 'X-ClientTraceId': str(uuid.uuid4())
             }
             
-            body = [{'text': text} for text in texts[:100]]  # 限制 100 个
+            body = [{'text': text} for text in texts[:self.max_batch_items]]
             
+            self.throttle()
             response = requests.post(
                 endpoint,
                 params=params,
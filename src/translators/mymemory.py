@@ -13,6 +13,12 @@ from src.utils.proxy import get_proxies
 
 class MyMemoryTranslator(BaseTranslator):
     """MyMemory 翻译器"""
+
+    # 匿名使用有频率限制
+    rate_limit = 1.0
+
+    # 匿名接口单次最多约 500 字节
+    max_text_chars = 450
     
     def __init__(self):
         super().__init__("MyMemory")
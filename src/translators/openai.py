@@ -4,7 +4,7 @@ OpenAI 翻译器
 使用 OpenAI API 进行翻译
 """
 from typing import Optional
-import time
+import json
 
 from openai import OpenAI
 
@@ -15,6 +15,17 @@ from src.utils.logger import logger
 
 class OpenAITranslator(BaseTranslator):
     """OpenAI 翻译器"""
+
+    # 按账户等级限制每分钟请求数
+    rate_limit = 3.0
+
+    # 译文受 max_tokens 限制
+    max_text_chars = 3000
+
+    # 多段文本放在同一个提示词中翻译；整批译文（含 JSON 引号、分隔符）需在 max_tokens=4000 以内，
+    # 中文译文约每字一个 token，原文字数按此留出余量
+    max_batch_items = 20
+    max_batch_chars = 3000
     
     def __init__(self):
         super().__init__("OpenAI")
@@ -124,7 +135,7 @@ class OpenAITranslator(BaseTranslator):
         target_lang: str = "zh"
     ) -> list[Optional[str]]:
         """
-        批量翻译（逐个翻译以确保质量）
+        批量翻译（多段文本以 JSON 数组放入一个提示词，要求按相同顺序返回 JSON 数组）
         
         Args:
             texts: 文本列表
@@ -134,14 +145,73 @@ class OpenAITranslator(BaseTranslator):
         Returns:
             翻译结果列表
         """
-        results = []
-        for i, text in enumerate(texts):
-            logger.info(f"[{self.name}] 翻译进度: {i+1}/{len(texts)}")
-            result = self.translate(text, source_lang, target_lang)
-            results.append(result)
-            
-            # 添加延迟避免速率限制
-            if i < len(texts) - 1:
-                time.sleep(0.5)
+        if not self.client:
+            logger.error("OpenAI 客户端未初始化")
+            return [None] * len(texts)
+
+        if len(texts) <= 1:
+            return [self.translate(text, source_lang, target_lang) for text in texts]
         
-        return results
+        lang_map = {
+            "en": "英文",
+            "zh": "中文",
+            "ja": "日文",
+            "ko": "韩文",
+        }
+        source_lang_name = lang_map.get(source_lang, source_lang)
+        target_lang_name = lang_map.get(target_lang, target_lang)
+
+        prompt = f"""请将下面 JSON 数组中的每一段{source_lang_name}新闻分别翻译成{target_lang_name}。
+要求：
+1. 保持专业术语的准确性
+2. 保持新闻的客观性和中立性
+3. 确保翻译流畅自然
+4. 不要添加任何解释或评论
+5. 只输出一个 JSON 字符串数组，元素个数和顺序与原文数组完全一致
+
+原文：
+{json.dumps(texts, ensure_ascii=False)}"""
+
+        try:
+            self.throttle()
+            response = self.client.chat.completions.create(
+                model=self.settings.openai_model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "你是一个专业的新闻翻译助手，擅长准确、客观地翻译新闻内容。"
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                temperature=0.3,
+                max_tokens=4000
+            )
+        except Exception as e:
+            logger.error(f"[{self.name}] 批量翻译失败: {e}", exc_info=True)
+            return [None] * len(texts)
+
+        choice = response.choices[0]
+        content = (choice.message.content or '').strip()
+        translations = None
+        if choice.finish_reason == 'length':
+            logger.warning(f"[{self.name}] 批量译文超出 max_tokens 被截断")
+        else:
+            try:
+                # 去掉可能包裹的 Markdown 代码块
+                translations = json.loads(content[content.find('['):content.rfind(']') + 1])
+            except ValueError as e:
+                logger.warning(f"[{self.name}] 批量结果无法解析: {e}")
+
+        if not isinstance(translations, list) or len(translations) != len(texts):
+            logger.warning(f"[{self.name}] 批量结果不完整，改为逐条翻译")
+            return [self.translate(text, source_lang, target_lang) for text in texts]
+
+        logger.debug(f"[{self.name}] 批量翻译成功: {len(texts)} 条")
+        # 非字符串元素（如 JSON null）视为该段翻译失败
+        return [
+            translation.strip() or None if isinstance(translation, str) else None
+            for translation in translations
+        ]
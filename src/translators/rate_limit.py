@@ -0,0 +1,141 @@
+"""
+翻译服务限速模块
+
+每个翻译服务一个令牌桶，进程内所有调用方（调度器、网页请求、后台翻译任务）共享。
+采用预约方式：取令牌时立即扣减（可以透支），按透支量计算需要等待的时间后在锁外等待，
+请求按到达顺序以服务允许的速率发出，不会多等。
+同一个桶可在线程中（acquire）和协程中（acquire_async）使用。
+"""
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from src.utils.config import get_settings
+from src.utils.logger import logger
+
+
+class TokenBucket:
+    """令牌桶（线程安全）"""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        初始化令牌桶
+
+        Args:
+            rate: 每秒补充的令牌数（即允许的平均请求速率）
+            capacity: 桶容量（允许的突发请求数），默认为 1
+            clock: 时钟函数（测试时可替换）
+        """
+        self.rate = rate
+        self.capacity = max(capacity or 1.0, 1.0)
+        self.clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """按经过的时间补充令牌（调用方需持有锁）"""
+        now = self.clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        预约令牌
+
+        Args:
+            tokens: 需要的令牌数
+
+        Returns:
+            需要等待的秒数（0 表示可以立即发出请求）
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        获取令牌，必要时阻塞等待
+
+        Args:
+            tokens: 需要的令牌数
+
+        Returns:
+            实际等待的秒数
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """
+        获取令牌（协程版本，等待时不阻塞事件循环）
+
+        Args:
+            tokens: 需要的令牌数
+
+        Returns:
+            实际等待的秒数
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """
+        暂停发放令牌（服务端返回 429 等限流响应时调用，所有调用方一起退避）
+
+        Args:
+            seconds: 暂停秒数
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class RateLimiters:
+    """按翻译器名称管理令牌桶（线程安全）"""
+
+    def __init__(self):
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str, default_rate: Optional[float] = None) -> Optional[TokenBucket]:
+        """
+        获取翻译器的令牌桶，首次获取时按配置创建
+
+        Args:
+            name: 翻译器名称
+            default_rate: 翻译器默认速率（次/秒），可被配置 TRANSLATOR_RATE_LIMITS 覆盖
+
+        Returns:
+            令牌桶，不限速时返回 None
+        """
+        with self._lock:
+            if name not in self._buckets:
+                settings = get_settings()
+                rate = settings.translator_rate_limits.get(name, default_rate)
+                bucket = None
+                if rate and rate > 0:
+                    bucket = TokenBucket(rate, capacity=settings.translator_rate_burst)
+                    logger.debug(f"[{name}] 限速 {rate}/秒，突发 {bucket.capacity:.0f}")
+                self._buckets[name] = bucket
+            return self._buckets[name]
+
+    def clear(self) -> None:
+        """清空令牌桶（配置变更后重新创建）"""
+        with self._lock:
+            self._buckets.clear()
+
+
+# 全局限速实例
+rate_limiters = RateLimiters()
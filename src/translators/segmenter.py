@@ -0,0 +1,101 @@
+"""
+长文本分段模块
+
+把超出翻译服务单次长度限制的正文切成若干段：优先在段落边界切分，其次在句末标点
+（含中文的。！？；…），仍然过长的句子在逗号或空白处切开，最后才硬切。
+各段首尾相接即为原文，译文按原顺序拼接，并保留段与段之间的换行和空白。
+"""
+import re
+from typing import List, Sequence, Tuple
+
+# 一句话：到句末标点（连同其后的引号、括号）为止，英文句号等要求后面是空白或结尾
+_SENTENCE = re.compile(
+    r'.*?(?:[。！？；…]+[”’」』）)]*|[.!?;]+["\'”’)\]]*(?=\s|$)|\n|$)\s*',
+    re.S,
+)
+
+# 句内可切分的位置（逗号、顿号、冒号后或空白处）
+_SOFT_BREAK = re.compile(r'[，、：,:]\s*|\s+')
+
+
+def _split_long(sentence: str, max_chars: int) -> List[str]:
+    """切开超长的句子：在不超过上限的最后一个逗号或空白处切，找不到时硬切"""
+    pieces = []
+    while len(sentence.rstrip()) > max_chars:
+        cut = 0
+        for match in _SOFT_BREAK.finditer(sentence, 0, max_chars):
+            if match.end() <= max_chars:
+                cut = match.end()
+        if cut == 0:
+            cut = max_chars
+        pieces.append(sentence[:cut])
+        sentence = sentence[cut:]
+    if sentence:
+        pieces.append(sentence)
+    return pieces
+
+
+def split_text(text: str, max_chars: int) -> List[str]:
+    """
+    按句子和段落切分长文本
+
+    Args:
+        text: 原文
+        max_chars: 每段最大字符数
+
+    Returns:
+        分段列表，首尾相接等于原文；每段去掉首尾空白后不超过上限（首尾空白不会发给翻译服务）
+    """
+    if len(text.strip()) <= max_chars:
+        return [text]
+
+    units = []
+    for match in _SENTENCE.finditer(text):
+        if match.group():
+            units.extend(_split_long(match.group(), max_chars))
+
+    # 相邻的句子合并到上限以内，段落末尾（换行）优先作为分段位置
+    segments, current = [], ''
+    for unit in units:
+        if current and len((current + unit).strip()) > max_chars:
+            segments.append(current)
+            current = ''
+        current += unit
+        if current.endswith('\n') and len(current) >= max_chars // 2:
+            segments.append(current)
+            current = ''
+    if current:
+        segments.append(current)
+    return segments
+
+
+def strip_segment(segment: str) -> Tuple[str, str, str]:
+    """
+    拆出段落首尾的空白
+
+    Returns:
+        (前导空白, 正文, 结尾空白)，正文用于翻译，拼接译文时补回空白
+    """
+    core = segment.strip()
+    if not core:
+        return segment, '', ''
+    start = segment.index(core)
+    return segment[:start], core, segment[start + len(core):]
+
+
+def join_translations(segments: Sequence[str], translations: Sequence[str]) -> str:
+    """
+    按原顺序拼接各段译文，保留原文段间的空白与换行
+
+    Args:
+        segments: split_text 的分段结果
+        translations: 各段正文的译文（与 segments 一一对应）
+
+    Returns:
+        完整译文
+    """
+    parts = []
+    for segment, translation in zip(segments, translations):
+        lead, _, trail = strip_segment(segment)
+        parts.append(lead + translation + trail)
+    return ''.join(parts).strip()
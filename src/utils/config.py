@@ -5,7 +5,7 @@
 """
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from dotenv import load_dotenv
 from pydantic import Field
@@ -45,6 +45,8 @@ class Settings(BaseSettings):
         default=Path("./data/news.db"),
         alias="DATABASE_PATH"
     )
+    database_pool_size: int = Field(default=8, alias="DATABASE_POOL_SIZE")
+    seen_index_retention_days: int = Field(default=7, alias="SEEN_INDEX_RETENTION_DAYS")
  
     # 抓取配置
     fetch_interval: str = Field(default="6h", alias="FETCH_INTERVAL")
@@ -64,6 +66,27 @@ class Settings(BaseSettings):
     
     # 网络配置
     request_timeout: int = Field(default=8, alias="REQUEST_TIMEOUT")
+    fetch_max_concurrency: int = Field(default=16, alias="FETCH_MAX_CONCURRENCY")
+    # 抓取流水线：每批入库的文章数、阶段之间的队列容量
+    fetch_batch_size: int = Field(default=100, alias="FETCH_BATCH_SIZE")
+    fetch_queue_size: int = Field(default=500, alias="FETCH_QUEUE_SIZE")
+    # 解析进程数，默认取 CPU 核数（最多 4 个），0 表示在当前进程内解析
+    parse_workers: Optional[int] = Field(default=None, alias="PARSE_WORKERS")
+    
+    # 翻译配置
+    translation_cache_size: int = Field(default=2048, alias="TRANSLATION_CACHE_SIZE")
+    translator_failure_threshold: int = Field(default=3, alias="TRANSLATOR_FAILURE_THRESHOLD")
+    translator_cooldown_seconds: int = Field(default=60, alias="TRANSLATOR_COOLDOWN_SECONDS")
+    translator_hedge_enabled: bool = Field(default=False, alias="TRANSLATOR_HEDGE_ENABLED")
+    translator_max_concurrency: int = Field(default=2, alias="TRANSLATOR_MAX_CONCURRENCY")
+    # 翻译队列：后台工作线程数（0 表示本进程不消费队列）、租约时长、最大尝试次数与首次重试间隔
+    translation_workers: int = Field(default=2, alias="TRANSLATION_WORKERS")
+    translation_lease_seconds: int = Field(default=300, alias="TRANSLATION_LEASE_SECONDS")
+    translation_max_attempts: int = Field(default=3, alias="TRANSLATION_MAX_ATTEMPTS")
+    translation_retry_delay: int = Field(default=30, alias="TRANSLATION_RETRY_DELAY")
+    # 各翻译器的限速（次/秒），JSON 格式，键为翻译器名称，如 {"Google Translate": 1, "Bing": 3}
+    translator_rate_limits: Dict[str, float] = Field(default_factory=dict, alias="TRANSLATOR_RATE_LIMITS")
+    translator_rate_burst: int = Field(default=2, alias="TRANSLATOR_RATE_BURST")
     
     # 日志配置
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
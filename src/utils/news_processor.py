@@ -4,13 +4,14 @@
 实现新闻清洗和相似度判断功能
 """
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 import re
 import string
 from difflib import SequenceMatcher
 
 from src.storage.models import NewsArticle
 from src.utils.logger import logger
+from src.utils.near_duplicate import NearDuplicateIndex
 
 
 class NewsProcessor:
@@ -149,7 +150,7 @@ class NewsProcessor:
     
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """
-        计算文本相似度
+        计算两段文本的逐字符相似度（用于单次比较，批量分组请使用 group_similar_articles）
         
         Args:
             text1: 第一个文本
@@ -170,56 +171,83 @@ class NewsProcessor:
             logger.error(f"计算相似度失败: {e}")
             return 0.0
     
+    def _index_text(self, article: NewsArticle) -> Tuple[str, str]:
+        """取用于相似度比较的标题和内容"""
+        title = article.title or article.title_zh or article.title_en
+        content = article.content or article.content_zh or article.content_en
+        return title, content
+
+    def _new_index(self) -> NearDuplicateIndex:
+        """创建与当前阈值一致的近似重复索引"""
+        return NearDuplicateIndex(threshold=self.similarity_threshold, title_weight=0.7)
+
     def group_similar_articles(self, articles: List[NewsArticle]) -> List[List[NewsArticle]]:
         """
         将相似的新闻分组
-        
+
+        每篇新闻与各组第一篇比较（标题 70% + 内容 30%），通过 MinHash/LSH
+        索引只比较候选组，整体为近似线性复杂度。
+
         Args:
             articles: 新闻列表
-        
+
         Returns:
             分组后的新闻列表
         """
         if not articles:
             return []
-        
-        # 分组结果
-        groups = []
-        
+
+        # 索引中只放各组第一篇，键为组下标
+        index = self._new_index()
+        groups: List[List[NewsArticle]] = []
+
         for article in articles:
-            # 检查是否与现有组相似
-            matched = False
-            for group in groups:
-                # 与组内第一篇新闻比较
-                reference_article = group[0]
-                
-                # 计算标题相似度
-                title_similarity = self.calculate_similarity(
-                    article.title or article.title_zh or article.title_en,
-                    reference_article.title or reference_article.title_zh or reference_article.title_en
-                )
-                
-                # 计算内容相似度（如果内容不为空）
-                content_similarity = 0.0
-                if article.content or article.content_zh or article.content_en:
-                    content_similarity = self.calculate_similarity(
-                        article.content or article.content_zh or article.content_en,
-                        reference_article.content or reference_article.content_zh or reference_article.content_en
-                    )
-                
-                # 综合相似度
-                combined_similarity = (title_similarity * 0.7) + (content_similarity * 0.3)
-                
-                if combined_similarity >= self.similarity_threshold:
-                    group.append(article)
-                    matched = True
-                    break
-            
-            if not matched:
+            title, content = self._index_text(article)
+            matched = index.find_or_add(len(groups), title, content)
+            if matched is None:
                 # 创建新组
                 groups.append([article])
-        
+            else:
+                groups[matched].append(article)
+
         return groups
+
+    def drop_existing_duplicates(
+        self,
+        articles: List[NewsArticle],
+        existing_articles: List[NewsArticle],
+    ) -> List[NewsArticle]:
+        """
+        丢弃与已入库新闻重复的新闻（同一 ID 的更新不算重复）
+
+        Args:
+            articles: 待入库新闻列表
+            existing_articles: 已入库新闻列表（NewsArticle 或含标题、内容列的 ArticleView）
+
+        Returns:
+            去重后的新闻列表
+        """
+        if not articles or not existing_articles:
+            return articles
+
+        # 本批再次抓取到的已入库文章不参与比较，避免其更新被当作别的文章的重复丢弃
+        incoming = {article.id for article in articles}
+        index = self._new_index()
+        for existing in existing_articles:
+            if existing.id not in incoming:
+                index.add(existing.id, *self._index_text(existing))
+
+        result = []
+        for article in articles:
+            matched = index.query(*self._index_text(article))
+            if matched is not None and matched != article.id:
+                logger.debug(f"与已入库新闻重复，跳过: {article.title[:50]}")
+                continue
+            result.append(article)
+
+        if len(result) < len(articles):
+            logger.info(f"与已入库新闻重复: 跳过 {len(articles) - len(result)} 篇")
+        return result
     
     def merge_similar_articles(self, articles: List[NewsArticle]) -> NewsArticle:
         """
@@ -259,37 +287,61 @@ class NewsProcessor:
 
         return merged_article
     
-    def process_articles(self, articles: List[NewsArticle]) -> List[NewsArticle]:
+    def process_articles(
+        self,
+        articles: List[NewsArticle],
+        existing_articles: Optional[List[NewsArticle]] = None,
+    ) -> List[NewsArticle]:
         """
         处理新闻列表
         
         Args:
             articles: 原始新闻列表
+            existing_articles: 已入库新闻列表，提供时同时与其去重
         
         Returns:
             处理后的新闻列表
         """
+        return [article for article, _ in self.process_groups(articles, existing_articles)]
+
+    def process_groups(
+        self,
+        articles: List[NewsArticle],
+        existing_articles: Optional[List[NewsArticle]] = None,
+    ) -> List[Tuple[NewsArticle, List[NewsArticle]]]:
+        """
+        处理新闻列表，同时返回每篇处理结果由哪些原始新闻合并而来
+
+        Args:
+            articles: 原始新闻列表
+            existing_articles: 已入库新闻列表，提供时同时与其去重
+
+        Returns:
+            (处理后的新闻, 对应的原始新闻) 列表；与已入库新闻重复的新闻不出现在结果中
+        """
         if not articles:
             return []
         
         # 清洗新闻
         cleaned_articles = [self.clean_article(article) for article in articles]
+        if existing_articles:
+            cleaned_articles = self.drop_existing_duplicates(cleaned_articles, existing_articles)
         
         # 分组相似新闻
         groups = self.group_similar_articles(cleaned_articles)
         
         # 合并每组相似新闻
-        processed_articles = []
+        processed = []
         for group in groups:
             if len(group) > 1:
                 merged_article = self.merge_similar_articles(group)
-                processed_articles.append(merged_article)
+                processed.append((merged_article, group))
                 logger.info(f"合并了 {len(group)} 篇相似新闻: {merged_article.title[:50]}...")
             else:
-                processed_articles.append(group[0])
+                processed.append((group[0], group))
         
-        logger.info(f"处理完成: 原始 {len(articles)} 篇, 处理后 {len(processed_articles)} 篇")
-        return processed_articles
+        logger.info(f"处理完成: 原始 {len(articles)} 篇, 处理后 {len(processed)} 篇")
+        return processed
 
 
 # 全局新闻处理器实例
@@ -0,0 +1,92 @@
+"""
+页面渲染缓存模块
+
+按数据版本号缓存渲染结果：版本号相同直接返回缓存，数据写入后版本号变化，
+下一次访问时重新渲染。适用于只在抓取后变化的页面和页面片段。
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class VersionedCache:
+    """带版本号校验的 LRU 缓存（线程安全）"""
+
+    def __init__(self, max_entries: int = 128):
+        """
+        初始化缓存
+
+        Args:
+            max_entries: 最大缓存条目数，超出时淘汰最久未使用的条目
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[int, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, version: int) -> Optional[object]:
+        """
+        获取缓存
+
+        Args:
+            key: 缓存键
+            version: 当前数据版本号
+
+        Returns:
+            版本号一致的缓存值，没有则返回 None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version or version < 0:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, version: int, value: object) -> None:
+        """
+        写入缓存（版本号无效时不缓存）
+
+        Args:
+            key: 缓存键
+            version: 生成该值时的数据版本号
+            value: 缓存值
+        """
+        if version < 0:
+            return
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_build(self, key: Hashable, version: int, build: Callable[[], T]) -> T:
+        """
+        获取缓存，未命中时调用 build 生成并缓存
+
+        Args:
+            key: 缓存键
+            version: 当前数据版本号，应在读取数据之前获取（构建期间发生的写入会在下次访问时重建）
+            build: 生成缓存值的函数
+
+        Returns:
+            缓存值
+        """
+        value = self.get(key, version)
+        if value is None:
+            value = build()
+            self.set(key, version, value)
+        return value
+
+    def clear(self) -> None:
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+
+
+# 全局页面渲染缓存实例
+render_cache = VersionedCache()
@@ -0,0 +1,133 @@
+"""
+报道聚类模块
+
+将不同新闻源对同一事件的报道归入同一个报道聚类（story_id），结果持久化在文章表中。
+新文章入库前只与近期文章比较：文本经 HashingVectorizer 向量化（无需拟合，向量可缓存复用），
+以余弦相似度找到最相似的近期文章并沿用其 story_id，否则自成一个新聚类。
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Sequence
+
+from scipy.sparse import vstack
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from src.storage.models import NewsArticle
+from src.utils.logger import logger
+from src.utils.near_duplicate import shingles
+
+
+def _analyzer(text: str) -> List[str]:
+    """向量化使用的特征：相邻两个词元组成的 shingle"""
+    return list(shingles(text))
+
+
+class StoryClusterer:
+    """增量报道聚类器"""
+
+    def __init__(
+        self,
+        database,
+        threshold: float = 0.5,
+        window_hours: int = 48,
+        n_features: int = 2 ** 18,
+    ):
+        """
+        初始化聚类器
+
+        Args:
+            database: Database 实例，用于读取近期文章
+            threshold: 余弦相似度阈值，达到即归入同一聚类
+            window_hours: 参与比较的近期文章时间窗口（按抓取时间）
+            n_features: 哈希特征维数
+        """
+        self.database = database
+        self.threshold = threshold
+        self.window_hours = window_hours
+        self.vectorizer = HashingVectorizer(
+            analyzer=_analyzer,
+            n_features=n_features,
+            alternate_sign=False,
+            norm='l2',
+        )
+        # 近期文章向量缓存，避免每批次重复向量化
+        self._vectors: Dict[str, object] = {}
+
+    @staticmethod
+    def _text(title: str, content: str) -> str:
+        """拼接参与比较的文本（标题 + 内容开头）"""
+        return f"{title or ''} {(content or '')[:300]}"
+
+    def _recent_vectors(self, candidates: List[Dict]):
+        """取得近期文章的向量矩阵，只对未缓存的文章做向量化"""
+        missing = [row for row in candidates if row['id'] not in self._vectors]
+        if missing:
+            matrix = self.vectorizer.transform(
+                [self._text(row['title'], row['content']) for row in missing]
+            )
+            for i, row in enumerate(missing):
+                self._vectors[row['id']] = matrix[i]
+
+        # 丢弃已移出时间窗口的缓存
+        wanted = {row['id'] for row in candidates}
+        for key in [key for key in self._vectors if key not in wanted]:
+            del self._vectors[key]
+
+        return vstack([self._vectors[row['id']] for row in candidates]).tocsr()
+
+    def assign(self, articles: Sequence[NewsArticle]) -> int:
+        """
+        为文章分配 story_id（直接修改文章对象，应在入库前调用）
+
+        已经入库过的文章沿用原有 story_id；同一批次内的文章也会互相比较。
+
+        Args:
+            articles: 待入库的文章列表
+
+        Returns:
+            归入已有聚类的文章数量
+        """
+        pending = [a for a in articles if not a.story_id]
+        if not pending:
+            return 0
+
+        since = datetime.now() - timedelta(hours=self.window_hours)
+        candidates = self.database.get_story_candidates(since)
+
+        # 重复抓取到的已入库文章沿用原聚类
+        stored = {row['id']: row['story_id'] for row in candidates}
+        for article in pending:
+            article.story_id = stored.get(article.id, '')
+        pending = [a for a in pending if not a.story_id]
+        if not pending:
+            return 0
+
+        new_matrix = self.vectorizer.transform(
+            [self._text(a.title, a.content) for a in pending]
+        )
+        # 与近期文章的相似度矩阵（稀疏矩阵乘法，向量已归一化即为余弦相似度）
+        recent_sims = None
+        if candidates:
+            recent_sims = (new_matrix @ self._recent_vectors(candidates).T).toarray()
+        batch_sims = (new_matrix @ new_matrix.T).toarray()
+
+        joined = 0
+        for i, article in enumerate(pending):
+            best_score, best_story = 0.0, ''
+            if recent_sims is not None and recent_sims.shape[1]:
+                j = int(recent_sims[i].argmax())
+                best_score, best_story = recent_sims[i, j], candidates[j]['story_id']
+            # 同批次中排在前面的文章
+            if i:
+                j = int(batch_sims[i, :i].argmax())
+                if batch_sims[i, j] > best_score:
+                    best_score, best_story = batch_sims[i, j], pending[j].story_id
+
+            if best_story and best_score >= self.threshold:
+                article.story_id = best_story
+                joined += 1
+            else:
+                article.story_id = article.id
+
+        if joined:
+            logger.info(f"报道聚类: {joined}/{len(pending)} 篇文章归入已有报道")
+        return joined
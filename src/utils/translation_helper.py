@@ -3,7 +3,7 @@
 
 统一管理语言来源常量和文章翻译逻辑，避免在多处重复相同代码。
 """
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Sequence, Tuple
 
 if TYPE_CHECKING:
     from src.storage.models import NewsArticle
@@ -23,42 +23,54 @@ def translate_article(article: "NewsArticle", translator_manager: "TranslatorMan
     """
     就地补全文章的多语言字段，跳过已有内容，不重复翻译。
 
+    Args:
+        article: 待翻译的 NewsArticle 对象（原地修改）
+        translator_manager: 翻译管理器实例
+    """
+    translate_articles([article], translator_manager)
+
+
+def translate_articles(articles: Sequence["NewsArticle"], translator_manager: "TranslatorManager") -> None:
+    """
+    批量就地补全多篇文章的多语言字段，所有待翻译的标题和内容合并为一次 translate_many 调用。
+
     根据来源语言决定翻译方向：
     - 中文源：原文作为 zh，zh -> en
     - 英文源（默认）：原文作为 en，en -> zh
 
     Args:
-        article: 待翻译的 NewsArticle 对象（原地修改）
+        articles: 待翻译的 NewsArticle 列表（原地修改）
         translator_manager: 翻译管理器实例
     """
-    source_lang = detect_source_lang(article)
+    # (文章, 字段名, 原文, 源语言, 目标语言)
+    tasks: List[Tuple["NewsArticle", str, str, str, str]] = []
+
+    for article in articles:
+        source_lang = detect_source_lang(article)
+        if source_lang == 'zh':
+            # 中文原文直接作为 zh 字段，只需翻译成英文
+            if not article.title_zh:
+                article.title_zh = article.title
+            if not article.content_zh:
+                article.content_zh = article.content
+            pending = (('title_en', article.title), ('content_en', article.content))
+            src, tgt = 'zh', 'en'
+        else:
+            # 英文原文直接作为 en 字段，只需翻译成中文
+            if not article.title_en:
+                article.title_en = article.title
+            if not article.content_en:
+                article.content_en = article.content
+            pending = (('title_zh', article.title), ('content_zh', article.content))
+            src, tgt = 'en', 'zh'
 
-    def _translate(text: str, src: str, tgt: str) -> str:
-        """若文本非空则翻译，否则返回空字符串。"""
-        if not text:
-            return ''
-        return translator_manager.translate(text, source_lang=src, target_lang=tgt) or ''
-    
-    if source_lang == 'zh':
-        # 中文原文直接作为 zh 字段，只需翻译成英文
-        if not article.title_zh:
-            article.title_zh = article.title
-        if not article.title_en:
-            article.title_en = _translate(article.title, 'zh', 'en')
-        if not article.content_zh:
-            article.content_zh = article.content
-        if not article.content_en:
-            article.content_en = _translate(article.content, 'zh', 'en')
+        for field, text in pending:
+            if not getattr(article, field):
+                tasks.append((article, field, text or '', src, tgt))
 
-    else:
-        # 英文原文直接作为 en 字段，只需翻译成中文
-        if not article.title_en:
-            article.title_en = article.title
-        if not article.title_zh:
-            article.title_zh = _translate(article.title, 'en', 'zh')
-        if not article.content_en:
-            article.content_en = article.content
-        if not article.content_zh:
-            article.content_zh = _translate(article.content, 'en', 'zh')
+    results = translator_manager.translate_many([(text, src, tgt) for _, _, text, src, tgt in tasks])
+    for (article, field, _, _, _), result in zip(tasks, results):
+        setattr(article, field, result or '')
 
-    article.translated = True
+    for article in articles:
+        article.translated = True
@@ -0,0 +1,239 @@
+"""
+后台翻译模块
+
+翻译工作线程从持久化的翻译队列（见 src.storage.translation_queue）领取文章，
+整批翻译（标题和内容合并为一次 translate_many 调用）后写回数据库并确认完成，
+失败的文章按退避策略重新排队。多个进程的工作线程共用同一个队列，靠租约避免重复翻译。
+
+网页上的批量翻译只是带任务 ID 入队，立即返回；前端按任务 ID 轮询队列中的进度。
+"""
+import os
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from src.storage import translation_queue as queue_states
+from src.storage.models import NewsArticle
+from src.utils.config import get_settings
+from src.utils.logger import logger
+from src.utils.translation_helper import translate_articles
+
+PENDING = 'pending'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+@dataclass
+class TranslationJob:
+    """翻译任务进度（由队列中该任务的文章状态统计得出）"""
+
+    id: str
+    total: int
+    status: str = PENDING
+    done: int = 0
+    failed: int = 0
+    error: str = ''
+
+    @classmethod
+    def from_counts(cls, job_id: str, counts: Dict[str, int]) -> "TranslationJob":
+        """由队列状态计数构造任务进度（全部文章都放弃翻译时任务为失败）"""
+        failed = counts.get(queue_states.FAILED, 0)
+        finished = counts.get(queue_states.DONE, 0) + failed
+        total = sum(counts.values())
+        error = ''
+        if total and failed == total:
+            status, error = FAILED, f"{failed} 篇文章均翻译失败"
+        elif finished == total:
+            status = DONE
+        elif counts.get(queue_states.LEASED) or finished:
+            status = RUNNING
+        else:
+            status = PENDING
+        return cls(id=job_id, total=total, status=status, done=finished, failed=failed, error=error)
+
+    def to_dict(self) -> Dict:
+        """转换为字典（用于接口输出）"""
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'total': self.total,
+            'done': self.done,
+            'failed': self.failed,
+            'progress': round(self.done / self.total, 3) if self.total else 1.0,
+            'error': self.error,
+        }
+
+
+def is_translated(article: NewsArticle) -> bool:
+    """中英文标题都已具备，有正文时中英文正文也都已具备"""
+    if not (article.title_zh and article.title_en):
+        return False
+    return not article.content or bool(article.content_zh and article.content_en)
+
+
+class TranslationWorkers:
+    """翻译队列的工作线程池"""
+
+    def __init__(
+        self,
+        database=None,
+        manager=None,
+        workers: Optional[int] = None,
+        batch_size: int = 10,
+        poll_interval: float = 5.0,
+    ):
+        """
+        初始化工作线程池
+
+        Args:
+            database: 数据库实例（使用其 translation_queue），默认使用全局实例
+            manager: 翻译管理器，默认使用全局实例
+            workers: 工作线程数，默认读取配置 TRANSLATION_WORKERS
+            batch_size: 每次领取的文章数
+            poll_interval: 队列为空时的轮询间隔（秒），入队时会立即唤醒
+        """
+        self._database = database
+        self._manager = manager
+        self.workers = get_settings().translation_workers if workers is None else workers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._threads: List[threading.Thread] = []
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def database(self):
+        """数据库实例（延迟导入，避免循环依赖）"""
+        if self._database is None:
+            from src.storage.database import db
+            self._database = db
+        return self._database
+
+    @property
+    def manager(self):
+        """翻译管理器（延迟导入，避免启动时加载翻译器）"""
+        if self._manager is None:
+            from src.translators import translator_manager
+            self._manager = translator_manager
+        return self._manager
+
+    @property
+    def queue(self):
+        """翻译队列"""
+        return self.database.translation_queue
+
+    def start(self) -> None:
+        """启动工作线程（已启动时不重复启动）"""
+        with self._lock:
+            if self._threads or self.workers <= 0:
+                return
+            self._stopping.clear()
+            prefix = f"{os.getpid()}-{uuid.uuid4().hex[:6]}"
+            for index in range(self.workers):
+                thread = threading.Thread(
+                    target=self._loop, args=(f"{prefix}-{index}",),
+                    name=f"translation-worker-{index}", daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+        logger.info(f"翻译工作线程已启动: {self.workers} 个")
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """停止工作线程（等待当前批次完成）"""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in threads:
+            thread.join(timeout)
+
+    def wake(self) -> None:
+        """唤醒空闲的工作线程"""
+        self._wakeup.set()
+
+    def submit(self, articles: Sequence[NewsArticle]) -> TranslationJob:
+        """
+        提交翻译任务（入队后立即返回）
+
+        Args:
+            articles: 待翻译的文章
+
+        Returns:
+            任务进度
+        """
+        job_id = uuid.uuid4().hex[:12]
+        self.queue.enqueue((article.id for article in articles), job_id=job_id)
+        self.start()
+        self.wake()
+        logger.info(f"翻译任务已入队: {job_id}（{len(articles)} 篇）")
+        return self.get(job_id) or TranslationJob(id=job_id, total=0, status=DONE)
+
+    def get(self, job_id: str) -> Optional[TranslationJob]:
+        """
+        获取任务进度
+
+        Args:
+            job_id: 任务 ID
+
+        Returns:
+            任务进度，不存在时返回 None
+        """
+        counts = self.queue.job_counts(job_id)
+        return TranslationJob.from_counts(job_id, counts) if counts else None
+
+    def run_once(self, owner: str) -> int:
+        """
+        领取并处理一批文章
+
+        Args:
+            owner: 领取者标识
+
+        Returns:
+            领到的文章数（0 表示队列暂时为空）
+        """
+        article_ids = self.queue.lease(owner, self.batch_size)
+        if not article_ids:
+            return 0
+
+        articles = []
+        for article_id in article_ids:
+            article = self.database.get_article_by_id(article_id)
+            if article is None:
+                # 文章已被删除，无需翻译
+                self.queue.complete([article_id], owner)
+            else:
+                articles.append(article)
+
+        try:
+            translate_articles(articles, self.manager)
+            self.database.save_articles(articles)
+        except Exception as e:
+            logger.error(f"翻译队列处理失败: {e}", exc_info=True)
+            for article in articles:
+                self.queue.retry(article.id, owner, str(e))
+            return len(article_ids)
+
+        self.queue.complete((article.id for article in articles if is_translated(article)), owner)
+        for article in articles:
+            if not is_translated(article):
+                self.queue.retry(article.id, owner, '翻译结果为空')
+        return len(article_ids)
+
+    def _loop(self, owner: str) -> None:
+        """工作线程主循环"""
+        while not self._stopping.is_set():
+            try:
+                processed = self.run_once(owner)
+            except Exception as e:
+                logger.error(f"翻译工作线程异常: {e}", exc_info=True)
+                processed = 0
+            if not processed:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+
+
+# 全局翻译工作线程池
+translation_workers = TranslationWorkers()
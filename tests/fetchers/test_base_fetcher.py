@@ -0,0 +1,168 @@
+"""
+抓取器基类测试
+"""
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+
+from src.fetchers.base import BaseFetcher
+from src.fetchers.engine import FetchEngine
+from src.fetchers.pipeline import FetchPipeline
+from src.storage.http_cache import HttpCacheStore
+from src.storage.seen_index import SeenIndex
+
+RSS_TEMPLATE = (
+    '<?xml version="1.0"?><rss version="2.0"><channel><title>{name}</title>'
+    '<item><title>{name} 新闻</title><link>https://example.com/{name}</link></item>'
+    '</channel></rss>'
+)
+
+
+class DummyFetcher(BaseFetcher):
+    """测试用 RSS 抓取器"""
+
+    RSS_FEEDS = {
+        'world': 'https://a.example.com/world.xml',
+        'tech': 'https://b.example.com/tech.xml',
+        'broken': 'https://c.example.com/broken.xml',
+    }
+
+    def __init__(self, http_cache: HttpCacheStore, seen_index: SeenIndex):
+        super().__init__('Dummy', 'https://example.com', default_delay=0.0, language='en')
+        self.http_cache = http_cache
+        self.seen_index = seen_index
+
+    async def fetch(self) -> List[Dict]:
+        return await self._parse_feeds(self.RSS_FEEDS)
+
+    def parse(self, feed, category: str) -> List[Dict]:
+        return [{'title': entry.title, 'url': entry.link, 'category': category} for entry in feed.entries]
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    if 'broken' in request.url.path:
+        return httpx.Response(503)
+    name = request.url.path.strip('/').split('.')[0]
+    return httpx.Response(200, content=RSS_TEMPLATE.format(name=name).encode('utf-8'))
+
+
+def _run_fetch(fetcher: BaseFetcher, handler) -> List[Dict]:
+    """在模拟传输层上执行一次抓取"""
+    async def run():
+        async with FetchEngine(transport=httpx.MockTransport(handler)):
+            return await fetcher.fetch()
+    return asyncio.run(run())
+
+
+class _Database:
+    """测试数据库，可模拟整批写入失败"""
+
+    def __init__(self, fail: bool):
+        self.fail = fail
+
+    def get_recent_source_articles(self, source, since, limit=1000):
+        return []
+
+    def write_articles(self, articles, live_sources=()):
+        if self.fail:
+            return [], 0
+        return [article.id for article in articles], len(articles)
+
+
+class _Clusterer:
+    def assign(self, articles):
+        return 0
+
+
+def _run_pipeline(fetcher: BaseFetcher, handler, fail: bool = False):
+    """在模拟传输层上经流水线抓取并入库"""
+    async def run():
+        async with FetchEngine(transport=httpx.MockTransport(handler)):
+            return await FetchPipeline(_Database(fail), _Clusterer()).run([fetcher])
+    return asyncio.run(run())
+
+
+class TestParseFeeds(unittest.TestCase):
+    """测试批量 RSS 抓取、条件请求缓存与已见条目索引"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        db_path = Path(self.tmp_dir.name) / 'test.db'
+        self.http_cache = HttpCacheStore(db_path)
+        self.seen_index = SeenIndex(db_path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_parse_feeds_keeps_order_and_skips_failures(self):
+        """结果按分类顺序拼接，失败的源不影响其他源"""
+        articles = _run_fetch(DummyFetcher(self.http_cache, self.seen_index), _handler)
+
+        self.assertEqual([a['category'] for a in articles], ['world', 'tech'])
+        self.assertEqual(articles[0]['url'], 'https://example.com/world')
+
+    def test_not_modified_feeds_are_skipped(self):
+        """服务端返回 304 时跳过解析"""
+        seen_conditional = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get('If-None-Match') == '"v1"':
+                seen_conditional.append(request.url.path)
+                return httpx.Response(304)
+            response = _handler(request)
+            response.headers['ETag'] = '"v1"'
+            return response
+
+        fetcher = DummyFetcher(self.http_cache, self.seen_index)
+        self.assertEqual(len(_run_fetch(fetcher, handler)), 2)
+        fetcher.commit_validators()
+        self.assertEqual(_run_fetch(fetcher, handler), [])
+        self.assertEqual(len(seen_conditional), 2)
+
+    def test_identical_body_is_skipped(self):
+        """没有校验头时，响应体哈希相同也视为未变化"""
+        fetcher = DummyFetcher(self.http_cache, self.seen_index)
+        self.assertEqual(len(_run_fetch(fetcher, _handler)), 2)
+        fetcher.commit_validators()
+        self.assertEqual(_run_fetch(fetcher, _handler), [])
+
+        self.http_cache.clear()
+        self.assertEqual(len(_run_fetch(fetcher, _handler)), 2)
+
+    def test_validators_saved_only_after_articles_stored(self):
+        """入库失败时不记录校验信息，下次抓取重新解析同一内容"""
+        def handler(request: httpx.Request) -> httpx.Response:
+            response = _handler(request)
+            response.headers['ETag'] = '"v1"'
+            return response
+
+        fetcher = DummyFetcher(self.http_cache, self.seen_index)
+        failed = _run_pipeline(fetcher, handler, fail=True)
+        self.assertEqual((failed.valid, failed.saved), (2, 0))
+        self.assertIsNone(self.http_cache.get('https://a.example.com/world.xml'))
+
+        retried = _run_pipeline(fetcher, handler)
+        self.assertEqual(retried.saved, 2)
+        self.assertEqual(self.http_cache.get('https://a.example.com/world.xml')['etag'], '"v1"')
+        self.assertEqual(_run_pipeline(fetcher, handler).fetched, 0)
+
+    def test_seen_entries_are_dropped(self):
+        """已入库过的条目在解析前被丢弃，其他条目照常输出"""
+        fetcher = DummyFetcher(self.http_cache, self.seen_index)
+        fetcher.mark_seen([{'url': 'https://example.com/world'}])
+
+        articles = _run_fetch(fetcher, _handler)
+        self.assertEqual([a['category'] for a in articles], ['tech'])
+
+        # 索引持久化，新实例同样生效
+        reloaded = SeenIndex(self.seen_index.db_path)
+        self.assertTrue(reloaded.contains('Dummy', 'https://example.com/world'))
+        self.assertFalse(reloaded.contains('Other', 'https://example.com/world'))
+
+
+if __name__ == '__main__':
+    unittest.main()
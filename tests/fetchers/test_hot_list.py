@@ -0,0 +1,107 @@
+"""
+热榜页面提取测试
+"""
+import json
+import unittest
+
+from src.fetchers.hot_list import extract_comment_json
+from src.fetchers.source.baidu import parse_board
+from src.fetchers.source.weibo import parse_hot_html
+
+
+def baidu_page(data) -> bytes:
+    """构造内嵌 sanRoot 数据的百度热搜页面"""
+    return (
+        '<html><head><meta charset="utf-8"></head><body>'
+        f'<div id="sanRoot" class="wrapper"><!--s-data:{json.dumps(data)}--></div>'
+        '</body></html>'
+    ).encode('utf-8')
+
+
+class TestExtractCommentJson(unittest.TestCase):
+    """测试内嵌 JSON 截取"""
+
+    def test_extract(self):
+        """截取容器注释中的 JSON"""
+        self.assertEqual(extract_comment_json(baidu_page({'a': 1}), 'sanRoot'), {'a': 1})
+
+    def test_missing_or_broken(self):
+        """容器不存在或 JSON 损坏时返回 None"""
+        self.assertIsNone(extract_comment_json(b'<div id="other"><!--{"a": 1}--></div>', 'sanRoot'))
+        self.assertIsNone(extract_comment_json(b'<div id="sanRoot"><!--{"a": --></div>', 'sanRoot'))
+
+
+class TestBaiduBoard(unittest.TestCase):
+    """测试百度热搜解析"""
+
+    def test_san_root(self):
+        """按字段优先级取标题、链接和热度，没有标题时从链接的 wd 参数中提取"""
+        data = {'data': {'cards': [{'content': [
+            {'word': 'x', 'appUrl': 'https://www.baidu.com/s?wd=%E7%83%AD%E6%90%9C', 'hotScore': 999},
+            {'title': '第二条', 'url': 'https://www.baidu.com/s?wd=2'},
+            {'title': '没有链接'},
+        ]}]}}
+
+        items = parse_board(baidu_page(data))
+        self.assertEqual(items, [
+            {'title': '热搜', 'url': 'https://www.baidu.com/s?wd=%E7%83%AD%E6%90%9C', 'heat': '999'},
+            {'title': '第二条', 'url': 'https://www.baidu.com/s?wd=2', 'heat': ''},
+        ])
+
+    def test_fallback_links(self):
+        """没有 sanRoot 数据时从页面链接中过滤，跳过导航链接和重复标题"""
+        html = (
+            '<html><body><a href="/">百度首页链接</a><a href="/s?wd=1">一条热搜新闻</a>'
+            '<a href="/s?wd=1b">一条热搜新闻</a><a href="javascript:;">另一条新闻标题</a></body></html>'
+        ).encode('utf-8')
+
+        self.assertEqual(parse_board(html), [{'title': '一条热搜新闻', 'url': '/s?wd=1', 'heat': ''}])
+
+
+class TestWeiboHotList(unittest.TestCase):
+    """测试微博热搜解析"""
+
+    def test_rows(self):
+        """解析热搜表格行，补全相对链接"""
+        html = (
+            '<div id="pl_top_realtimehot"><table><thead><tr><th>序号</th></tr></thead><tbody>'
+            '<tr><td class="td-01">1</td><td class="td-02"><a href="/weibo?q=a">话题一</a> <span>123</span></td></tr>'
+            '<tr><td class="td-02"><a href="https://s.weibo.com/weibo?q=b">话题二</a></td></tr>'
+            '</tbody></table></div>'
+        ).encode('utf-8')
+
+        self.assertEqual(parse_hot_html(html), [
+            {'title': '话题一', 'url': 'https://s.weibo.com/weibo?q=a', 'content': '热度: 123'},
+            {'title': '话题二', 'url': 'https://s.weibo.com/weibo?q=b', 'content': '热度: '},
+        ])
+
+    def test_rows_without_td02(self):
+        """页面结构变化、没有 td-02 单元格时，取 .hot_list 行内的第一个链接和热度"""
+        html = (
+            '<ul class="nav"><li><a href="/top">首页导航</a></li></ul>'
+            '<div class="hot_list"><table>'
+            '<tr><td><a href="/weibo?q=d">话题三</a><span>456</span></td></tr>'
+            '<tr><td>无链接的行</td></tr>'
+            '<tr><td><a href="/weibo?q=e">话题四</a></td></tr>'
+            '</table></div>'
+        ).encode('utf-8')
+
+        self.assertEqual(parse_hot_html(html), [
+            {'title': '话题三', 'url': 'https://s.weibo.com/weibo?q=d', 'content': '热度: 456'},
+            {'title': '话题四', 'url': 'https://s.weibo.com/weibo?q=e', 'content': '热度: '},
+        ])
+
+    def test_fallback_links(self):
+        """没有热搜表格时只保留微博站内链接"""
+        html = (
+            '<html><body><a href="https://s.weibo.com/weibo?q=c">备用热搜话题</a>'
+            '<a href="https://example.com/x">站外链接标题</a></body></html>'
+        ).encode('utf-8')
+
+        self.assertEqual(parse_hot_html(html), [
+            {'title': '备用热搜话题', 'url': 'https://s.weibo.com/weibo?q=c', 'content': '来源: 微博热搜'},
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
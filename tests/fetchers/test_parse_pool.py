@@ -0,0 +1,41 @@
+"""
+解析进程池测试
+"""
+import asyncio
+import pickle
+import unittest
+
+from src.fetchers.parse_pool import get_parse_pool, parse_feed, run_parse
+
+RSS = (
+    b'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>'
+    b'<item><title>A</title><link>https://example.com/a</link>'
+    b'<description>&lt;p&gt;Hello &lt;b&gt;world&lt;/b&gt;&lt;/p&gt;</description></item>'
+    b'</channel></rss>'
+)
+
+
+class TestParseFeed(unittest.TestCase):
+    """测试 RSS 解析函数"""
+
+    def test_summary_text_extracted(self):
+        """摘要的纯文本在解析阶段提取"""
+        feed = parse_feed(RSS)
+        self.assertEqual(feed.entries[0].summary_text, "Hello world")
+
+    def test_broken_feed_is_picklable(self):
+        """解析异常也能从子进程传回"""
+        feed = pickle.loads(pickle.dumps(parse_feed(b'<rss><broken')))
+        self.assertTrue(feed.bozo)
+        self.assertIsInstance(feed.bozo_exception, Exception)
+
+    def test_run_in_pool(self):
+        """原始字节送入进程池解析，结果与直接解析相同"""
+        if get_parse_pool() is None:
+            self.skipTest("PARSE_WORKERS=0")
+        feed = asyncio.run(run_parse(parse_feed, RSS))
+        self.assertEqual(feed.entries[0].link, "https://example.com/a")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+"""
+流式抓取流水线测试
+"""
+import asyncio
+import hashlib
+import time
+import unittest
+from datetime import datetime
+from typing import Dict, List
+
+from src.fetchers.base import BaseFetcher
+from src.fetchers.pipeline import FetchPipeline
+from src.storage.models import NewsArticle
+
+
+class StaticFetcher(BaseFetcher):
+    """返回固定条目的测试抓取器，可设置抓取耗时"""
+
+    INCREMENTAL = False
+
+    def __init__(self, name: str, items: List[Dict], delay: float = 0.0):
+        super().__init__(name, 'https://example.com', default_delay=0.0, language='en')
+        self.items = items
+        self.delay = delay
+
+    async def fetch(self) -> List[Dict]:
+        await asyncio.sleep(self.delay)
+        return self.items
+
+    def parse(self, raw_data) -> List[Dict]:
+        return []
+
+
+class FailingFetcher(StaticFetcher):
+    """抓取失败的测试抓取器"""
+
+    async def fetch(self) -> List[Dict]:
+        raise RuntimeError("boom")
+
+
+class CountingFetcher(StaticFetcher):
+    """记录已标准化条目数的测试抓取器"""
+
+    normalized = 0
+
+    def normalize_article(self, article: Dict) -> Dict:
+        self.normalized += 1
+        return super().normalize_article(article)
+
+
+class RecordingFetcher(StaticFetcher):
+    """记录已见条目的测试抓取器"""
+
+    def __init__(self, name: str, items: List[Dict]):
+        super().__init__(name, items)
+        self.seen: List[str] = []
+
+    def mark_seen(self, articles) -> None:
+        self.seen.extend(article.url for article in articles)
+
+
+class FakeDatabase:
+    """记录每批写入的测试数据库，rejected 中的文章写入失败，recent 为已入库的近期文章"""
+
+    def __init__(self):
+        self.batches = []
+        self.rejected = set()
+        self.recent: List[NewsArticle] = []
+        self.recent_queries: List[str] = []
+
+    def get_recent_source_articles(self, source, since, limit=1000):
+        self.recent_queries.append(source)
+        return [article for article in self.recent if article.source == source]
+
+    def write_articles(self, articles, live_sources=()):
+        self.live_sources = set(live_sources)
+        self.batches.append([article.id for article in articles])
+        stored = [article.id for article in articles if article.url not in self.rejected]
+        return stored, len(stored)
+
+
+class FakeClusterer:
+    """不做聚类的测试聚类器"""
+
+    def assign(self, articles):
+        return 0
+
+
+def items(prefix: str, count: int) -> List[Dict]:
+    """构造测试条目（标题互不相似，避免被合并）"""
+    return [
+        {'title': hashlib.md5(f'{prefix}{i}'.encode()).hexdigest(), 'url': f'https://example.com/{prefix}/{i}'}
+        for i in range(count)
+    ]
+
+
+class TestFetchPipeline(unittest.TestCase):
+    """测试标准化、去重、分批入库与流式写入"""
+
+    def setUp(self):
+        self.database = FakeDatabase()
+
+    def _run(self, fetchers, **kwargs):
+        pipeline = FetchPipeline(self.database, FakeClusterer(), **kwargs)
+        return asyncio.run(pipeline.run(fetchers, collect=True))
+
+    def test_normalize_dedupe_and_batch(self):
+        """无效条目被丢弃，同一运行内重复的条目只保留一篇，按批次入库"""
+        fetched = items('a', 5) + items('a', 2) + [{'title': '', 'url': 'https://example.com/x'}]
+        result = self._run([StaticFetcher('A', fetched), FailingFetcher('B', [])], batch_size=2)
+
+        self.assertEqual((result.fetched, result.valid, result.duplicates, result.saved), (8, 7, 2, 5))
+        self.assertEqual([len(batch) for batch in self.database.batches], [2, 2, 1])
+        self.assertEqual(len({article.id for article in result.articles}), 5)
+
+    def test_first_batch_saved_before_slow_source(self):
+        """快的新闻源先入库，不等慢的新闻源抓完"""
+        async def run():
+            pipeline = FetchPipeline(self.database, FakeClusterer(), flush_interval=0.05)
+            slow = StaticFetcher('Slow', items('slow', 3), delay=0.5)
+            fast = StaticFetcher('Fast', items('fast', 3))
+            task = asyncio.create_task(pipeline.run([slow, fast]))
+            await asyncio.sleep(0.3)
+            early = list(self.database.batches)
+            await task
+            return early
+
+        early = asyncio.run(run())
+        self.assertEqual(len(early), 1)
+        self.assertEqual(len(early[0]), 3)
+        self.assertEqual(len(self.database.batches), 2)
+
+    def test_bounded_queue_applies_backpressure(self):
+        """入库较慢时上游阶段被阻塞，不会把所有条目堆进内存"""
+        fetcher = CountingFetcher('A', items('a', 30))
+        in_flight = []
+
+        def slow_save(articles, live_sources=()):
+            in_flight.append(fetcher.normalized - len(self.database.batches))
+            time.sleep(0.005)
+            self.database.batches.append([article.id for article in articles])
+            return [article.id for article in articles], len(articles)
+
+        self.database.write_articles = slow_save
+        self._run([fetcher], batch_size=1, queue_size=2)
+
+        # 队列容量 2 + 正在入库的 1 条 + 等待写入队列的 1 条
+        self.assertLessEqual(max(in_flight), 5)
+        self.assertEqual(len(self.database.batches), 30)
+
+    def test_per_source_metrics(self):
+        """按新闻源记录条目数、耗时和错误"""
+        result = self._run([StaticFetcher('A', items('a', 3), delay=0.05), FailingFetcher('B', [])])
+
+        a, b = result.sources['A'], result.sources['B']
+        self.assertEqual((a.fetched, a.valid, a.saved), (3, 3, 3))
+        self.assertGreaterEqual(a.fetch_seconds, 0.05)
+        self.assertEqual((b.fetched, b.saved, b.error), (0, 0, 'boom'))
+        self.assertEqual(len(result.to_dict()['sources']), 2)
+        # 全量刷新的热榜按新闻源告知数据库，热度变化不作废译文
+        self.assertEqual(self.database.live_sources, {'A'})
+
+    def test_similar_articles_merged_within_source(self):
+        """同一新闻源内的相似新闻合并为一篇，不同新闻源的相似报道各自保留"""
+        def similar(prefix):
+            title = 'Central bank raises interest rates by half a point amid inflation fears'
+            return [
+                {'title': title, 'url': f'https://example.com/{prefix}/1'},
+                {'title': title + '!', 'url': f'https://example.com/{prefix}/2'},
+            ]
+
+        result = self._run([StaticFetcher('A', similar('a')), StaticFetcher('B', similar('b'))])
+
+        self.assertEqual((result.valid, result.merged, result.saved), (4, 2, 2))
+        self.assertEqual({article.source for article in result.articles}, {'A', 'B'})
+
+    def test_failed_rows_not_marked_seen(self):
+        """写入出错的文章不计入入库数量，也不记入已见索引"""
+        fetcher = RecordingFetcher('A', items('a', 3))
+        self.database.rejected = {'https://example.com/a/1'}
+        result = self._run([fetcher])
+
+        self.assertEqual((result.saved, result.failed), (2, 1))
+        self.assertEqual((result.sources['A'].saved, result.sources['A'].failed), (2, 1))
+        self.assertEqual(sorted(fetcher.seen), ['https://example.com/a/0', 'https://example.com/a/2'])
+        self.assertEqual(len(result.articles), 2)
+
+    def test_duplicates_of_stored_articles_dropped(self):
+        """与本源近期已入库新闻重复的条目不再入库，但记入已见索引；后续批次也与本次入库的文章去重"""
+        title = 'Central bank raises interest rates by half a point amid inflation fears'
+        self.database.recent = [NewsArticle(
+            id='stored', title=title, content='', source='A',
+            url='https://example.com/stored', published_at=datetime(2024, 1, 1),
+        )]
+        other = 'Storm knocks out power to thousands of homes along the coast overnight'
+        fetcher = RecordingFetcher('A', [
+            {'title': title + '!', 'url': 'https://example.com/a/1'},
+            {'title': other, 'url': 'https://example.com/a/2'},
+            {'title': other + '.', 'url': 'https://example.com/a/3'},
+        ])
+        result = self._run([fetcher], batch_size=2)
+
+        self.assertEqual([article.url for article in result.articles], ['https://example.com/a/2'])
+        self.assertEqual([len(batch) for batch in self.database.batches], [1, 0])
+        self.assertEqual((result.duplicates, result.merged, result.saved), (2, 0, 1))
+        self.assertEqual(result.sources['A'].duplicates, 2)
+        self.assertEqual(sorted(fetcher.seen), [f'https://example.com/a/{i}' for i in (1, 2, 3)])
+        self.assertEqual(self.database.recent_queries, ['A'])
+
+        # 其他新闻源的相似报道不受影响
+        result = self._run([StaticFetcher('B', [{'title': title, 'url': 'https://example.com/b/1'}])])
+        self.assertEqual((result.duplicates, result.saved), (0, 1))
+
+if __name__ == '__main__':
+    unittest.main()
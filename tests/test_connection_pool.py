@@ -0,0 +1,71 @@
+"""
+SQLite 连接池测试
+"""
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from src.storage.connection_pool import ConnectionPool, get_pool
+
+
+class TestConnectionPool(unittest.TestCase):
+    """测试连接复用、WAL 模式与并发读写"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp_dir.name) / 'test.db'
+        self.pool = ConnectionPool(self.db_path, size=2, timeout=1.0)
+        with self.pool.connection() as conn:
+            conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+
+    def tearDown(self):
+        self.pool.close_all()
+        self.tmp_dir.cleanup()
+
+    def test_connection_reused_with_wal(self):
+        """连接归还后被复用，嵌套借用返回同一连接"""
+        with self.pool.connection() as first:
+            with self.pool.connection() as nested:
+                self.assertIs(first, nested)
+            mode = first.execute("PRAGMA journal_mode").fetchone()[0]
+        with self.pool.connection() as second:
+            self.assertIs(first, second)
+
+        self.assertEqual(mode, 'wal')
+        self.assertIs(get_pool(self.db_path), get_pool(self.db_path))
+
+    def test_reader_not_blocked_by_writer(self):
+        """写事务未提交时其他线程仍可读取已提交的数据"""
+        with self.pool.connection() as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+
+        results = []
+        with self.pool.connection() as writer:
+            writer.execute("INSERT INTO items (name) VALUES ('b')")
+
+            def read():
+                with self.pool.connection() as reader:
+                    results.append(reader.execute("SELECT COUNT(*) FROM items").fetchone()[0])
+
+            thread = threading.Thread(target=read)
+            thread.start()
+            thread.join(timeout=5)
+
+        self.assertEqual(results, [1])
+        with self.pool.connection() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM items").fetchone()[0], 2)
+
+    def test_rollback_on_error(self):
+        """异常时回滚事务并归还连接"""
+        with self.assertRaises(ValueError):
+            with self.pool.connection() as conn:
+                conn.execute("INSERT INTO items (name) VALUES ('x')")
+                raise ValueError()
+
+        with self.pool.connection() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM items").fetchone()[0], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
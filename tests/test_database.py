@@ -0,0 +1,275 @@
+"""
+数据库操作测试
+"""
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from src.storage.database import Database
+from src.storage.search_index import search_index
+from src.storage.models import NewsArticle
+
+
+def _article(article_id: str, **kwargs) -> NewsArticle:
+    data = dict(
+        id=article_id,
+        title=f"标题 {article_id}",
+        content=f"内容 {article_id}",
+        source='test_source',
+        url=f"https://example.com/{article_id}",
+        published_at=datetime.now(),
+    )
+    data.update(kwargs)
+    return NewsArticle(**data)
+
+
+class TestSaveArticles(unittest.TestCase):
+    """测试批量 UPSERT 写入"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db = Database(Path(self.tmp_dir.name) / 'test.db')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_refetch_keeps_translations(self):
+        """重复抓取只更新有变化的列，不会清空已有翻译"""
+        first_fetch = datetime.now() - timedelta(hours=1)
+        original = _article('1', title_zh='中文标题', content_zh='中文内容',
+                            translated=True, fetched_at=first_fetch)
+        self.assertEqual(self.db.save_articles([original, _article('2')]), 2)
+
+        refetched = _article('1', priority=8)
+        self.assertTrue(self.db.save_article(refetched))
+
+        stored = self.db.get_article('1')
+        self.assertEqual(stored.priority, 8)
+        self.assertEqual(stored.title_zh, '中文标题')
+        self.assertEqual(stored.content_zh, '中文内容')
+        self.assertTrue(stored.translated)
+        self.assertEqual(stored.fetched_at, first_fetch)
+        self.assertEqual(self.db.count_articles(), 2)
+
+    def test_changed_title_clears_stale_translation(self):
+        """原文标题变化时旧标题译文作废，文章重新进入翻译队列"""
+        self.db.save_article(_article('1', title_zh='中文标题', title_en='English title',
+                                      content_zh='中文内容', translated=True))
+        self.db.translation_queue.enqueue(['1'])
+        self.db.translation_queue.lease('w1')
+        self.db.translation_queue.complete(['1'], 'w1')
+
+        self.assertTrue(self.db.save_article(_article('1', title='新标题')))
+
+        stored = self.db.get_article('1')
+        self.assertEqual((stored.title, stored.title_zh, stored.title_en), ('新标题', '', ''))
+        self.assertEqual(stored.content_zh, '中文内容')
+        self.assertFalse(stored.translated)
+        self.assertEqual(self.db.translation_queue.stats()['pending'], 1)
+
+    def test_hot_list_heat_change_keeps_translations(self):
+        """热榜文章只有热度变化时更新原文，保留译文，不重新进入翻译队列"""
+        queue = self.db.translation_queue
+        self.db.save_article(_article('1', content='热度: 100', title_zh='标题', title_en='Title',
+                                      content_zh='热度: 100', content_en='Heat: 100', translated=True))
+        queue.enqueue(['1'])
+        queue.lease('w1')
+        queue.complete(['1'], 'w1')
+
+        stored_ids, count = self.db.write_articles([_article('1', content='热度: 200')], {'test_source'})
+        self.assertEqual((stored_ids, count), (['1'], 1))
+
+        stored = self.db.get_article('1')
+        self.assertEqual(stored.content, '热度: 200')
+        self.assertEqual((stored.title_zh, stored.content_en), ('标题', 'Heat: 100'))
+        self.assertTrue(stored.translated)
+        self.assertEqual(queue.stats()['done'], 1)
+
+        # 普通新闻源的内容变化仍会作废译文
+        self.db.save_article(_article('1', content='热度: 300'))
+        self.assertEqual(self.db.get_article('1').content_en, '')
+
+    def test_unchanged_rows_not_counted(self):
+        """内容没有变化的文章不计入写入数量，也不递增写入版本号"""
+        published = datetime(2024, 1, 1)
+        self.assertEqual(self.db.save_articles([_article(i, published_at=published) for i in '12']), 2)
+        version = self.db.get_write_version()
+
+        refetched = [_article('1', published_at=published), _article('2', published_at=published, priority=9)]
+        self.assertEqual(self.db.save_articles(refetched), 1)
+        self.assertEqual(self.db.get_write_version(), version + 1)
+        self.assertEqual(self.db.save_articles(refetched), 0)
+        self.assertEqual(self.db.get_write_version(), version + 1)
+
+    def test_new_translation_overwrites(self):
+        """非空的新翻译会覆盖旧值"""
+        self.db.save_article(_article('1', title_zh='旧翻译'))
+        self.db.save_article(_article('1', title_zh='新翻译'))
+
+        self.assertEqual(self.db.get_article('1').title_zh, '新翻译')
+
+    def test_recent_source_articles(self):
+        """只返回该新闻源在时间窗口内入库的文章"""
+        self.db.save_articles([
+            _article('new'),
+            _article('old', fetched_at=datetime.now() - timedelta(days=3)),
+            _article('other', source='other'),
+        ])
+
+        recent = self.db.get_recent_source_articles('test_source', datetime.now() - timedelta(hours=48))
+        self.assertEqual([a.id for a in recent], ['new'])
+        self.assertEqual((recent[0].title, recent[0].content_zh), ('标题 new', ''))
+
+    def test_row_fallback_keeps_outer_transaction(self):
+        """逐条重试只回滚本次写入，不影响调用方外层事务中的写入"""
+        broken = NewsArticle.model_construct(**{**_article('bad').model_dump(), 'title': None})
+        with self.db._get_connection() as conn:
+            conn.execute("INSERT INTO db_meta (key, value) VALUES ('marker', 1)")
+            self.assertEqual(self.db.save_articles([_article('1'), broken]), 1)
+
+        with self.db._get_connection() as conn:
+            marker = conn.execute("SELECT value FROM db_meta WHERE key = 'marker'").fetchone()
+        self.assertIsNotNone(marker)
+        self.assertIsNotNone(self.db.get_article('1'))
+        self.assertIsNone(self.db.get_article('bad'))
+
+
+class TestArticlesPage(unittest.TestCase):
+    """测试游标分页"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db = Database(Path(self.tmp_dir.name) / 'test.db')
+        now = datetime.now()
+        # 部分文章优先级、发布时间相同，由 id 决定顺序
+        self.db.save_articles([
+            _article(f"{i:02d}", priority=5 + i % 2, published_at=now - timedelta(minutes=i // 3))
+            for i in range(12)
+        ])
+        self.expected = [a.id for a in self.db.get_articles()]
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_forward_and_backward(self):
+        """向后翻页覆盖全部文章且不重复，向前翻页回到上一页"""
+        pages = []
+        articles, prev_cursor, next_cursor = self.db.get_articles_page(5)
+        self.assertIsNone(prev_cursor)
+        pages.append([a.id for a in articles])
+        while next_cursor:
+            articles, prev_cursor, next_cursor = self.db.get_articles_page(5, after=next_cursor)
+            pages.append([a.id for a in articles])
+
+        self.assertEqual([len(p) for p in pages], [5, 5, 2])
+        self.assertEqual(sum(pages, []), self.expected)
+
+        # 从最后一页向前翻
+        articles, prev_cursor, next_cursor = self.db.get_articles_page(5, before=prev_cursor)
+        self.assertEqual([a.id for a in articles], pages[1])
+        self.assertIsNotNone(next_cursor)
+        articles, prev_cursor, _ = self.db.get_articles_page(5, before=prev_cursor)
+        self.assertEqual([a.id for a in articles], pages[0])
+        self.assertIsNone(prev_cursor)
+
+    def test_top_per_source_continues_with_cursor(self):
+        """每个新闻源只取前 N 篇，游标接着取剩余部分"""
+        self.db.save_articles([_article(f"b{i}", source='other') for i in range(2)])
+
+        top = self.db.get_top_articles_per_source(5)
+        self.assertEqual(list(top), ['other', 'test_source'])
+        articles, cursor = top['test_source']
+        self.assertEqual([a.id for a in articles], self.expected[:5])
+        self.assertIsNone(top['other'][1])
+
+        rest, _, _ = self.db.get_articles_page(20, after=cursor, source='test_source')
+        self.assertEqual([a.id for a in rest], self.expected[5:])
+
+    def test_column_projection(self):
+        """指定列时返回只读视图，只包含查询的列"""
+        self.db.save_article(_article('zz', title_zh='中文标题', priority=1))
+        views = self.db.get_articles(columns=('title', 'needs_translation'))
+
+        self.assertEqual([v.id for v in views], [a.id for a in self.db.get_articles()])
+        view = views[-1]
+        self.assertEqual(view.title, '标题 zz')
+        self.assertIsInstance(view.published_at, datetime)
+        self.assertTrue(view.needs_translation)
+        with self.assertRaises(AttributeError):
+            view.content
+        with self.assertRaises(AttributeError):
+            view.title = 'x'
+        with self.assertRaises(ValueError):
+            self.db._select_list(['content; DROP TABLE articles'])
+
+        page, _, _ = self.db.get_articles_page(3, columns=('title',))
+        top = self.db.get_top_articles_per_source(3, columns=('title',))
+        self.assertEqual([v.id for v in page], [v.id for v in top['test_source'][0]])
+
+    def test_count_cache_invalidated_on_write(self):
+        """写入后文章数量缓存失效"""
+        self.assertEqual(self.db.count_articles(), 12)
+        self.db.save_article(_article('new'))
+        self.assertEqual(self.db.count_articles(), 13)
+
+
+class TestSearchArticles(unittest.TestCase):
+    """测试全文搜索"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db = Database(Path(self.tmp_dir.name) / 'test.db')
+        self.db.save_articles([
+            _article('zh', title='人工智能芯片出口管制升级', content='多家厂商受到影响', source='百度'),
+            _article('en', title='Chip export controls tighten', content='Several vendors are affected',
+                     title_zh='芯片出口管制收紧', source='BBC'),
+            _article('other', title='体育新闻', content='比赛结果'),
+        ])
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_cjk_and_english_queries(self):
+        """中文按连续子串匹配，英文按单词匹配，翻译字段同样可搜索"""
+        self.assertEqual({r['article'].id for r in self.db.search_articles('出口管制')}, {'zh', 'en'})
+        self.assertEqual([r['article'].id for r in self.db.search_articles('智能')], ['zh'])
+        self.assertEqual([r['article'].id for r in self.db.search_articles('vendors')], ['en'])
+        self.assertEqual([r['article'].id for r in self.db.search_articles('出口', source='BBC')], ['en'])
+        self.assertEqual(self.db.search_articles('管出'), [])
+        # 用户输入的 FTS5 语法字符被转义
+        self.assertEqual(self.db.search_articles('"chip OR'), [])
+
+        snippet = self.db.search_articles('智能')[0]['snippet']
+        self.assertIn('<mark>智能</mark>', snippet)
+
+    def test_only_changed_documents_reindexed(self):
+        """只有标题、内容、标签（含译文）变化的文章重建索引"""
+        reindexed = []
+        index_articles = search_index.index_articles
+
+        def record(*args, **kwargs):
+            reindexed.append(index_articles(*args, **kwargs))
+            return reindexed[-1]
+
+        with patch.object(search_index, 'index_articles', record):
+            self.db.save_articles([
+                _article('other', title='体育新闻', content='比赛结果', priority=9),
+                _article('zh', title='人工智能芯片出口管制升级', content='多家厂商受到影响', source='百度',
+                         title_en='AI chip export controls'),
+            ])
+        self.assertEqual(reindexed, [1])
+        self.assertEqual([r['article'].id for r in self.db.search_articles('AI')], ['zh'])
+
+    def test_index_follows_updates(self):
+        """更新翻译和删除文章后索引同步"""
+        self.db.save_article(_article('other', title='体育新闻', content='比赛结果', title_en='Sports news'))
+        self.assertEqual([r['article'].id for r in self.db.search_articles('sports')], ['other'])
+
+        self.db.delete_all_articles()
+        self.assertEqual(self.db.search_articles('sports'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
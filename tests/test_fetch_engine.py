@@ -0,0 +1,64 @@
+"""
+异步抓取引擎测试
+"""
+import asyncio
+import time
+import unittest
+
+import httpx
+
+from src.fetchers.engine import FetchEngine, current_engine
+
+
+def _mock_transport(log: list) -> httpx.MockTransport:
+    """记录每个请求的主机和发起时间"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        log.append((request.url.host, time.monotonic()))
+        return httpx.Response(200, text="ok")
+    return httpx.MockTransport(handler)
+
+
+class TestFetchEngine(unittest.TestCase):
+    """测试抓取引擎的并发与按主机限速"""
+
+    def test_host_delay_does_not_block_other_hosts(self):
+        """同一主机按延迟排队，不同主机并行"""
+        log = []
+
+        async def run():
+            async with FetchEngine(transport=_mock_transport(log)) as engine:
+                urls = ['https://a.com/1', 'https://a.com/2', 'https://b.com/1', 'https://b.com/2']
+                await asyncio.gather(*(engine.request('GET', url, delay=0.2) for url in urls))
+
+        start = time.monotonic()
+        asyncio.run(run())
+        elapsed = time.monotonic() - start
+
+        # 两台主机各两次请求，总耗时约为一个延迟而不是三个
+        self.assertLess(elapsed, 0.4)
+        a_times = [t for host, t in log if host == 'a.com']
+        self.assertGreaterEqual(a_times[1] - a_times[0], 0.18)
+
+    def test_engine_context(self):
+        """async with 期间可以获取当前引擎，退出后清空"""
+        async def run():
+            async with FetchEngine(transport=_mock_transport([])) as engine:
+                self.assertIs(current_engine(), engine)
+            self.assertIsNone(current_engine())
+
+        asyncio.run(run())
+
+    def test_error_status_raises(self):
+        """非 2xx 状态码抛出 httpx.HTTPStatusError"""
+        transport = httpx.MockTransport(lambda request: httpx.Response(500))
+
+        async def run():
+            async with FetchEngine(transport=transport) as engine:
+                await engine.request('GET', 'https://a.com/')
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+近似重复索引测试
+"""
+import unittest
+
+from src.utils.near_duplicate import NearDuplicateIndex, shingle_hashes, shingles, tokenize
+
+
+class TestNearDuplicateIndex(unittest.TestCase):
+    """测试 MinHash/LSH 近似重复索引"""
+
+    def test_tokenize_mixed_text(self):
+        """中文逐字、英文按单词切分，忽略标点"""
+        self.assertEqual(tokenize('美联储 Fed 加息!'), ['美', '联', '储', 'fed', '加', '息'])
+        self.assertEqual(shingles('单'), {'单'})
+        self.assertEqual(shingles('!!!'), set())
+
+    def test_shingle_hashes(self):
+        """字符片段取长度 2 和 3（fe、ed、fed），短文本取其本身，规范化后相同的文本哈希相同"""
+        self.assertEqual(len(shingle_hashes('Fed!')), 3)
+        self.assertEqual(len(shingle_hashes('单')), 1)
+        self.assertEqual(len(shingle_hashes('!!!')), 0)
+        self.assertEqual(shingle_hashes('Fed raises').tolist(), shingle_hashes('fed, RAISES!').tolist())
+
+    def test_english_near_duplicate(self):
+        """标点差异的英文标题视为重复"""
+        index = NearDuplicateIndex(threshold=0.7)
+        index.add('a', 'Fed raises interest rates by a quarter point', 'The Federal Reserve raised rates.')
+
+        self.assertEqual(index.query('Fed raises interest rates by a quarter point!', 'The Federal Reserve raised rates'), 'a')
+        self.assertIsNone(index.query('Apple unveils new iPhone lineup', 'Apple held its annual event.'))
+
+    def test_chinese_near_duplicate(self):
+        """中文标题按字切分同样适用"""
+        index = NearDuplicateIndex(threshold=0.7)
+        self.assertIsNone(index.find_or_add(1, '美联储宣布加息25个基点', '美联储周三宣布加息。'))
+
+        self.assertEqual(index.find_or_add(2, '美联储宣布加息25个基点！', '美联储周三宣布加息'), 1)
+        self.assertIsNone(index.find_or_add(3, '国足晋级世界杯决赛圈', '中国男足时隔多年再次晋级。'))
+        self.assertEqual(len(index), 2)
+
+    def test_empty_title_never_matches(self):
+        """空标题不与任何条目重复"""
+        index = NearDuplicateIndex()
+        self.assertIsNone(index.find_or_add(1, '', ''))
+        self.assertIsNone(index.find_or_add(2, '', ''))
+
+
+if __name__ == '__main__':
+    unittest.main()
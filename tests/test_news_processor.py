@@ -118,5 +118,44 @@ class TestNewsProcessor(unittest.TestCase):
         self.assertEqual(len(processed_articles), 2)
 
 
+    def test_drop_existing_duplicates(self):
+        """与已入库新闻重复的新闻被丢弃，同一 ID 的更新保留"""
+        result = news_processor.drop_existing_duplicates(
+            [self.article2, self.article3], [self.article1]
+        )
+        self.assertEqual([a.id for a in result], ["3"])
+
+        result = news_processor.drop_existing_duplicates([self.article1], [self.article1])
+        self.assertEqual([a.id for a in result], ["1"])
+
+    def test_groups_pairs_merged_by_sequence_matcher(self):
+        """原先逐对比较（SequenceMatcher 综合相似度 >= 0.7）会合并的近似重复仍被分到同一组"""
+        pairs = [
+            (("Apple unveils new iPhone 16 lineup at September event",
+              "Apple introduced four new iPhone models at its annual event in Cupertino."),
+             ("Apple unveils iPhone 16 lineup at its September event",
+              "Apple introduced four new iPhone models at its annual event in Cupertino on Monday.")),
+            (("Fed raises interest rates by a quarter point",
+              "The Federal Reserve raised its benchmark rate by 25 basis points on Wednesday."),
+             ("Federal Reserve raises interest rates by a quarter point",
+              "The Federal Reserve raised its benchmark rate by 25 basis points.")),
+            (("美联储宣布加息25个基点", "美联储周三宣布将基准利率上调25个基点，称通胀压力依然存在。"),
+             ("美联储宣布再次加息25个基点", "美联储周三宣布将基准利率再次上调25个基点，称通胀压力依然存在。")),
+            (("华为发布新款Mate手机", "华为在深圳举行发布会，正式推出新款Mate系列手机。"),
+             ("华为正式发布新款Mate系列手机", "华为在深圳举行发布会，推出新款Mate系列手机。")),
+        ]
+        for (title1, content1), (title2, content2) in pairs:
+            with self.subTest(title=title1):
+                old_score = (news_processor.calculate_similarity(title2, title1) * 0.7
+                             + news_processor.calculate_similarity(content2, content1) * 0.3)
+                self.assertGreaterEqual(old_score, 0.7)
+
+                first = NewsArticle(id="a", title=title1, content=content1, source="s",
+                                    url="https://example.com/a", published_at=datetime.now())
+                second = NewsArticle(id="b", title=title2, content=content2, source="s",
+                                     url="https://example.com/b", published_at=datetime.now())
+                self.assertEqual(len(news_processor.group_similar_articles([first, second])), 1)
+
+
 if __name__ == '__main__':
     unittest.main()
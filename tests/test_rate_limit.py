@@ -0,0 +1,95 @@
+"""
+翻译服务限速测试
+"""
+import asyncio
+import threading
+import time
+import unittest
+from typing import Optional
+
+from src.translators.base import BaseTranslator
+from src.translators.rate_limit import TokenBucket
+
+
+class FakeClock:
+    """可手动推进的时钟"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket(unittest.TestCase):
+    """测试令牌桶的预约、补充与暂停"""
+
+    def test_reserve_and_refill(self):
+        """突发用完后按速率排队，经过时间后补充"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+        self.assertEqual([bucket.reserve() for _ in range(4)], [0.0, 0.0, 0.5, 1.0])
+        clock.now = 2.0
+        self.assertEqual(bucket.reserve(), 0.0)
+
+    def test_pause(self):
+        """暂停后所有调用方都要等到暂停结束"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, capacity=5, clock=clock)
+
+        bucket.pause(3)
+        self.assertEqual(bucket.reserve(), 4.0)
+
+    def test_threads_and_coroutines_share_rate(self):
+        """多线程与协程共用一个桶时总速率不超过限制"""
+        bucket = TokenBucket(rate=50, capacity=1)
+        started = time.monotonic()
+
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+
+        async def acquire_many():
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(5)))
+
+        asyncio.run(acquire_many())
+        for thread in threads:
+            thread.join()
+
+        # 10 次请求，首个立即发出，其余每 20ms 一个
+        self.assertGreaterEqual(time.monotonic() - started, 0.17)
+
+
+class LimitedTranslator(BaseTranslator):
+    """限速的测试翻译器"""
+
+    rate_limit = 20.0
+
+    def __init__(self):
+        super().__init__("LimitedForTest")
+        self.calls = 0
+
+    def translate(self, text: str, source_lang: str = "en", target_lang: str = "zh") -> Optional[str]:
+        self.calls += 1
+        return text
+
+
+class TestTranslatorThrottle(unittest.TestCase):
+    """测试翻译器调用自动经过限速"""
+
+    def test_translate_is_throttled(self):
+        """非空文本消耗令牌，空文本不消耗"""
+        translator = LimitedTranslator()
+        started = time.monotonic()
+        for _ in range(6):
+            translator.translate("hello")
+            translator.translate("")
+
+        # 突发 2 个，其余 4 个每 50ms 一个
+        self.assertGreaterEqual(time.monotonic() - started, 0.19)
+        self.assertEqual(translator.calls, 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
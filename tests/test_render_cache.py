@@ -0,0 +1,44 @@
+"""
+页面渲染缓存测试
+"""
+import unittest
+
+from src.utils.render_cache import VersionedCache
+
+
+class TestVersionedCache(unittest.TestCase):
+    """测试按版本号失效与 LRU 淘汰"""
+
+    def test_rebuild_on_version_change(self):
+        """版本号不变时命中缓存，变化后重新生成"""
+        cache = VersionedCache()
+        builds = []
+
+        def build():
+            builds.append(1)
+            return f"page {len(builds)}"
+
+        self.assertEqual(cache.get_or_build('index', 1, build), 'page 1')
+        self.assertEqual(cache.get_or_build('index', 1, build), 'page 1')
+        self.assertEqual(cache.get_or_build('index', 2, build), 'page 2')
+        self.assertEqual(len(builds), 2)
+
+        # 版本号无效时每次都重新生成
+        cache.get_or_build('index', -1, build)
+        cache.get_or_build('index', -1, build)
+        self.assertEqual(len(builds), 4)
+
+    def test_lru_eviction(self):
+        """超出容量时淘汰最久未使用的条目"""
+        cache = VersionedCache(max_entries=2)
+        cache.set('a', 1, 'A')
+        cache.set('b', 1, 'B')
+        cache.get('a', 1)
+        cache.set('c', 1, 'C')
+
+        self.assertEqual(cache.get('a', 1), 'A')
+        self.assertIsNone(cache.get('b', 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
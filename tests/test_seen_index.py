@@ -0,0 +1,61 @@
+"""
+已见条目索引测试
+"""
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.storage.seen_index import SeenIndex
+
+
+class FakeClock:
+    """可手动推进的时钟"""
+
+    def __init__(self):
+        self.now = datetime(2024, 1, 1)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class TestSeenIndex(unittest.TestCase):
+    """测试标记、过期清除与再次见到时的刷新"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp_dir.name) / 'test.db'
+        self.clock = FakeClock()
+        self.index = SeenIndex(self.db_path, retention_days=7, clock=self.clock)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _reloaded(self) -> SeenIndex:
+        return SeenIndex(self.db_path, retention_days=7, clock=self.clock)
+
+    def test_expired_entries_pruned(self):
+        """超过保留天数没再出现的条目在长时间运行的实例中过期，并从内存和数据库中清除"""
+        self.assertEqual(self.index.mark('A', ['https://example.com/1', 'https://example.com/2']), 2)
+        self.clock.now += timedelta(days=6)
+        self.assertEqual(self.index.mark('A', ['https://example.com/2', 'https://example.com/3']), 1)
+
+        self.clock.now += timedelta(days=2)
+        self.assertFalse(self.index.contains('A', 'https://example.com/1'))
+        self.assertTrue(self.index.contains('A', 'https://example.com/2'))
+        self.assertEqual(len(self.index._cache['A']), 2)
+        self.assertFalse(self._reloaded().contains('A', 'https://example.com/1'))
+
+    def test_sighting_refreshes_seen_at(self):
+        """仍在源中出现的条目刷新见到时间，持久化后也不会过期"""
+        self.index.mark('A', ['https://example.com/1'])
+        for _ in range(3):
+            self.clock.now += timedelta(days=5)
+            self.assertTrue(self.index.contains('A', 'https://example.com/1'))
+
+        self.clock.now += timedelta(days=5)
+        self.assertTrue(self._reloaded().contains('A', 'https://example.com/1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
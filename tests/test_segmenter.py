@@ -0,0 +1,100 @@
+"""
+长文本分段测试
+"""
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Optional
+
+from src.storage.translation_memory import TranslationMemory
+from src.translators import TranslatorManager
+from src.translators.base import BaseTranslator
+from src.translators.segmenter import join_translations, split_text, strip_segment
+
+
+class TestSplitText(unittest.TestCase):
+    """测试按句子与段落切分"""
+
+    def test_short_text_unchanged(self):
+        """不超过上限的文本为一段"""
+        self.assertEqual(split_text("Short text.", 100), ["Short text."])
+
+    def test_split_on_sentences(self):
+        """中英文句末标点处切分，各段首尾相接等于原文"""
+        text = "第一句话。第二句话！第三句话？\n\nFirst sentence. Second one! Third?"
+        segments = split_text(text, 16)
+
+        self.assertEqual(''.join(segments), text)
+        self.assertTrue(all(len(segment.strip()) <= 16 for segment in segments))
+        self.assertEqual(segments[:2], ["第一句话。第二句话！第三句话？\n\n", "First sentence. "])
+
+    def test_long_sentence_split_on_commas(self):
+        """超长的句子在逗号或空白处切开，没有切分点时硬切"""
+        text = "甲乙丙丁，戊己庚辛，壬癸子丑。" + "x" * 25
+        segments = split_text(text, 10)
+
+        self.assertEqual(''.join(segments), text)
+        self.assertEqual(segments[0], "甲乙丙丁，戊己庚辛，")
+        self.assertTrue(all(len(segment) <= 10 for segment in segments))
+
+    def test_join_keeps_whitespace(self):
+        """拼接译文时保留段间换行"""
+        segments = split_text("One.\n\nTwo.", 6)
+        translations = [strip_segment(segment)[1].upper() for segment in segments]
+        self.assertEqual(join_translations(segments, translations), "ONE.\n\nTWO.")
+
+
+class SegmentTranslator(BaseTranslator):
+    """单条长度受限的测试翻译器"""
+
+    max_text_chars = 25
+
+    def __init__(self, name: str = "Segment", fail_on: str = ""):
+        super().__init__(name)
+        self.fail_on = fail_on
+        self.requests = []
+
+    def translate(self, text: str, source_lang: str = "en", target_lang: str = "zh") -> Optional[str]:
+        if len(text) > self.max_text_chars:
+            raise ValueError("文本过长")
+        self.requests.append(text)
+        return None if self.fail_on and self.fail_on in text else f"<{text}>"
+
+
+class TestLongContentTranslation(unittest.TestCase):
+    """测试 TranslatorManager 分段翻译长文本"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.memory = TranslationMemory(Path(self.tmp_dir.name) / 'test.db')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_long_text_translated_completely(self):
+        """长文本分段翻译后按原顺序拼回"""
+        translator = SegmentTranslator()
+        manager = TranslatorManager(memory=self.memory, translators=[translator], hedge=False)
+        self.addCleanup(manager.close)
+        text = "First sentence here. Second sentence here.\nThird sentence here. Fourth one."
+
+        result = manager.translate(text)
+        self.assertEqual(
+            result, "<First sentence here.> <Second sentence here.>\n<Third sentence here.> <Fourth one.>"
+        )
+        self.assertEqual(len(translator.requests), 4)
+
+    def test_failed_segment_falls_back(self):
+        """有段落失败时整篇交给下一个翻译器"""
+        flaky = SegmentTranslator("Flaky", fail_on="Second")
+        backup = SegmentTranslator("Backup")
+        manager = TranslatorManager(memory=self.memory, translators=[flaky, backup], hedge=False)
+        self.addCleanup(manager.close)
+
+        result = manager.translate_many([("First sentence here. Second sentence here.", "en", "zh")])[0]
+        self.assertEqual(result, "<First sentence here.> <Second sentence here.>")
+        self.assertEqual(len(backup.requests), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+报道聚类测试
+"""
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from src.storage.database import Database
+from src.storage.models import NewsArticle
+from src.utils.story_clusterer import StoryClusterer
+
+
+def _article(article_id: str, title: str, source: str, priority: int = 1) -> NewsArticle:
+    return NewsArticle(
+        id=article_id,
+        title=title,
+        content='',
+        source=source,
+        url=f"https://example.com/{article_id}",
+        published_at=datetime.now(),
+        priority=priority,
+    )
+
+
+class TestStoryClusterer(unittest.TestCase):
+    """测试增量报道聚类与按报道去重查询"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db = Database(Path(self.tmp_dir.name) / 'test.db')
+        self.clusterer = StoryClusterer(self.db)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_cross_source_articles_share_story(self):
+        """不同来源的同一事件归入同一聚类，不同事件各自成簇"""
+        first = [
+            _article('a1', 'Central bank raises interest rates by half a point to fight inflation', 'Reuters'),
+            _article('a2', '中国队夺得世界杯冠军', '新浪'),
+        ]
+        self.clusterer.assign(first)
+        self.db.save_articles(first)
+
+        # 新批次与已入库文章比较，同批次内也互相比较
+        second = [
+            _article('b1', 'Central bank raises interest rates by half a point to fight inflation again', 'BBC', priority=5),
+            _article('b2', 'New smartphone released with bigger screen', 'TechCrunch'),
+            _article('b3', 'New smartphone released with bigger screen and battery', 'The Verge'),
+        ]
+        joined = self.clusterer.assign(second)
+        self.db.save_articles(second)
+
+        self.assertEqual(joined, 2)
+        self.assertEqual(second[0].story_id, 'a1')
+        self.assertEqual(second[2].story_id, 'b2')
+        self.assertEqual(first[1].story_id, 'a2')
+
+        # 重复抓取的已入库文章沿用原聚类
+        again = _article('b1', 'Central bank raises interest rates', 'BBC')
+        self.clusterer.assign([again])
+        self.assertEqual(again.story_id, 'a1')
+
+        # 每个报道只返回优先级最高的一篇
+        stories = self.db.get_articles(one_per_story=True)
+        ids = {a.id for a in stories}
+        self.assertEqual(len(ids), 3)
+        self.assertIn('b1', ids)
+        self.assertNotIn('a1', ids)
+        self.assertEqual(self.db.count_articles(one_per_story=True), 3)
+        # 代表文章跨新闻源全局选出
+        self.assertEqual(self.db.count_articles(source='Reuters', one_per_story=True), 0)
+        self.assertEqual(self.db.count_articles(source='BBC', one_per_story=True), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+批量翻译测试
+"""
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import patch
+
+from src.storage.models import NewsArticle
+from src.storage.translation_memory import TranslationMemory
+from src.translators import TranslatorManager
+from src.translators.base import BaseTranslator
+from src.translators.google import GoogleTranslator
+from src.translators.openai import OpenAITranslator
+from src.utils.translation_helper import translate_articles
+
+
+class BatchTranslator(BaseTranslator):
+    """记录批量请求的测试翻译器"""
+
+    max_batch_items = 3
+
+    def __init__(self, name: str = "Batch", ok: bool = True):
+        super().__init__(name)
+        self.ok = ok
+        self.batches = []
+
+    def translate(self, text: str, source_lang: str = "en", target_lang: str = "zh") -> Optional[str]:
+        return self.translate_batch([text], source_lang, target_lang)[0]
+
+    def translate_batch(self, texts, source_lang="en", target_lang="zh"):
+        self.batches.append(list(texts))
+        if not self.ok:
+            raise ConnectionError("服务不可用")
+        return [f"{target_lang}:{text}" for text in texts]
+
+
+class TestTranslateMany(unittest.TestCase):
+    """测试 TranslatorManager.translate_many"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.memory = TranslationMemory(Path(self.tmp_dir.name) / 'test.db')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _manager(self, *translators) -> TranslatorManager:
+        return TranslatorManager(memory=self.memory, translators=translators, hedge=False)
+
+    def test_packs_dedupes_and_remembers(self):
+        """去重后按批量上限打包，结果与输入对齐，再次请求命中翻译记忆"""
+        translator = BatchTranslator()
+        manager = self._manager(translator)
+        items = [(f"text {i}", "en", "zh") for i in range(5)] + [("text 0", "en", "zh"), ("", "en", "zh")]
+
+        results = manager.translate_many(items)
+        self.assertEqual(results[:6], [f"zh:text {i}" for i in range(5)] + ["zh:text 0"])
+        self.assertEqual(results[6], "")
+        self.assertEqual([len(batch) for batch in translator.batches], [3, 2])
+
+        manager.translate_many(items)
+        self.assertEqual(len(translator.batches), 2)
+
+    def test_groups_by_language_pair_and_falls_back(self):
+        """不同语言对分开请求，失败的翻译器由下一个接替"""
+        broken, working = BatchTranslator("Broken", ok=False), BatchTranslator("Working")
+        manager = self._manager(broken, working)
+
+        results = manager.translate_many([("hello", "en", "zh"), ("你好", "zh", "en")])
+        self.assertEqual(results, ["zh:hello", "en:你好"])
+        self.assertEqual(len(working.batches), 2)
+
+    def test_mismatched_batch_result_falls_back(self):
+        """批量结果数量与原文不一致时整批按失败处理，由下一个翻译器接替"""
+        short, working = BatchTranslator("Short"), BatchTranslator("Working")
+        short.translate_batch = lambda texts, source_lang="en", target_lang="zh": ["丢失对应关系"]
+        manager = self._manager(short, working)
+
+        self.assertEqual(manager.translate_many([("a", "en", "zh"), ("b", "en", "zh")]), ["zh:a", "zh:b"])
+        self.assertEqual(working.batches, [["a", "b"]])
+
+    def test_translate_articles(self):
+        """中英文文章的缺失字段合并为一次批量请求"""
+        translator = BatchTranslator()
+        translator.max_batch_items = 10
+        articles = [
+            NewsArticle(id="1", title="Title", content="Body", source="BBC", url="u1",
+                        published_at=datetime.now()),
+            NewsArticle(id="2", title="标题", content="正文", source="新华社", language="zh", url="u2",
+                        published_at=datetime.now()),
+        ]
+
+        translate_articles(articles, self._manager(translator))
+        self.assertEqual((articles[0].title_zh, articles[0].content_en), ("zh:Title", "Body"))
+        self.assertEqual((articles[1].title_en, articles[1].content_zh), ("en:标题", "正文"))
+        self.assertTrue(all(article.translated for article in articles))
+        # en->zh 与 zh->en 各一次请求
+        self.assertEqual(len(translator.batches), 2)
+
+
+class TestGoogleBatch(unittest.TestCase):
+    """测试 Google 分隔行打包"""
+
+    def test_split_packed_result(self):
+        """一次请求翻译多段，分隔行被改写时退回逐条翻译"""
+        translator = GoogleTranslator()
+        with patch.object(translator, 'translate', return_value="一\n§§§\n二 \n § § §\n三") as translate:
+            self.assertEqual(translator.translate_batch(["one", "two", "three"]), ["一", "二", "三"])
+            self.assertEqual(translate.call_count, 1)
+
+        with patch.object(translator, 'translate', side_effect=["一二", "一", "二"]) as translate:
+            self.assertEqual(translator.translate_batch(["one", "two"]), ["一", "二"])
+            self.assertEqual(translate.call_count, 3)
+
+
+class FakeCompletions:
+    """按顺序返回预设回复的测试 chat.completions"""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+
+    def create(self, **kwargs):
+        content, finish_reason = self.replies.pop(0)
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason=finish_reason)])
+
+
+class TestOpenAIBatch(unittest.TestCase):
+    """测试 OpenAI JSON 数组批量翻译"""
+
+    def _translator(self, *replies) -> OpenAITranslator:
+        translator = OpenAITranslator()
+        translator.client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions(*replies)))
+        translator.throttle = lambda requests=1: None
+        return translator
+
+    def test_null_element_is_failure(self):
+        """JSON null 等非字符串元素视为该段翻译失败，不会变成字符串 None"""
+        translator = self._translator(('```json\n["一", null, 3]\n```', 'stop'))
+        self.assertEqual(translator.translate_batch(["one", "two", "three"]), ["一", None, None])
+
+    def test_truncated_batch_falls_back(self):
+        """译文被 max_tokens 截断或无法解析时退回逐条翻译"""
+        translator = self._translator(('["一", "二"', 'length'), ('一', 'stop'), ('二', 'stop'))
+        self.assertEqual(translator.translate_batch(["one", "two"]), ["一", "二"])
+
+        translator = self._translator(('["一", "二', 'stop'), ('一', 'stop'), ('二', 'stop'))
+        self.assertEqual(translator.translate_batch(["one", "two"]), ["一", "二"])
+
+
+if __name__ == '__main__':
+    unittest.main()
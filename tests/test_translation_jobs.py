@@ -0,0 +1,124 @@
+"""
+后台翻译工作线程测试
+"""
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from src.storage.database import Database
+from src.storage.models import NewsArticle
+from src.storage.translation_memory import TranslationMemory
+from src.storage.translation_queue import (
+    DONE as QUEUE_DONE, FAILED as QUEUE_FAILED, PENDING as QUEUE_PENDING,
+)
+from src.translators import TranslatorManager
+from src.translators.base import BaseTranslator
+from src.utils.translation_jobs import DONE, FAILED, TranslationJob, TranslationWorkers
+
+
+class EchoTranslator(BaseTranslator):
+    """返回带前缀原文的测试翻译器，含 FAIL 的文本翻译失败"""
+
+    def __init__(self):
+        super().__init__("Echo")
+
+    def translate(self, text: str, source_lang: str = "en", target_lang: str = "zh") -> Optional[str]:
+        return None if "FAIL" in text else f"{target_lang}:{text}"
+
+
+def make_article(index: int, title: str = '') -> NewsArticle:
+    """构造测试文章"""
+    return NewsArticle(
+        id=str(index), title=title or f"Title {index}", content=f"Body {index}",
+        source="BBC", url=f"https://example.com/{index}", published_at=datetime.now(),
+    )
+
+
+class TestTranslationWorkers(unittest.TestCase):
+    """测试保存时入队、工作线程处理与任务进度"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        db_path = Path(self.tmp_dir.name) / 'test.db'
+        self.database = Database(db_path)
+        manager = TranslatorManager(
+            memory=TranslationMemory(db_path), translators=[EchoTranslator()], hedge=False,
+        )
+        self.addCleanup(manager.close)
+        self.workers = TranslationWorkers(self.database, manager, workers=2, batch_size=3, poll_interval=0.05)
+        self.addCleanup(self.workers.stop)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_saved_articles_are_enqueued(self):
+        """新文章保存时入队，工作者处理后写回译文"""
+        self.database.save_articles([make_article(i) for i in range(4)])
+        self.assertEqual(self.database.translation_queue.stats()[QUEUE_PENDING], 4)
+
+        while self.workers.run_once('test'):
+            pass
+
+        self.assertEqual(self.database.translation_queue.stats()[QUEUE_DONE], 4)
+        self.assertEqual(self.database.get_article_by_id('2').title_zh, "zh:Title 2")
+
+    def test_failed_article_retried(self):
+        """翻译失败的文章退避后重新排队"""
+        self.database.save_articles([make_article(0, title="FAIL")])
+
+        self.assertEqual(self.workers.run_once('test'), 1)
+        self.assertEqual(self.workers.run_once('test'), 0)
+        self.assertEqual(self.database.translation_queue.stats()[QUEUE_PENDING], 1)
+
+    def test_missing_content_translation_retried(self):
+        """只有标题译出、正文翻译失败的文章不算完成，补漏时可重新入队"""
+        self.database.save_articles([
+            make_article(0).model_copy(update={'content': "Body FAIL"}),
+            make_article(1).model_copy(update={'content': ''}),
+        ])
+
+        while self.workers.run_once('test'):
+            pass
+
+        queue = self.database.translation_queue
+        self.assertEqual((queue.stats()[QUEUE_PENDING], queue.stats()[QUEUE_DONE]), (1, 1))
+        article = self.database.get_article_by_id('0')
+        self.assertEqual((article.title_zh, article.content_zh), ("zh:Title 0", ''))
+        self.assertEqual([a.id for a in self.database.get_untranslated_articles()], ['0'])
+
+    def test_job_progress(self):
+        """提交任务后后台线程处理，按任务 ID 查询进度"""
+        articles = [make_article(i) for i in range(7)]
+        self.database.save_articles(articles)
+
+        job = self.workers.submit(articles)
+        self.assertEqual(job.total, 7)
+        for _ in range(100):
+            job = self.workers.get(job.id)
+            if job.status == DONE:
+                break
+            time.sleep(0.05)
+
+        self.assertEqual(job.status, DONE)
+        self.assertEqual((job.done, job.failed), (7, 0))
+        self.assertEqual(job.to_dict()['progress'], 1.0)
+
+    def test_job_status_from_counts(self):
+        """部分失败的任务仍算完成，全部失败时任务失败并给出错误信息"""
+        job = TranslationJob.from_counts('j', {QUEUE_DONE: 2, QUEUE_FAILED: 1})
+        self.assertEqual((job.status, job.done, job.failed, job.error), (DONE, 3, 1, ''))
+
+        job = TranslationJob.from_counts('j', {QUEUE_FAILED: 2})
+        self.assertEqual(job.status, FAILED)
+        self.assertTrue(job.error)
+
+    def test_unknown_job(self):
+        """不存在的任务返回 None"""
+        self.assertIsNone(self.workers.get("missing"))
+
+
+if __name__ == '__main__':
+    unittest.main()
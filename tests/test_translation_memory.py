@@ -0,0 +1,68 @@
+"""
+翻译记忆测试
+"""
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Optional
+
+from src.storage.translation_memory import TranslationMemory
+from src.translators import TranslatorManager
+from src.translators.base import BaseTranslator
+from src.translators.health import HealthTracker
+
+
+class CountingTranslator(BaseTranslator):
+    """记录调用次数的测试翻译器"""
+
+    def __init__(self):
+        super().__init__("Counting")
+        self.calls = 0
+
+    def translate(self, text: str, source_lang: str = "en", target_lang: str = "zh") -> Optional[str]:
+        self.calls += 1
+        return f"译文:{text.strip()}"
+
+
+class TestTranslationMemory(unittest.TestCase):
+    """测试翻译记忆的命中、规范化与持久化"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp_dir.name) / 'test.db'
+        self.memory = TranslationMemory(self.db_path, cache_size=2)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_normalized_text_and_language_pair(self):
+        """空白与全半角差异不影响命中，语言对不同则不命中"""
+        self.memory.put("Hello  world", "en", "zh", "你好世界")
+
+        self.assertEqual(self.memory.get(" Hello world\n", "en", "zh"), "你好世界")
+        self.assertEqual(self.memory.get("Ｈｅｌｌｏ world", "en", "zh"), "你好世界")
+        self.assertIsNone(self.memory.get("Hello world", "en", "ja"))
+
+    def test_persisted_beyond_lru(self):
+        """LRU 淘汰后仍可从数据库读取，新实例同样可用"""
+        for i in range(5):
+            self.memory.put(f"text {i}", "en", "zh", f"文本 {i}")
+
+        self.assertEqual(self.memory.get("text 0", "en", "zh"), "文本 0")
+        self.assertEqual(TranslationMemory(self.db_path).get("text 4", "en", "zh"), "文本 4")
+
+    def test_manager_consults_memory_first(self):
+        """重复文本只调用一次翻译服务"""
+        translator = CountingTranslator()
+        manager = TranslatorManager(
+            memory=self.memory, health=HealthTracker(failure_threshold=3, cooldown=60),
+            translators=[translator], hedge=False,
+        )
+
+        self.assertEqual(manager.translate("Breaking news"), "译文:Breaking news")
+        self.assertEqual(manager.translate("Breaking  news "), "译文:Breaking news")
+        self.assertEqual(translator.calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+翻译队列测试
+"""
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.storage.translation_queue import DONE, FAILED, LEASED, PENDING, TranslationQueue
+
+
+class FakeClock:
+    """可手动推进的时钟"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTranslationQueue(unittest.TestCase):
+    """测试入队、租约、重试与任务统计"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.clock = FakeClock()
+        self.queue = TranslationQueue(
+            Path(self.tmp_dir.name) / 'test.db',
+            lease_seconds=60, max_attempts=2, retry_delay=10, clock=self.clock,
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_enqueue_is_idempotent(self):
+        """重复入队不会产生重复条目"""
+        self.assertEqual(self.queue.enqueue(['a', 'b', 'a']), 2)
+        self.assertEqual(self.queue.enqueue(['a', 'c']), 1)
+        self.assertEqual(self.queue.stats()[PENDING], 3)
+
+    def test_lease_is_exclusive(self):
+        """已领取的文章在租约期内不会被其他工作者领取，过期后可重新领取"""
+        self.queue.enqueue(['a', 'b', 'c'])
+
+        first = self.queue.lease('w1', limit=2)
+        second = self.queue.lease('w2', limit=2)
+        self.assertEqual(len(first), 2)
+        self.assertEqual(second, sorted({'a', 'b', 'c'} - set(first)))
+        self.assertEqual(self.queue.lease('w3'), [])
+
+        self.clock.now += 61
+        self.assertEqual(sorted(self.queue.lease('w3')), ['a', 'b', 'c'])
+
+    def test_retry_with_backoff_then_fail(self):
+        """失败后退避重试，尝试次数用尽后放弃"""
+        self.queue.enqueue(['a'])
+        self.queue.lease('w1')
+        self.assertEqual(self.queue.retry('a', 'w1', 'boom'), PENDING)
+
+        self.assertEqual(self.queue.lease('w1'), [])
+        self.clock.now += 10
+        self.assertEqual(self.queue.lease('w1'), ['a'])
+        self.assertEqual(self.queue.retry('a', 'w1', 'boom'), FAILED)
+        self.assertEqual(self.queue.stats()[FAILED], 1)
+
+    def test_claim_respects_active_lease(self):
+        """单篇即时翻译不能抢占工作者的有效租约"""
+        self.queue.enqueue(['a'])
+        self.queue.lease('worker')
+
+        self.assertFalse(self.queue.claim('a', 'api'))
+        self.assertTrue(self.queue.claim('b', 'api'))
+        self.queue.complete(['a'], 'worker')
+        self.assertTrue(self.queue.claim('a', 'api'))
+
+    def test_job_requeues_finished_articles(self):
+        """带任务 ID 入队时已完成的文章重新排队，按任务统计进度"""
+        self.queue.enqueue(['a', 'b'])
+        self.queue.lease('w1')
+        self.queue.complete(['a'], 'w1')
+
+        self.queue.enqueue(['a', 'b'], job_id='job1')
+        self.assertEqual(self.queue.job_counts('job1'), {LEASED: 1, PENDING: 1})
+        self.queue.complete(['b'], 'w1')
+        self.assertEqual(self.queue.job_counts('job1'), {DONE: 1, PENDING: 1})
+        self.assertEqual(self.queue.job_counts('missing'), {})
+
+    def test_expired_lease_taken_over(self):
+        """租约过期被他人接手后，原领取者的完成与重试被跳过"""
+        self.queue.enqueue(['a', 'b'])
+        self.queue.lease('w1')
+        self.clock.now += 61
+        self.assertEqual(sorted(self.queue.lease('w2')), ['a', 'b'])
+
+        self.assertEqual(self.queue.complete(['a'], 'w1'), 0)
+        self.assertIsNone(self.queue.retry('b', 'w1', 'boom'))
+        self.assertEqual(self.queue.stats()[LEASED], 2)
+
+        self.assertEqual(self.queue.complete(['a'], 'w2'), 1)
+        self.assertEqual(self.queue.retry('b', 'w2', 'boom'), FAILED)
+        self.assertEqual(self.queue.stats()[DONE], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,199 @@
+"""
+翻译器健康跟踪与熔断测试
+"""
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from typing import Optional
+
+from src.storage.translation_memory import TranslationMemory
+from src.translators import TranslatorManager
+from src.translators.base import BaseTranslator
+from src.translators.health import CLOSED, HALF_OPEN, OPEN, HealthTracker, RouteStats
+
+
+class FakeClock:
+    """可手动推进的时钟"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class ScriptedTranslator(BaseTranslator):
+    """按设定成功或失败的测试翻译器"""
+
+    def __init__(self, name: str, ok: bool = True):
+        super().__init__(name)
+        self.ok = ok
+        self.calls = 0
+
+    def translate(self, text: str, source_lang: str = "en", target_lang: str = "zh") -> Optional[str]:
+        self.calls += 1
+        if not self.ok:
+            raise ConnectionError("服务不可用")
+        return f"{self.name}:{text}"
+
+    def is_available(self) -> bool:
+        raise AssertionError("不应主动探测翻译器")
+
+
+class BlockingTranslator(ScriptedTranslator):
+    """在 release 之前一直阻塞的测试翻译器"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.release = threading.Event()
+
+    def translate(self, text: str, source_lang: str = "en", target_lang: str = "zh") -> Optional[str]:
+        self.release.wait(5)
+        return super().translate(text, source_lang, target_lang)
+
+
+class TestHealthTracker(unittest.TestCase):
+    """测试熔断器状态转换"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.tracker = HealthTracker(failure_threshold=2, cooldown=30, clock=self.clock)
+
+    def test_opens_after_consecutive_failures(self):
+        """连续失败达到阈值后熔断，成功会重置计数"""
+        self.tracker.record_failure("A", 0.1)
+        self.tracker.record_success("A", 0.1)
+        self.tracker.record_failure("A", 0.1)
+        self.assertTrue(self.tracker.allow("A"))
+
+        self.tracker.record_failure("A", 0.1)
+        self.assertFalse(self.tracker.allow("A"))
+        self.assertEqual(self.tracker.snapshot(["A"])[0]['state'], OPEN)
+
+    def test_half_open_allows_single_probe(self):
+        """冷却结束后只放行一次探测，探测结果决定恢复或重新熔断"""
+        self.tracker.record_failure("A", 0.1)
+        self.tracker.record_failure("A", 0.1)
+
+        self.clock.now = 31
+        self.assertTrue(self.tracker.available("A"))
+        self.assertTrue(self.tracker.allow("A"))
+        self.assertFalse(self.tracker.allow("A"))
+        self.assertEqual(self.tracker.snapshot(["A"])[0]['state'], HALF_OPEN)
+
+        self.tracker.record_failure("A", 0.1)
+        self.assertFalse(self.tracker.allow("A"))
+
+        self.clock.now = 62
+        self.assertTrue(self.tracker.allow("A"))
+        self.tracker.record_success("A", 0.1)
+        self.assertEqual(self.tracker.snapshot(["A"])[0]['state'], CLOSED)
+
+    def test_route_stats_p95(self):
+        """样本不足时不估算 p95，耗时波动越大 p95 越高"""
+        stats = RouteStats()
+        for latency in (0.1, 0.3, 0.1, 0.3):
+            stats.record(latency, ok=True)
+        self.assertIsNone(stats.p95)
+
+        stats.record(0.1, ok=True)
+        self.assertGreater(stats.p95, stats.latency)
+        stats.record(5.0, ok=False)
+        self.assertLess(stats.latency, 0.3)
+        self.assertGreater(stats.error_rate, 0)
+
+    def test_rank_prefers_healthy(self):
+        """熔断中的排在最后，其余保持配置顺序"""
+        self.tracker.record_failure("A", 0.1)
+        self.tracker.record_failure("A", 0.1)
+        self.assertEqual(self.tracker.rank(["A", "B", "C"]), ["B", "C", "A"])
+
+
+class TestManagerHealth(unittest.TestCase):
+    """测试翻译器管理器按健康状况选择翻译器"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.clock = FakeClock()
+        self.broken = ScriptedTranslator("Broken", ok=False)
+        self.working = ScriptedTranslator("Working")
+        self.manager = TranslatorManager(
+            memory=TranslationMemory(Path(self.tmp_dir.name) / 'test.db'),
+            health=HealthTracker(failure_threshold=2, cooldown=30, clock=self.clock),
+            translators=[self.broken, self.working],
+            hedge=False,
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_get_translator_without_probing(self):
+        """选择翻译器不发起任何请求"""
+        self.assertIs(self.manager.get_translator(), self.broken)
+        self.assertEqual(self.broken.calls, 0)
+
+    def test_failing_translator_demoted(self):
+        """失败过的翻译器排到后面，后续请求直接使用健康的翻译器"""
+        for i in range(4):
+            self.assertEqual(self.manager.translate(f"text {i}"), f"Working:text {i}")
+        self.assertEqual(self.broken.calls, 1)
+        self.assertIs(self.manager.get_translator(), self.working)
+        self.assertEqual(self.manager.health_snapshot()[0]['name'], "Working")
+
+    def test_open_translator_skipped_until_cooldown(self):
+        """熔断后不再调用失败的翻译器，冷却结束后再探测一次"""
+        self.working.ok = False
+        for i in range(3):
+            self.assertIsNone(self.manager.translate(f"text {i}"))
+        self.assertEqual((self.broken.calls, self.working.calls), (2, 2))
+        self.assertIsNone(self.manager.get_translator())
+
+        self.clock.now = 31
+        self.working.ok = True
+        self.assertEqual(self.manager.translate("text 3"), "Working:text 3")
+        self.assertIs(self.manager.get_translator(), self.working)
+
+
+class TestLatencyRouting(unittest.TestCase):
+    """测试按耗时选择翻译器与对冲请求"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.memory = TranslationMemory(Path(self.tmp_dir.name) / 'test.db')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_routes_to_fastest(self):
+        """每个翻译器先试用一次，之后使用该语言对上最快的翻译器"""
+        slow, fast = ScriptedTranslator("Slow"), ScriptedTranslator("Fast")
+        slow_translate = slow.translate
+        slow.translate = lambda *args: (time.sleep(0.05), slow_translate(*args))[1]
+        manager = TranslatorManager(memory=self.memory, translators=[slow, fast], hedge=False)
+
+        for i in range(5):
+            manager.translate(f"text {i}")
+        self.assertEqual((slow.calls, fast.calls), (1, 4))
+        self.assertIs(manager.get_translator(), fast)
+        # 其他语言对没有统计，仍按配置顺序
+        self.assertIs(manager.get_translator("ja", "zh"), slow)
+
+    def test_hedged_request_takes_first_answer(self):
+        """首选翻译器超过 p95 未返回时同时请求下一个，采用先返回的结果"""
+        stuck, backup = BlockingTranslator("Stuck"), ScriptedTranslator("Backup")
+        health = HealthTracker(failure_threshold=2, cooldown=30)
+        health.hedge_delay = lambda name, pair: 0.05
+        manager = TranslatorManager(memory=self.memory, health=health, translators=[stuck, backup], hedge=True)
+        self.addCleanup(manager.close)
+        self.addCleanup(stuck.release.set)
+
+        started = time.monotonic()
+        self.assertEqual(manager.translate("hello"), "Backup:hello")
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertEqual(backup.calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()